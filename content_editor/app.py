@@ -1,12 +1,25 @@
 from __future__ import annotations
 import importlib
+import traceback
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tkinter.font as tkfont
 
 # repo & ayarlar
-from services.repository import Repository
+from services.repository import Repository, snapshot
+from services.save_pipeline import EntityResult, SaveJob, run_save
 from settings import autodetect_content_root
+from services.asset_refs import plan_gc, apply_gc, format_bytes
+from services.asset_manifest import write_manifest
+from services.sprites import build_sprites
+from services.task_runtime import TaskRuntime, set_default_runtime
+from services.write_behind import WriteBehind
+from services.quick_index import QuickIndex
+from services.tag_trie import TagVocabulary
+from services.tag_refs import TagRefIndex
+from widgets.link_check_dialog import LinkCheckDialog
+from widgets.quick_switcher import QuickSwitcher
+from widgets.tag_refs_dialog import TagRefsDialog
 
 # sekmeler
 from tabs.info_tab import InfoTab
@@ -16,6 +29,7 @@ from tabs.competitions_tab import CompetitionsTab
 from tabs.projects_tab import ProjectsTab
 from tabs.certificates_tab import CertificatesTab
 from tabs.courses_tab import CoursesTab          # (varsa; teknik dersler sekmesi)
+from tabs.list_tab import ListEntityTab
 
 class EditorApp(tk.Tk):
     def __init__(self):
@@ -26,8 +40,28 @@ class EditorApp(tk.Tk):
         # ---- Tema / Stil ----
         self._init_theme()
 
+        # Ortak arka plan işleri (tüm sekmeler): sonuçlar after() ile Tk thread'ine döner
+        self.tasks = TaskRuntime(self)
+        set_default_runtime(self.tasks)
+
         # Repository (içerik kökü otomatik tespit)
         self.repo = Repository(autodetect_content_root())
+        # Liste sekmelerindeki anlık kayıtlar (Add/Delete/Up/Down) arka planda, birleştirilerek yazılır
+        self.writer = WriteBehind(self.tasks, self.repo, on_error=self._on_write_error)
+        # Her kayıttan sonra assets.json'u (boyut/hash manifest) güncelle.
+        # Kayıt worker thread'inde olabilir -> dinleyici Tk thread'ine aktarılır.
+        self._after_id_manifest = None
+        self._manifest_job = None
+        self._manifest_dirty = False
+        self.repo.add_save_listener(lambda name: self.tasks.post(self._on_entity_saved, name))
+        # Ctrl+P hızlı geçiş, etiket otomatik tamamlama, stack referans indeksi:
+        # load'da arka planda kurulur, kayıttan sonra farkla güncellenir
+        self.quick = QuickIndex()
+        self.tags = TagVocabulary()
+        self.refs = TagRefIndex()
+        self._index_job = None
+        self._switcher = None       # açık Ctrl+P paleti (indeks kurulunca tazelenir)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Üst bar: Content Root + butonlar
         top_bar = ttk.Frame(self, padding=(10, 8))
@@ -62,6 +96,15 @@ class EditorApp(tk.Tk):
         self.lbl_save_all_ok = ttk.Label(btns, text="", style="Ok.TLabel", width=12, anchor="w")
         self.lbl_save_all_ok.pack(side="left")
 
+        # kayıt sürerken görünür
+        self.pb_save = ttk.Progressbar(btns, mode="determinate", length=160)
+        self._save_job = None
+        self._save_names = []                 # Save All hattının yazdığı entity'ler
+
+        ttk.Button(btns, text="Clean Assets…", command=self.clean_assets).pack(side="right")
+        ttk.Button(btns, text="Check Links…", command=self.check_links).pack(side="right", padx=6)
+        ttk.Button(btns, text="Tags…", command=lambda: TagRefsDialog(self, self)).pack(side="right")
+
         ttk.Separator(self).pack(fill="x")
 
         # Sekmeler
@@ -100,6 +143,11 @@ class EditorApp(tk.Tk):
         self.bind_all("<Control-s>", lambda e: self.save_current_tab())
         self.bind_all("<Control-S>", lambda e: self.save_current_tab())
         self.bind_all("<Control-Shift-s>", lambda e: self.save_all())
+        self.bind_all("<Control-p>", lambda e: self.open_quick_switcher())
+        self.bind_all("<Control-P>", lambda e: self.open_quick_switcher())
+        self.bind_all("<Control-z>", lambda e: self._undo_current(e, redo=False))
+        self.bind_all("<Control-y>", lambda e: self._undo_current(e, redo=True))
+        self.bind_all("<Control-Z>", lambda e: self._undo_current(e, redo=True))    # Ctrl+Shift+Z
 
     # -------------------- THEME --------------------
     def _init_theme(self):
@@ -185,6 +233,8 @@ class EditorApp(tk.Tk):
         s.theme_use("portfolio-dark" if self.dark_var.get() else "portfolio-light")
 
     def _apply_content_root(self):
+        # bekleyen arka plan kayıtları eski köke yazılsın
+        self.writer.flush()
         try:
             self.repo.set_content_root(self.path_var.get())
         except Exception as e:
@@ -213,57 +263,290 @@ class EditorApp(tk.Tk):
                 tab.load()
             except Exception as e:
                 messagebox.showwarning("Load", f"Failed to load '{name}':\n{e}")
+        self._rebuild_indexes()
 
-    def save_current_tab(self):
-        self._apply_content_root()
+    def _current_tab(self):
         current_id = self.nb.select()
-        current_tab = None
         for t in self.tabs.values():
             if str(t) == current_id:
-                current_tab = t
-                break
+                return t
+        return None
+
+    def save_current_tab(self):
+        current_tab = self._current_tab()
         if current_tab is None:
             return
-        ok = self._save_tab(current_tab)
-        if ok:
-            self._flash_ok(self.lbl_save_current_ok, which="current", text="Saved ✓")
+        self._save_tabs([current_tab], self.lbl_save_current_ok, which="current")
 
     def save_all(self):
+        self._save_tabs(list(self.tabs.values()), self.lbl_save_all_ok, which="all")
+
+    def _save_tabs(self, tabs, label: ttk.Label, which: str):
+        """
+        Form durumu burada (Tk thread'inde) okunur; görsel kopyaları ve JSON yazımı arka planda,
+        önce hepsi hazırlanıp sonra yerine konarak yapılır (bkz. services/save_pipeline.py).
+        Hat sürerken aynı entity'lerin write-behind yazımları bekletilir (WriteBehind.hold).
+        """
+        if self._save_job is not None:
+            return
         self._apply_content_root()
-        all_ok = True
-        for tab in self.tabs.values():
-            ok = self._save_tab(tab)
-            all_ok = all_ok and ok
-        if all_ok:
-            self._flash_ok(self.lbl_save_all_ok, which="all", text="Saved ✓")
-
-    def _save_tab(self, tab) -> bool:
+        jobs, results = [], []
+        for tab in tabs:
+            name = getattr(tab, "entity_name", None) or "?"
+            try:
+                job = self._plan_tab_save(tab)
+            except Exception as e:
+                traceback.print_exc()
+                results.append(EntityResult(name, False, f"{type(e).__name__}: {e}"))
+                continue
+            if job is not None:
+                jobs.append(job)
+        if not jobs:
+            self._report_save(results, label, which)
+            return
+
+        # hat bu entity'leri yazarken write-behind bekler; aradaki düzenlemeler sonra (daha yeni) yazılır
+        self._save_names = [j.name for j in jobs]
+        self.writer.hold(self._save_names)
+
+        self.pb_save.configure(value=0, maximum=2 * len(jobs))
+        self.pb_save.pack(side="left", padx=6, after=self.lbl_save_all_ok)
+        self.btn_save_all.state(["disabled"])
+        self.btn_save_current.state(["disabled"])
+
+        def finished(res):
+            self._end_save()
+            by_name = {j.name: j for j in jobs}
+            for r in res:
+                cb = by_name[r.name].on_saved
+                if r.ok and cb:
+                    cb()
+            self._report_save(results + res, label, which)
+
+        def failed(e):
+            self._end_save()
+            messagebox.showerror("Save", f"Save failed:\n{e}")
+
+        self._save_job = self.tasks.run_thread(
+            lambda ctx: run_save(self.repo, jobs, ctx.progress),
+            on_done=finished, on_error=failed, on_cancel=self._end_save,
+            on_progress=lambda done, _total, _name: self.pb_save.configure(value=done),
+            title="Save")
+
+    def _plan_tab_save(self, tab):
+        name = getattr(tab, "entity_name", None)
+        if not name:
+            return None
+        if hasattr(tab, "plan_save"):
+            return tab.plan_save()
+
+        data = None
+        if hasattr(tab, "serialize"):
+            try:
+                data = tab.serialize()
+            except NotImplementedError:
+                data = getattr(tab, "data", None)
+        elif hasattr(tab, "data"):
+            data = tab.data
+        if data is None:
+            return None
+        return SaveJob(name, snapshot(data), on_saved=tab.update_target_path)
+
+    def _end_save(self):
+        self._save_job = None
+        self.writer.release(self._save_names)
+        self._save_names = []
+        self.pb_save.pack_forget()
+        self.btn_save_all.state(["!disabled"])
+        self.btn_save_current.state(["!disabled"])
+
+    def _report_save(self, results, label: ttk.Label, which: str):
+        failed = [r for r in results if not r.ok]
+        if not failed:
+            if results:
+                self._flash_ok(label, which=which, text="Saved ✓")
+            return
+        lines = [f"✓ {r.name}" if r.ok else f"✗ {r.name}: {r.error}" for r in results]
+        messagebox.showwarning(
+            "Save",
+            f"{len(failed)} of {len(results)} could not be saved; their files were left unchanged.\n\n"
+            + "\n".join(lines))
+
+    def _on_entity_saved(self, name: str):
+        tab = self.tabs.get(name)
+        if self._index_job is None and isinstance(tab, ListEntityTab):
+            self.sync_indexes(name)
+        # Save All art arda birkaç kayıt yapar; manifest'i bir kez, boşta üret
+        if self._after_id_manifest is None:
+            self._after_id_manifest = self.after_idle(self._refresh_asset_manifest)
+
+    def _refresh_asset_manifest(self):
+        self._after_id_manifest = None
+        if self._manifest_job is not None:
+            # üretim sürüyor; bitince bir tur daha
+            self._manifest_dirty = True
+            return
+
+        def work(_ctx):
+            write_manifest(self.repo)
+            build_sprites(self.repo)     # logo/ikon değişmediyse dokunmaz
+
+        def finished(*_):
+            self._manifest_job = None
+            if self._manifest_dirty:
+                self._manifest_dirty = False
+                self._refresh_asset_manifest()
+
+        self._manifest_job = self.tasks.run_thread(
+            work, on_done=finished, on_error=finished, on_cancel=finished, title="Asset manifest")
+
+    # -------------------- INDEXES / QUICK SWITCHER --------------------
+    def _list_tabs(self):
+        return {n: t for n, t in self.tabs.items() if isinstance(t, ListEntityTab)}
+
+    def _rebuild_indexes(self):
+        if self._index_job is not None:
+            self._index_job.cancel()
+        lists = {n: list(t.data) for n, t in self._list_tabs().items()}
+
+        def build(ctx):
+            quick, tags, refs = QuickIndex(), TagVocabulary(), TagRefIndex()
+            for n, recs in lists.items():
+                ctx.check()
+                quick.set_entity(n, recs)
+                tags.set_entity(n, recs)
+                refs.set_entity(n, recs)
+            return quick, tags, refs
+
+        def done(result):
+            self._index_job = None
+            self.quick, self.tags, self.refs = result
+            # kurulum sürerken yapılan değişiklikler: fark uygulanır
+            for n in self._list_tabs():
+                self.sync_indexes(n)
+            self._refresh_switcher()
+
+        def failed(_e=None):
+            self._index_job = None
+            self._refresh_switcher()
+
+        self._index_job = self.tasks.run_thread(build, on_done=done, on_error=failed, on_cancel=failed,
+                                                title="Content indexes")
+
+    def index_busy(self) -> bool:
+        return self._index_job is not None
+
+    def sync_indexes(self, name: str):
+        """Sekmenin güncel listesini indekslere uygula (sadece kimliği değişen kayıtlar)."""
+        tab = self.tabs.get(name)
+        if not isinstance(tab, ListEntityTab):
+            return
+        for idx in (self.quick, self.tags, self.refs):
+            idx.set_entity(name, tab.data)
+
+    def rename_tag(self, old: str, new: str) -> dict:
+        """Stack adını tüm entity'lerde yeniden adlandır / birleştir; entity -> değişen kayıt sayısı."""
+        # refs yazım bitince güncellenir; son düzenlemeler (write-behind bekliyor) plana girsin,
+        # yoksa değişiklik eski kaydın id'siyle anahtarlanır ve replace_records onu bulamaz
+        for n in self._list_tabs():
+            self.sync_indexes(n)
+        done = {}
+        for entity, changes in self.refs.plan_rename(old, new).items():
+            tab = self.tabs.get(entity)
+            if not isinstance(tab, ListEntityTab):
+                continue
+            n = tab.replace_records(changes)      # entity başına tek kayıt
+            if n:
+                done[entity] = n
+            self.sync_indexes(entity)
+        return done
+
+    def tag_completer(self, kind: str):
+        """CommaListEntry.set_completer için (indeks yeniden kurulunca da güncel olanı kullanır)."""
+        return lambda prefix, existing=(): self.tags.complete(kind, prefix, exclude=existing)
+
+    def _switcher_status(self) -> str:
+        return "indexing…" if self._index_job is not None else f"{len(self.quick):,} records"
+
+    def open_quick_switcher(self):
+        titles = {n: self.nb.tab(t, "text") for n, t in self._list_tabs().items()}
+        # indeks nesnesi değil getter: kurulum sürerken açılan palet boş yer tutucuda kalmasın
+        self._switcher = QuickSwitcher(self, lambda: self.quick, self._jump_to, titles,
+                                       self._switcher_status)
+        return "break"
+
+    def _refresh_switcher(self):
+        sw, self._switcher = self._switcher, None
+        if sw is not None and sw.winfo_exists():
+            sw.refresh()
+            self._switcher = sw
+
+    def _undo_current(self, event, redo: bool):
+        """
+        Ctrl+Z / Ctrl+Y: açık liste sekmesinin geçmişi. Metin alanlarında (form, arama kutusu) ve
+        başka pencerelerde (Ctrl+P, Tags…) kısayol o widget'a bırakılır; liste değişmez.
+        """
+        w = event.widget
+        if isinstance(w, (tk.Text, tk.Entry, tk.Spinbox, ttk.Entry)):     # ttk.Combobox da ttk.Entry
+            return None
         try:
-            name = getattr(tab, "entity_name", None)
-            if not name:
-                return False
-
-            data = None
-            if hasattr(tab, "serialize"):
-                try:
-                    data = tab.serialize()
-                except NotImplementedError:
-                    data = getattr(tab, "data", None)
-            elif hasattr(tab, "data"):
-                data = tab.data
-            if data is None:
-                return False
-
-            self.repo.save(name, data)
-            tab.update_target_path()
-            return True
+            if w.winfo_toplevel() is not self:
+                return None
+        except (AttributeError, tk.TclError):
+            return None     # widget adı çözülemedi (ör. kapanmakta olan pencere)
+        tab = self._current_tab()
+        if isinstance(tab, ListEntityTab):
+            tab.redo() if redo else tab.undo()
+        return "break"
+
+    def _jump_to(self, entity: str, rec):
+        tab = self.tabs.get(entity)
+        if tab is None:
+            return
+        self.nb.select(tab)
+        tab.reveal_record(rec)
+
+    def _on_write_error(self, name: str, exc: BaseException):
+        messagebox.showerror("Save", f"Failed to save '{name}' in background:\n{exc}")
 
+    def _on_close(self):
+        try:
+            self.writer.flush()
         except Exception as e:
-            import traceback
-            tb = traceback.format_exc()
-            messagebox.showerror("Save",
-                f"Failed to save '{getattr(tab, 'entity_name', '?')}'\n\n{e}\n\n{tb}")
-            return False
+            if not messagebox.askyesno("Save", f"Unsaved changes could not be written:\n{e}\n\nQuit anyway?"):
+                return
+        self.tasks.shutdown()
+        self.destroy()
+
+    def clean_assets(self):
+        """Hiçbir JSON'un kullanmadığı görselleri (yeniden adlandırma artıkları) listeler ve onayla siler."""
+        self._apply_content_root()
+        self.tasks.run_thread(lambda _ctx: plan_gc(self.repo), on_done=self._confirm_clean_assets,
+                              on_error=lambda e: messagebox.showerror("Clean Assets", str(e)),
+                              title="Clean Assets")
+
+    def _confirm_clean_assets(self, plan):
+        if not plan.orphans:
+            messagebox.showinfo("Clean Assets", f"No orphaned files ({plan.scanned} scanned).")
+            return
+        listing = "\n".join(list(plan.orphans)[:20])
+        if len(plan.orphans) > 20:
+            listing += f"\n… (+{len(plan.orphans) - 20} more)"
+        if not messagebox.askyesno(
+            "Clean Assets",
+            f"{len(plan.orphans)} orphaned files, {format_bytes(plan.reclaimable_bytes)} reclaimable:\n\n"
+            f"{listing}\n\nDelete them?"):
+            return
+
+        def done(result):
+            removed, freed = result
+            messagebox.showinfo("Clean Assets", f"Removed {len(removed)} files, freed {format_bytes(freed)}.")
+        self.tasks.run_thread(lambda _ctx: apply_gc(plan), on_done=done, title="Clean Assets")
+
+    def check_links(self):
+        """Tüm bağlantıları (sertifika, proje, sosyal, stack ...) arka planda kontrol eden panel."""
+        self._apply_content_root()
+        LinkCheckDialog(self, self.repo)
 
     def _try_mount_stack_tab(self):
         try:
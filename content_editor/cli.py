@@ -0,0 +1,321 @@
+"""
+Editör için komut satırı araçları (GUI açmadan).
+
+    python cli.py gc            # yetim görselleri listele (dry-run)
+    python cli.py gc --apply    # yetim görselleri sil
+    python cli.py manifest      # public/content/assets.json üret
+    python cli.py dupes         # kopya / neredeyse-kopya görseller (pHash)
+    python cli.py vendor        # uzak logo/görselleri public/images/vendor altına indir
+    python cli.py svgmin        # SVG logo/ikonları küçült (artımlı)
+    python cli.py sprites       # stack logoları + sosyal ikonlar için atlas / <symbol> sprite
+    python cli.py recompress    # images/ altını kayıpsız yeniden sıkıştır (devam ettirilebilir)
+    python cli.py links         # kırık bağlantıları bul (sonuçlar TTL ile önbellekte)
+    python cli.py tags          # stack.json'da olmayan stack referansları
+    python cli.py near-dupes    # yeniden girilmiş (neredeyse aynı) sertifika / yarışma ... kayıtları
+    python cli.py tags --rename Tensorflow TensorFlow --apply   # tüm entity'lerde yeniden adlandır
+    python cli.py bench list    # büyük listede Treeview / sanal liste ölçümü (100k kayıt)
+    python cli.py bench quick   # Ctrl+P hızlı geçiş indeksi: kurulum ve sorgu gecikmesi
+    python cli.py bench dupes   # kopya kayıt tespiti (bloklama) süresi ve yakalama oranı
+    python cli.py bench undo    # geri al geçmişi: liste boyundan bağımsız düzenleme başına bellek
+"""
+from __future__ import annotations
+import argparse
+import sys
+
+from services.repository import Repository
+from services.asset_refs import ReferenceIndex, plan_gc, apply_gc, format_bytes
+from services.asset_manifest import write_manifest, manifest_path
+from services.perceptual_hash import PerceptualIndex, DEFAULT_THRESHOLD, hamming
+from services.vendor_assets import vendor_assets, Downloader
+from services.link_checker import LinkChecker, ResultCache, check_repo_links, record_label, OK_TTL, FAIL_TTL
+from services.sprites import build_sprites
+from services.recompress import NO_JPEGTRAN, recompress_tree
+from services.svg_optimize import optimize_tree, DEFAULT_PRECISION
+from services.tag_refs import TagRefIndex, REF_FIELDS, DEFINING_ENTITY, apply_changes
+from services.near_dupes import DUPE_FIELDS, DEFAULT_THRESHOLD as DUPE_THRESHOLD, find_duplicates
+from services import benchmarks
+from settings import CACHE_DIR, content_to_public_dir
+
+
+def cmd_gc(repo: Repository, args) -> int:
+    index = ReferenceIndex.build(repo)
+    plan = plan_gc(repo, index)
+
+    for rel, size in plan.orphans.items():
+        print(f"  orphan  {format_bytes(size):>9}  {rel}")
+    for rel in plan.missing:
+        users = ", ".join(f"{r.entity}[{r.index}].{r.field}" if r.index is not None else f"{r.entity}.{r.field}"
+                          for r in index.users_of(rel))
+        print(f"  missing            {rel}  ({users})")
+
+    print(f"{plan.scanned} files scanned, {len(index)} referenced, "
+          f"{len(plan.orphans)} orphaned ({format_bytes(plan.reclaimable_bytes)} reclaimable)")
+
+    if args.apply and plan.orphans:
+        removed, freed = apply_gc(plan)
+        print(f"Removed {len(removed)} files, freed {format_bytes(freed)}")
+    elif plan.orphans:
+        print("Dry-run: pass --apply to delete.")
+    return 0
+
+
+def cmd_manifest(repo: Repository, args) -> int:
+    manifest, changed = write_manifest(repo)
+    n = len(manifest["assets"])
+    state = "written" if changed else "unchanged"
+    print(f"{manifest_path(repo.content_root)}: {n} assets ({state})")
+    return 0
+
+
+def cmd_dupes(repo: Repository, args) -> int:
+    index = PerceptualIndex(content_to_public_dir(repo.content_root)).build()
+    refs = ReferenceIndex.build(repo)
+    groups = index.duplicate_groups(args.threshold)
+    for g in groups:
+        print(f"- {len(g)} similar images:")
+        base = index.hashes[g[0]][0]
+        for rel in g:
+            used = "" if rel in refs else "  (unreferenced)"
+            print(f"    d={hamming(base, index.hashes[rel][0]):2d}  {rel}{used}")
+    print(f"{len(index.hashes)} images hashed, {len(groups)} duplicate groups "
+          f"(threshold {args.threshold}/1024 bits)")
+    return 0
+
+
+def cmd_vendor(repo: Repository, args) -> int:
+    report = vendor_assets(repo, refresh=args.refresh, dry_run=args.dry_run,
+                           downloader=Downloader(max_workers=args.workers, retries=args.retries))
+    for label, url, rel in report.vendored:
+        print(f"  {'would vendor' if args.dry_run else 'vendored'}  {label}: {url} -> {rel}")
+    for rel, url in report.refreshed:
+        print(f"  refreshed  {rel} <- {url}")
+    for label, url, err in report.failed:
+        print(f"  FAILED  {label}: {url} ({err})")
+    if report.saved_entities:
+        print("Saved: " + ", ".join(report.saved_entities))
+    verb = "to vendor" if args.dry_run else "vendored"
+    print(f"{len(report.vendored)} {verb}, {len(report.refreshed)} refreshed, {len(report.failed)} failed")
+    return 1 if report.failed else 0
+
+
+def cmd_svgmin(repo: Repository, args) -> int:
+    results = optimize_tree(content_to_public_dir(repo.content_root), dry_run=args.dry_run,
+                            precision=args.precision)
+    for r in results:
+        note = " (cached)" if r.cached else ""
+        print(f"  {format_bytes(r.before):>9} -> {format_bytes(r.after):>9}  "
+              f"-{format_bytes(r.saved):>9}  {r.rel}{note}")
+    before = sum(r.before for r in results)
+    saved = sum(r.saved for r in results)
+    fresh = sum(1 for r in results if not r.cached)
+    verb = "would save" if args.dry_run else "saved"
+    print(f"{len(results)} SVG files ({fresh} processed), {verb} {format_bytes(saved)} "
+          f"of {format_bytes(before)}")
+    return 0
+
+
+def cmd_sprites(repo: Repository, args) -> int:
+    res = build_sprites(repo, force=args.force)
+    state = "written" if res.changed else "unchanged"
+    print(f"{res.map_path}: {res.rasters} rasters in {res.atlases} atlases, "
+          f"{res.symbols} SVG symbols ({state})")
+    return 0
+
+
+def cmd_recompress(repo: Repository, args) -> int:
+    def progress(done, total):
+        print(f"\r  {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    report = recompress_tree(repo, subdir=args.dir, webp=args.webp, max_workers=args.workers,
+                             progress=progress)
+    print(file=sys.stderr)
+    for r in report.results:
+        if r["error"]:
+            print(f"  FAILED  {r['rel']}: {r['error']}")
+        elif r["new_rel"]:
+            print(f"  {r['rel']} -> {r['new_rel']}")
+    total_before = total_after = 0
+    for d, s in report.by_directory().items():
+        total_before += s.before
+        total_after += s.after
+        print(f"  {d:<40} {s.changed:>3}/{s.files:<3} files  {format_bytes(s.before):>9} -> "
+              f"{format_bytes(s.after):>9}  (-{format_bytes(s.saved)})")
+    print(f"{len(report.results)} files ({report.resumed} already done), "
+          f"saved {format_bytes(total_before - total_after)} of {format_bytes(total_before)}")
+    skipped = sum(1 for r in report.results if r["kind"] == NO_JPEGTRAN)
+    if skipped:
+        print(f"{skipped} JPEG(s) left as is: install jpegtran (libjpeg-turbo) for lossless JPEG optimisation")
+    if report.saved_entities:
+        print("References updated: " + ", ".join(report.saved_entities))
+    return 1 if any(r["error"] for r in report.results) else 0
+
+
+def cmd_links(repo: Repository, args) -> int:
+    cache = ResultCache(CACHE_DIR / "links.json", ok_ttl=args.ttl * 3600, fail_ttl=min(FAIL_TTL, args.ttl * 3600))
+    checker = LinkChecker(cache, per_host=args.per_host, host_delay=args.delay, max_workers=args.workers)
+    rows = check_repo_links(repo, force=args.force, checker=checker)
+    broken = 0
+    for ref, res in rows:
+        if res.ok and not args.all:
+            continue
+        broken += not res.ok
+        where = f"{ref.entity}[{ref.index}]" if ref.index is not None else ref.entity
+        status = res.status if res.status is not None else "ERR"
+        extra = f" -> {res.final_url}" if res.final_url else ""
+        extra += f" ({res.error})" if res.error else ""
+        print(f"  {'ok' if res.ok else 'BROKEN':6} {status!s:>3}  {where}.{ref.field}  {ref.label}: {ref.url}{extra}")
+    if args.all:
+        broken = sum(1 for _r, res in rows if not res.ok)
+    print(f"{len(rows)} links ({len({r.url for r, _ in rows})} unique), {broken} broken")
+    return 1 if broken else 0
+
+
+def cmd_tags(repo: Repository, args) -> int:
+    data = {name: repo.load(name) or [] for name in [DEFINING_ENTITY, *REF_FIELDS]}
+    refs = TagRefIndex()
+    for name, recs in data.items():
+        refs.set_entity(name, recs if isinstance(recs, list) else [])
+
+    if args.rename:
+        old, new = args.rename
+        plan = refs.plan_rename(old, new)
+        if not plan:
+            print(f"'{old}' is not referenced anywhere")
+            return 0
+        for name, changes in plan.items():
+            dropped = sum(1 for v in changes.values() if v is None)
+            print(f"  {name}: {len(changes) - dropped} record(s) updated"
+                  + (f", {dropped} duplicate stack entry removed" if dropped else ""))
+            if args.apply:
+                repo.save(name, apply_changes(data[name], changes))     # dosya başına tek kayıt
+        print("applied" if args.apply else "(dry run; pass --apply to write)")
+        return 0
+
+    rows = refs.tags() if args.all else refs.unknown()
+    for t in rows:
+        where = sorted({ent for ent, _r, _f in refs.refs_of(t.key)})
+        spell = ", ".join(sorted(t.spellings)) if len(t.spellings) > 1 else ""
+        print(f"  {'ok' if t.defined else 'UNKNOWN':7} {t.uses:4}  {t.name}"
+              + (f"  [{', '.join(where)}]" if where else "") + (f"  spellings: {spell}" if spell else ""))
+    unknown = sum(1 for t in rows if not t.defined)
+    print(f"{len(refs.tags())} tags, {unknown} referenced but missing from stack.json")
+    return 1 if unknown else 0
+
+
+def cmd_near_dupes(repo: Repository, args) -> int:
+    total = 0
+    for name in args.entity or list(DUPE_FIELDS):
+        recs = repo.load(name) or []
+        if not isinstance(recs, list):
+            continue
+        pairs = find_duplicates(name, recs, args.threshold)
+        total += len(pairs)
+        for i, j, score in pairs:
+            print(f"  {score:5.0%}  {name}[{i}] {record_label(recs[i])!r}  ~  {name}[{j}] {record_label(recs[j])!r}")
+    print(f"{total} likely duplicate pair(s)")
+    return 1 if total else 0
+
+
+def cmd_bench(repo: Repository, args) -> int:
+    rows = []
+    if args.target == "list":
+        rows += benchmarks.bench_list_model(args.records)
+        modes = ("virtual", "tree") if args.mode == "both" else (args.mode,)
+        try:
+            rows += benchmarks.bench_list(args.records, modes=modes)
+        except RuntimeError as e:
+            print(f"  (skipped widget timings: {e})", file=sys.stderr)
+    elif args.target == "quick":
+        rows += benchmarks.bench_quick(args.records)
+    elif args.target == "dupes":
+        rows += benchmarks.bench_near_dupes(args.records)
+    elif args.target == "undo":
+        rows += benchmarks.bench_undo(args.records)
+    width = max(len(label) for label, _v in rows)
+    for label, value in rows:
+        print(f"  {label:<{width}}  {value:>12}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="cli.py", description="Portfolio content tools")
+    p.add_argument("--content-root", default=None,
+                   help="frontend/public/content (default: autodetect)")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    gc = sub.add_parser("gc", help="find/delete images no JSON references")
+    gc.add_argument("--apply", action="store_true", help="actually delete orphaned files")
+    gc.set_defaults(func=cmd_gc)
+
+    mf = sub.add_parser("manifest", help="write content/assets.json (size/hash/mime per image)")
+    mf.set_defaults(func=cmd_manifest)
+
+    dp = sub.add_parser("dupes", help="report duplicate / near-duplicate images (perceptual hash)")
+    dp.add_argument("--threshold", type=int, default=DEFAULT_THRESHOLD,
+                    help="max differing pHash bits out of 1024 (default: %(default)s)")
+    dp.set_defaults(func=cmd_dupes)
+
+    vd = sub.add_parser("vendor", help="download remote logos/images into public/ and rewrite references")
+    vd.add_argument("--dry-run", action="store_true", help="only list what would be downloaded")
+    vd.add_argument("--refresh", action="store_true", help="re-check already vendored files against their source URL")
+    vd.add_argument("--workers", type=int, default=8)
+    vd.add_argument("--retries", type=int, default=3)
+    vd.set_defaults(func=cmd_vendor)
+
+    sv = sub.add_parser("svgmin", help="minify SVG logos/icons in place (metadata, editor data, precision, unused defs)")
+    sv.add_argument("--dry-run", action="store_true", help="only report the savings")
+    sv.add_argument("--precision", type=int, default=DEFAULT_PRECISION, help="decimal places kept in coordinates")
+    sv.set_defaults(func=cmd_svgmin)
+
+    sp = sub.add_parser("sprites", help="pack stack logos and social icons into atlases / an SVG symbol sprite")
+    sp.add_argument("--force", action="store_true", help="rebuild even if no logo changed")
+    sp.set_defaults(func=cmd_sprites)
+
+    rc = sub.add_parser("recompress", help="losslessly re-encode existing images, keeping only smaller results")
+    rc.add_argument("--dir", default="images", help="folder under public/ (default: %(default)s)")
+    rc.add_argument("--webp", action="store_true", help="also try lossless WebP for PNGs (renames files, updates JSON)")
+    rc.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    rc.set_defaults(func=cmd_recompress)
+
+    lk = sub.add_parser("links", help="check credential/project/social/stack links for broken URLs")
+    lk.add_argument("--all", action="store_true", help="also list working links")
+    lk.add_argument("--force", action="store_true", help="ignore cached results")
+    lk.add_argument("--ttl", type=float, default=OK_TTL / 3600, help="hours a cached OK result stays valid")
+    lk.add_argument("--per-host", type=int, default=2, help="concurrent requests per host")
+    lk.add_argument("--delay", type=float, default=0.25, help="min seconds between requests to one host")
+    lk.add_argument("--workers", type=int, default=16)
+    lk.set_defaults(func=cmd_links)
+
+    tg = sub.add_parser("tags", help="stack name references across entities; rename/merge")
+    tg.add_argument("--all", action="store_true", help="list every tag, not only unknown ones")
+    tg.add_argument("--rename", nargs=2, metavar=("OLD", "NEW"), help="rename or merge a stack name everywhere")
+    tg.add_argument("--apply", action="store_true", help="write the rename (default: dry run)")
+    tg.set_defaults(func=cmd_tags)
+
+    nd = sub.add_parser("near-dupes", help="records that look re-entered (similar name, same issuer or month)")
+    nd.add_argument("--entity", action="append", choices=list(DUPE_FIELDS),
+                    help="limit to an entity (repeatable; default: all)")
+    nd.add_argument("--threshold", type=float, default=DUPE_THRESHOLD,
+                    help="name similarity 0-1 (default: %(default)s)")
+    nd.set_defaults(func=cmd_near_dupes)
+
+    bn = sub.add_parser("bench", help="time editor operations on large synthetic data")
+    bn.add_argument("target", choices=["list", "quick", "dupes", "undo"],
+                    help="list: list tab views, search index, sorting; quick: Ctrl+P switcher index; "
+                         "dupes: near-duplicate record detection; undo: undo history memory per edit")
+    bn.add_argument("--records", type=int, default=100_000)
+    bn.add_argument("--mode", choices=["virtual", "tree", "both"], default="both",
+                    help="list view(s) to time (default: %(default)s)")
+    bn.set_defaults(func=cmd_bench)
+
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    repo = Repository(args.content_root)
+    return args.func(repo, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Hareketli görseller (GIF / APNG / animasyonlu WebP) için dönüştürme.
+
+Image.open(...).convert("RGBA").save(PNG) animasyonu sessizce ilk kareye indirir. Bunun yerine:
+
+- kareler tam (birleştirilmiş) RGBA olarak okunur, ardışık aynı kareler tek kareye indirilip
+  süreleri toplanır
+- tüm kareler için tek ortak palet çıkarılır (kare başına palet yerine) -> kayıpsız WebP'nin
+  color-indexing dönüşümü devreye girer, kareler arası renk titremesi olmaz
+- paletli kayıpsız ve kayıplı (q=80) animasyonlu WebP denenir, küçük olan yazılır
+- kapak için ilk kareden sabit bir poster (PNG) üretilebilir
+
+Sadece Pillow kullanılır. Pillow'da animasyonlu WebP desteği yoksa optimize edilmiş GIF yazılır.
+"""
+from __future__ import annotations
+import io
+from pathlib import Path
+from typing import List, Tuple
+
+from PIL import Image, ImageSequence, features
+
+# Pillow < 11'de animasyonlu WebP ayrı bir özellik; yenilerde WebP modülüyle birlikte gelir
+WEBP_ANIM_OK = features.check_module("webp") and (
+    "webp_anim" not in features.features or features.check_feature("webp_anim"))
+LOSSY_QUALITY = 80
+PALETTE_SAMPLE = 12       # ortak palet için örneklenen kare sayısı
+
+
+def is_animated(path: str) -> bool:
+    try:
+        with Image.open(path) as im:
+            return getattr(im, "is_animated", False) and getattr(im, "n_frames", 1) > 1
+    except Exception:
+        return False
+
+
+def read_frames(im: Image.Image) -> Tuple[List[Image.Image], List[int]]:
+    """Birleştirilmiş RGBA kareler + süreler (ms); ardışık aynı kareler birleştirilir."""
+    frames: List[Image.Image] = []
+    durations: List[int] = []
+    last = None
+    for fr in ImageSequence.Iterator(im):
+        rgba = fr.convert("RGBA")
+        dur = int(fr.info.get("duration", im.info.get("duration", 100)) or 100)
+        data = rgba.tobytes()
+        if last is not None and data == last:
+            durations[-1] += dur
+            continue
+        frames.append(rgba)
+        durations.append(dur)
+        last = data
+    return frames, durations
+
+
+def shared_palette(frames: List[Image.Image]) -> Image.Image:
+    """Karelerden örneklenmiş tek bir 256 renklik palet (P modlu görsel olarak)."""
+    step = max(1, len(frames) // PALETTE_SAMPLE)
+    sample = frames[::step][:PALETTE_SAMPLE]
+    sheet = Image.new("RGB", (max(f.width for f in sample), sum(f.height for f in sample)))
+    y = 0
+    for f in sample:
+        sheet.paste(f.convert("RGB"), (0, y))
+        y += f.height
+    return sheet.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+
+
+def palettize(frames: List[Image.Image], pal: Image.Image) -> List[Image.Image]:
+    out = []
+    for f in frames:
+        alpha = f.getchannel("A")
+        q = f.convert("RGB").quantize(palette=pal, dither=Image.Dither.NONE).convert("RGBA")
+        q.putalpha(alpha)
+        out.append(q)
+    return out
+
+
+def _save_webp(frames, durations, loop: int, **kw) -> bytes:
+    buf = io.BytesIO()
+    frames[0].save(buf, format="WEBP", save_all=True, append_images=frames[1:],
+                   duration=durations, loop=loop, method=6, **kw)
+    return buf.getvalue()
+
+
+def _save_gif(frames, durations, loop: int) -> bytes:
+    buf = io.BytesIO()
+    frames[0].save(buf, format="GIF", save_all=True, append_images=frames[1:],
+                   duration=durations, loop=loop, optimize=True, disposal=2)
+    return buf.getvalue()
+
+
+def encode_animation(src: str) -> Tuple[bytes, str]:
+    """
+    (veri, uzantı). Normalde '.webp'; WebP animasyon desteği yoksa '.gif'. Kaynak GIF/WebP zaten
+    daha küçükse olduğu gibi döner.
+    """
+    original = Path(src).read_bytes()
+    src_ext = Path(src).suffix.lower()
+    with Image.open(src) as im:
+        loop = int(im.info.get("loop", 0))
+        frames, durations = read_frames(im)
+    if len(frames) == 1:
+        # tüm kareler aynıymış: durağan görsel
+        buf = io.BytesIO()
+        frames[0].save(buf, format="PNG", optimize=True)
+        return buf.getvalue(), ".png"
+    pal_frames = palettize(frames, shared_palette(frames))
+    if WEBP_ANIM_OK:
+        candidates = [
+            (_save_webp(pal_frames, durations, loop, lossless=True, quality=100), ".webp"),
+            (_save_webp(frames, durations, loop, quality=LOSSY_QUALITY, allow_mixed=True), ".webp"),
+        ]
+        if src_ext == ".webp":
+            candidates.append((original, ".webp"))
+    else:
+        candidates = [(_save_gif(pal_frames, durations, loop), ".gif")]
+        if src_ext == ".gif":
+            candidates.append((original, ".gif"))
+    return min(candidates, key=lambda c: len(c[0]))
+
+
+def write_animation(src: str, dst_stem: str | Path) -> Path:
+    """src animasyonunu dst_stem + uygun uzantı olarak yazar; yazılan yolu döner."""
+    data, ext = encode_animation(src)
+    dst = Path(str(dst_stem) + ext)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_suffix(ext + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(dst)
+    return dst
+
+
+def write_poster(src: str, dst: str | Path) -> Path:
+    """İlk kareden sabit PNG poster."""
+    dst = Path(dst)
+    with Image.open(src) as im:
+        im.seek(0)
+        im.convert("RGBA").save(dst, format="PNG", optimize=True)
+    return dst
@@ -0,0 +1,158 @@
+"""
+public/content/assets.json üretimi.
+
+Frontend'in görselleri yüklemeden önce boyutlarını bilmesi (layout shift olmaması) için
+içerikte referans verilen her görselin width/height/bytes/hash/mime bilgisi:
+
+    {"version": 1, "assets": {"images/projects_tab/X_1.png":
+        {"width": 1280, "height": 720, "bytes": 48213, "hash": "<sha256>", "mime": "image/png",
+         "placeholder": "data:image/webp;base64,...", "avg_color": "#..", "dominant_color": "#.."}}}
+
+Dosya başına değerler StatCache ile saklanır; (size, mtime_ns) değişmeyen dosya tekrar açılmaz.
+Placeholder/renkler (image_analysis) yalnızca değişen dosyalar için, toplu ve paralel hesaplanır.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from settings import CACHE_DIR, content_to_public_dir
+from services.asset_refs import ReferenceIndex
+from services.stat_cache import StatCache
+from services.image_analysis import analyze_many
+
+try:
+    from PIL import Image
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+
+MANIFEST_NAME = "assets.json"
+MANIFEST_VERSION = 1
+
+_EXTRA_MIME = {".svg": "image/svg+xml", ".webp": "image/webp", ".ico": "image/x-icon"}
+
+
+def guess_mime(path: str) -> str:
+    ext = Path(path).suffix.lower()
+    return _EXTRA_MIME.get(ext) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def _file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+_SVG_ATTR = re.compile(r'\b(width|height|viewBox)\s*=\s*["\']([^"\']*)["\']')
+
+
+def _svg_size(path: str) -> Tuple[Optional[int], Optional[int]]:
+    """<svg width/height> (px/sayı) yoksa viewBox'tan boyut çıkarır."""
+    with open(path, "rb") as f:
+        head = f.read(4096).decode("utf-8", "ignore")
+    m = re.search(r"<svg\b[^>]*>", head, re.S)
+    if not m:
+        return None, None
+    attrs = dict(_SVG_ATTR.findall(m.group(0)))
+
+    def num(v):
+        mm = re.match(r"\s*([0-9.]+)\s*(px)?\s*$", v or "")
+        return int(round(float(mm.group(1)))) if mm else None
+
+    w, h = num(attrs.get("width")), num(attrs.get("height"))
+    if (w is None or h is None) and attrs.get("viewBox"):
+        parts = re.split(r"[\s,]+", attrs["viewBox"].strip())
+        if len(parts) == 4:
+            try:
+                w, h = int(round(float(parts[2]))), int(round(float(parts[3])))
+            except ValueError:
+                pass
+    return w, h
+
+
+def image_size(path: str) -> Tuple[Optional[int], Optional[int]]:
+    if path.lower().endswith(".svg"):
+        return _svg_size(path)
+    if not PIL_OK:
+        return None, None
+    try:
+        with Image.open(path) as im:   # sadece header okunur
+            return im.size
+    except Exception:
+        return None, None
+
+
+def describe_file(path: str) -> Dict[str, Any]:
+    w, h = image_size(path)
+    return {
+        "width": w,
+        "height": h,
+        "bytes": Path(path).stat().st_size,
+        "hash": _file_sha256(path),
+        "mime": guess_mime(path),
+    }
+
+
+def manifest_path(content_root: str | Path) -> Path:
+    return Path(content_root) / MANIFEST_NAME
+
+
+def build_manifest(repo, index: ReferenceIndex | None = None,
+                   cache: StatCache | None = None) -> Dict[str, Any]:
+    index = index or ReferenceIndex.build(repo)
+    cache = cache or StatCache(CACHE_DIR / "asset_stats.json")
+    public_dir = content_to_public_dir(repo.content_root)
+
+    assets: Dict[str, Any] = {}
+    misses: Dict[str, os.stat_result] = {}
+    for rel in index.paths():
+        try:
+            st = os.stat(public_dir / rel)
+        except OSError:
+            continue
+        hit = cache.lookup(rel, st)
+        if hit is not None:
+            assets[rel] = hit
+        else:
+            misses[rel] = st
+
+    # değişen/yeni dosyalar: önce header+hash, sonra placeholder/renk analizi toplu halde
+    analyzed = analyze_many([str(public_dir / rel) for rel in misses])
+    for rel, st in misses.items():
+        abs_path = str(public_dir / rel)
+        info = describe_file(abs_path)
+        info.update(analyzed.get(abs_path, {}))
+        cache.store(rel, st, info)
+        assets[rel] = info
+
+    cache.prune(assets)
+    cache.save()
+    return {"version": MANIFEST_VERSION, "assets": assets}
+
+
+def write_manifest(repo, index: ReferenceIndex | None = None,
+                   cache: StatCache | None = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    assets.json'u yeniden üretir; içerik değişmediyse dosyaya dokunmaz
+    (vite dev server gereksiz yere reload etmesin). (manifest, yazıldı_mı) döner.
+    """
+    manifest = build_manifest(repo, index, cache)
+    p = manifest_path(repo.content_root)
+    text = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+    try:
+        if p.read_text(encoding="utf-8") == text:
+            return manifest, False
+    except FileNotFoundError:
+        pass
+    tmp = p.with_suffix(".json.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(p)
+    return manifest, True
@@ -0,0 +1,195 @@
+from __future__ import annotations
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from settings import ENTITY_NAMES, ASSET_SUBDIRS, content_to_public_dir
+
+
+# public/ göreli önekler: "images/", "content/stack_logos/"
+ASSET_PREFIXES = tuple(p.as_posix() + "/" for p in ASSET_SUBDIRS)
+
+
+def normalize_ref(value: str) -> str:
+    """JSON'daki yol değerini public/ göreli posix biçimine çevirir."""
+    return (value or "").strip().replace("\\", "/").lstrip("/")
+
+
+def is_asset_ref(value: Any) -> bool:
+    return isinstance(value, str) and normalize_ref(value).startswith(ASSET_PREFIXES)
+
+
+def iter_strings(data: Any, path: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    JSON ağacındaki tüm string değerleri (alan_yolu, değer) olarak gezer.
+    Alan yolu: "images[2]", "profile_photo.path", "links.github" ...
+    """
+    if isinstance(data, str):
+        yield path, data
+    elif isinstance(data, dict):
+        for k, v in data.items():
+            yield from iter_strings(v, f"{path}.{k}" if path else str(k))
+    elif isinstance(data, list):
+        for i, v in enumerate(data):
+            yield from iter_strings(v, f"{path}[{i}]")
+
+
+@dataclass(frozen=True)
+class AssetRef:
+    entity: str
+    index: int | None   # liste entity'lerinde kayıt sırası; info için None
+    field: str          # "images[0]", "icon", "logo_path", "profile_photo.path" ...
+
+
+class ReferenceIndex:
+    """
+    Görsel yolu -> onu kullanan (entity, kayıt, alan) listesi.
+    Tüm entity JSON'larındaki "images/..." ve "content/stack_logos/..." değerlerinden kurulur
+    (images, icon, logo_path, profile_photo.path, university_logo.path, photos[...] ...).
+    """
+
+    def __init__(self):
+        self.refs: Dict[str, List[AssetRef]] = {}
+
+    @classmethod
+    def from_entities(cls, entities: Dict[str, Any]) -> "ReferenceIndex":
+        idx = cls()
+        for name, data in entities.items():
+            idx.add_entity(name, data)
+        return idx
+
+    @classmethod
+    def build(cls, repo) -> "ReferenceIndex":
+        entities: Dict[str, Any] = {}
+        for name in ENTITY_NAMES:
+            try:
+                entities[name] = repo.load(name)
+            except Exception:
+                entities[name] = None
+        return cls.from_entities(entities)
+
+    def add_entity(self, name: str, data: Any):
+        if isinstance(data, list):
+            for i, rec in enumerate(data):
+                self._add_record(name, i, rec)
+        elif data is not None:
+            self._add_record(name, None, data)
+
+    def _add_record(self, name: str, index: int | None, rec: Any):
+        for fpath, value in iter_strings(rec):
+            if is_asset_ref(value):
+                self.refs.setdefault(normalize_ref(value), []).append(AssetRef(name, index, fpath))
+
+    def __contains__(self, rel: str) -> bool:
+        return normalize_ref(rel) in self.refs
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def paths(self) -> List[str]:
+        return sorted(self.refs)
+
+    def users_of(self, rel: str) -> List[AssetRef]:
+        return list(self.refs.get(normalize_ref(rel), []))
+
+
+def scan_assets(public_dir: str | Path) -> Dict[str, int]:
+    """public/ altındaki yönetilen görsel klasörlerini tarar: rel_path -> byte."""
+    public_dir = Path(public_dir)
+    out: Dict[str, int] = {}
+    stack = [public_dir / sub for sub in ASSET_SUBDIRS]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(Path(e.path))
+                elif e.is_file(follow_symlinks=False):
+                    rel = Path(e.path).relative_to(public_dir).as_posix()
+                    out[rel] = e.stat(follow_symlinks=False).st_size
+    return out
+
+
+@dataclass
+class GcPlan:
+    public_dir: Path
+    orphans: Dict[str, int] = field(default_factory=dict)   # rel_path -> byte
+    missing: List[str] = field(default_factory=list)        # JSON'da var, diskte yok
+    scanned: int = 0
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        return sum(self.orphans.values())
+
+
+def plan_gc(repo, index: ReferenceIndex | None = None) -> GcPlan:
+    """Dry-run: hiçbir JSON'un referans vermediği görselleri bulur (silmez)."""
+    index = index or ReferenceIndex.build(repo)
+    public_dir = content_to_public_dir(repo.content_root)
+    on_disk = scan_assets(public_dir)
+    plan = GcPlan(public_dir=public_dir, scanned=len(on_disk))
+    plan.orphans = {rel: size for rel, size in sorted(on_disk.items()) if rel not in index.refs}
+    plan.missing = [rel for rel in index.paths() if rel not in on_disk]
+    return plan
+
+
+def apply_gc(plan: GcPlan) -> Tuple[List[str], int]:
+    """Plandaki yetim dosyaları siler. (silinenler, geri kazanılan byte) döner."""
+    removed: List[str] = []
+    freed = 0
+    for rel, size in plan.orphans.items():
+        p = plan.public_dir / rel
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(rel)
+        freed += size
+    return removed, freed
+
+
+def _replace_refs(data: Any, renames: Dict[str, str]) -> Tuple[Any, bool]:
+    if isinstance(data, str):
+        new = renames.get(normalize_ref(data)) if is_asset_ref(data) else None
+        return (new, True) if new else (data, False)
+    if isinstance(data, dict):
+        changed = False
+        for k, v in data.items():
+            data[k], c = _replace_refs(v, renames)
+            changed = changed or c
+        return data, changed
+    if isinstance(data, list):
+        changed = False
+        for i, v in enumerate(data):
+            data[i], c = _replace_refs(v, renames)
+            changed = changed or c
+        return data, changed
+    return data, False
+
+
+def rename_refs(repo, renames: Dict[str, str]) -> List[str]:
+    """Dosya yeniden adlandırmalarını (eski rel -> yeni rel) tüm JSON'lara yansıtır; kaydedilen entity'ler."""
+    saved: List[str] = []
+    if not renames:
+        return saved
+    for name in ENTITY_NAMES:
+        data = repo.load(name)
+        data, changed = _replace_refs(data, renames)
+        if changed:
+            repo.save(name, data)
+            saved.append(name)
+    return saved
+
+
+def format_bytes(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{n} B"
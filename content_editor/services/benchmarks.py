@@ -0,0 +1,281 @@
+"""
+Editörün büyük veri davranışı için ölçümler (python cli.py bench ...).
+
+Sentetik kayıtlar gerçek certificates.json şekline benzer: i18n ad, issuer, tarih + *_unix,
+stack listesi. Sonuçlar (etiket, değer) satırları olarak döner; CLI tablo olarak basar.
+"""
+from __future__ import annotations
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+Row = Tuple[str, str]
+
+_WORDS = ("deep learning machine vision data cloud backend web security network mobile "
+          "analysis systems design python react docker sql linux algorithms statistics "
+          "görüntü işleme yapay zeka veri bilimi yazılım geliştirme").split()
+_ISSUERS = ["Coursera", "Udemy", "BTK Akademi", "TECHPRO EDUCATION", "Google", "Microsoft",
+            "IBM", "DeepLearning.AI", "Turkcell Geleceği Yazanlar", "Kaggle"]
+_STACK = ["Python", "PyTorch", "TensorFlow", "React", "Docker", "SQL", "Linux", "OpenCV", "FastAPI"]
+
+
+def synthetic_records(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    out = []
+    base = 1_500_000_000
+    for i in range(n):
+        unix = base + rnd.randrange(300_000_000)
+        date = time.strftime("%Y-%m-%d", time.gmtime(unix))
+        out.append({
+            "name": {"en": " ".join(rnd.choices(_WORDS, k=4)).title() + f" {i}"},
+            "issuer": rnd.choice(_ISSUERS),
+            "category": rnd.choice(["technical", "language", "other"]),
+            "issued_at": date, "issued_at_iso": date, "issued_at_unix": unix,
+            "credential_id": f"{rnd.randrange(16 ** 10):010X}",
+            "details": {"en": " ".join(rnd.choices(_WORDS, k=12))},
+            "stack": rnd.sample(_STACK, k=rnd.randint(0, 3)),
+            "images": [], "order_index": i,
+        })
+    return out
+
+
+def _summary(rec: Dict[str, Any]) -> List[Any]:
+    return [(rec.get("name") or {}).get("en", ""), rec.get("issuer", ""), rec.get("issued_at", "")]
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
+def _rss_kb() -> Optional[int]:
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return None
+
+
+def bench_list(n: int = 100_000, modes=("virtual", "tree"), scrolls: int = 200, seed: int = 0) -> List[Row]:
+    """
+    Liste görünümü: Treeview (her kayıt bir öğe) ve VirtualList (sadece görünen satırlar).
+    Tk penceresi gizli açılır (görüntü sunucusu gerekir). Bellek: süreç tepe RSS artışı; RSS
+    sadece büyüdüğü için virtual önce ölçülür.
+    """
+    import tkinter as tk
+    from tkinter import ttk
+    from widgets.virtual_list import VirtualList
+
+    rows: List[Row] = [("records", f"{n:,}")]
+    data = synthetic_records(n, seed)
+    order = list(range(n))
+    cols = ["name", "issuer", "issued_at"]
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise RuntimeError(f"Tk display required for the list benchmark: {e}")
+    root.withdraw()
+    root.geometry("900x600")
+    rnd = random.Random(seed)
+
+    try:
+        for mode in [m for m in ("virtual", "tree") if m in modes]:
+            rss0 = _rss_kb()
+            frame = ttk.Frame(root)
+            frame.pack(fill="both", expand=True)
+            t = time.perf_counter()
+            if mode == "virtual":
+                view = VirtualList(frame, columns=cols)
+                view.pack(fill="both", expand=True)
+                root.update_idletasks()
+                view.set_rows(order, lambda i: _summary(data[i]))
+                root.update_idletasks()
+                build = time.perf_counter() - t
+
+                def scroll_to(f):
+                    view.yview("moveto", f)
+            else:
+                view = ttk.Treeview(frame, columns=cols, show="headings")
+                view.pack(fill="both", expand=True)
+                for i in order:
+                    view.insert("", "end", iid=str(i), values=_summary(data[i]))
+                root.update_idletasks()
+                build = time.perf_counter() - t
+
+                def scroll_to(f):
+                    view.yview_moveto(f)
+
+            t = time.perf_counter()
+            for _ in range(scrolls):
+                scroll_to(rnd.random())
+                root.update_idletasks()
+            per_scroll = (time.perf_counter() - t) / scrolls
+
+            t = time.perf_counter()
+            if mode == "virtual":
+                view.set_rows(order[::-1], lambda i: _summary(data[i]))
+            else:
+                view.delete(*view.get_children())
+                for i in reversed(order):
+                    view.insert("", "end", iid=str(i), values=_summary(data[i]))
+            root.update_idletasks()
+            refresh = time.perf_counter() - t
+
+            rss1 = _rss_kb()
+            rows += [(f"{mode}: build", _ms(build)),
+                     (f"{mode}: refresh (re-order all rows)", _ms(refresh)),
+                     (f"{mode}: scroll + redraw (avg)", _ms(per_scroll))]
+            if rss0 is not None and rss1 is not None:
+                rows.append((f"{mode}: peak RSS growth", f"{(rss1 - rss0) / 1024:.1f} MB"))
+            frame.destroy()
+            root.update_idletasks()
+    finally:
+        root.destroy()
+    return rows
+
+
+def bench_list_model(n: int = 100_000, seed: int = 0) -> List[Row]:
+    """Görünümden bağımsız maliyetler: arama indeksi, sıralama anahtarları, filtre."""
+    from services.search_index import SearchIndex
+
+    data = synthetic_records(n, seed)
+    rows: List[Row] = []
+    t = time.perf_counter()
+    idx = SearchIndex()
+    idx.rebuild((id(r), r) for r in data)
+    rows.append(("search index build", _ms(time.perf_counter() - t)))
+    for q in ("deep", "deep lea", "coursera python", "görüntü"):
+        t = time.perf_counter()
+        hits = idx.search(q) or set()
+        visible = [i for i, r in enumerate(data) if id(r) in hits]
+        rows.append((f"filter '{q}' ({len(visible):,} rows)", _ms(time.perf_counter() - t)))
+    t = time.perf_counter()
+    keys = [r["issued_at_unix"] for r in data]
+    order = sorted(range(n), key=keys.__getitem__)
+    rows.append(("sort by issued_at (cached keys)", _ms(time.perf_counter() - t)))
+    del order
+    return rows
+
+
+QUICK_QUERIES = ("deep", "py", "deep lear", "coursera python", "görüntü", "machne vison", "12345", "xyzq",
+                 # çok kelimeli: her kelime ayrı büyük posting'ler getirir
+                 "deep learning machine vision", "veri bilimi yazilim gelistirme", "deep lerning machin vison")
+
+
+def bench_quick(n: int = 100_000, seed: int = 0, repeat: int = 20) -> List[Row]:
+    """Ctrl+P hızlı geçiş: trigram indeksi kurulumu, sorgu gecikmesi (ort./en kötü), kayıt sonrası fark."""
+    from services.quick_index import QuickIndex
+
+    data = synthetic_records(n, seed)
+    rows: List[Row] = [("records", f"{n:,}")]
+    rss0 = _rss_kb()
+    t = time.perf_counter()
+    idx = QuickIndex()
+    idx.set_entity("certificates", data)
+    rows.append(("index build", _ms(time.perf_counter() - t)))
+    rss1 = _rss_kb()
+    if rss0 is not None and rss1 is not None:
+        rows.append(("index peak RSS growth", f"{(rss1 - rss0) / 1024:.1f} MB"))
+    all_times: List[float] = []
+    for q in QUICK_QUERIES:
+        times = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            hits = idx.search(q)
+            times.append(time.perf_counter() - t)
+        all_times += times
+        rows.append((f"query '{q}' ({len(hits)} hits, avg)", _ms(sum(times) / len(times))))
+    all_times.sort()
+    rows.append(("query p95 (all queries)", _ms(all_times[int(len(all_times) * 0.95)])))
+    rows.append(("query max (includes GC pauses)", _ms(all_times[-1])))
+    # kayıt sonrası: 10 kayıt güncellendi, 1 silindi -> set_entity sadece farkı uygular
+    edited = list(data)
+    for i in range(0, 10 * 97, 97):
+        edited[i] = dict(edited[i], issuer="Edited")
+    del edited[-1]
+    t = time.perf_counter()
+    idx.set_entity("certificates", edited)
+    rows.append(("refresh after save (10 edits, 1 delete)", _ms(time.perf_counter() - t)))
+    return rows
+
+
+def bench_near_dupes(n: int = 100_000, seed: int = 0, copies: int = 1000) -> List[Row]:
+    """Kopya tespiti: n kayıt + `copies` adet tek harfi silinmiş yeniden giriş; süre ve yakalama oranı."""
+    from services.near_dupes import DUPE_FIELDS, DupeIndex, find_duplicates
+
+    data = synthetic_records(n, seed)
+    rnd = random.Random(seed + 1)
+    planted = set()
+    for _ in range(copies):
+        i = rnd.randrange(n)
+        name = data[i]["name"]["en"]
+        p = rnd.randrange(len(name) - 8)          # sondaki sıra numarasına dokunma
+        data.append(dict(data[i], name={"en": name[:p] + name[p + 1:]}))
+        planted.add((i, len(data) - 1))
+    rows: List[Row] = [("records", f"{len(data):,} ({copies:,} planted copies)")]
+    t = time.perf_counter()
+    pairs = find_duplicates("certificates", data)
+    rows.append(("all pairs (blocking + similarity)", _ms(time.perf_counter() - t)))
+    found = {(i, j) for i, j, _s in pairs}
+    rows.append(("planted copies found", f"{len(found & planted) / max(1, len(planted)):.0%}"))
+    rows.append(("other pairs reported", f"{len(found - planted):,}"))
+    idx = DupeIndex(DUPE_FIELDS["certificates"])
+    idx.rebuild((id(r), r) for r in data)
+    t = time.perf_counter()
+    for rec in data[:200]:
+        idx.similar(rec, skip=id(rec))
+    rows.append(("check one new record (avg)", _ms((time.perf_counter() - t) / 200)))
+    return rows
+
+
+def bench_undo(n: int = 100_000, seed: int = 0, edits: int = 1000) -> List[Row]:
+    """
+    Geri al geçmişi: n/100, n/10 ve n kayıtlık listelerde `edits` düzenleme (alan değiştirme,
+    Up/Down, silme, ekleme) sonrası geçmişin tuttuğu bellek; düzenleme başına sabit kalmalı.
+    Süre ayrı bir geçişte ölçülür (tracemalloc açıkken ayırmalar çok yavaşlar).
+    """
+    import tracemalloc
+    from services.undo import UndoHistory
+
+    def run(size: int, traced: bool):
+        data = synthetic_records(size, seed)
+        rnd = random.Random(seed + 1)
+        fresh = [dict(data[rnd.randrange(size)], issuer="Edited") for _ in range(edits)]
+        hist = UndoHistory(max_steps=edits)
+        saved = list(data)
+        if traced:
+            tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        t = time.perf_counter()
+        for k in range(edits):
+            i = rnd.randrange(len(data) - 1)
+            op = k % 4
+            if op == 0:
+                data[i] = fresh[k]
+            elif op == 1:
+                data[i], data[i + 1] = data[i + 1], data[i]
+            elif op == 2:
+                del data[i]
+            else:
+                data.insert(i, fresh[k])
+            hist.record(saved, data)
+            saved = list(data)
+        elapsed = time.perf_counter() - t
+        del saved
+        used = tracemalloc.get_traced_memory()[0] - base
+        if traced:
+            tracemalloc.stop()
+        return hist, data, elapsed, used
+
+    rows: List[Row] = []
+    for size in sorted({max(10, n // 100), max(10, n // 10), max(10, n)}):
+        _h, _d, _e, used = run(size, traced=True)
+        hist, data, elapsed, _u = run(size, traced=False)
+        rows.append((f"{size:,} records: history per edit", f"{used / edits:,.0f} B"))
+        rows.append((f"{size:,} records: full-list snapshot", f"{size * 8:,} B"))
+        rows.append((f"{size:,} records: record one edit (avg)", _ms(elapsed / edits)))
+        t = time.perf_counter()
+        while hist.undo(data):
+            pass
+        rows.append((f"{size:,} records: undo all {edits:,}", _ms(time.perf_counter() - t)))
+    return rows
@@ -0,0 +1,58 @@
+"""
+Liste sekmelerinde gruplu görünüm için üyelik indeksi.
+
+    groups = GroupIndex(lambda rec: [rec.get("category") or ""])
+    groups.rebuild((id(r), r) for r in data)
+    groups.update(id(old), id(new), new)
+
+- Bir kayıt birden fazla gruba girebilir (ör. projects.areas listesi).
+- Add / Update / Delete'te sadece o kaydın grupları değişir; grup sayıları len(üyeler).
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+NO_GROUP = "(none)"
+
+
+class GroupIndex:
+    def __init__(self, values_fn: Callable[[Any], List[str]]):
+        self._values_fn = values_fn
+        self.members: Dict[str, Set[int]] = {}
+        self._of: Dict[int, Tuple[str, ...]] = {}
+
+    def _values(self, rec: Any) -> Tuple[str, ...]:
+        try:
+            vals = [str(v).strip() for v in (self._values_fn(rec) or [])]
+        except Exception:
+            vals = []
+        vals = [v for v in vals if v]
+        return tuple(dict.fromkeys(vals)) or (NO_GROUP,)
+
+    def rebuild(self, items: Iterable[Tuple[int, Any]]) -> None:
+        self.members.clear()
+        self._of.clear()
+        for doc_id, rec in items:
+            self.add(doc_id, rec)
+
+    def add(self, doc_id: int, rec: Any) -> None:
+        if doc_id in self._of:
+            self.remove(doc_id)
+        vals = self._values(rec)
+        self._of[doc_id] = vals
+        for v in vals:
+            self.members.setdefault(v, set()).add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        for v in self._of.pop(doc_id, ()):
+            ids = self.members.get(v)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self.members[v]
+
+    def update(self, old_id: int, new_id: int, rec: Any) -> None:
+        self.remove(old_id)
+        self.add(new_id, rec)
+
+    def groups_of(self, doc_id: int) -> Tuple[str, ...]:
+        return self._of.get(doc_id, ())
@@ -0,0 +1,119 @@
+"""
+Diskte HTTP önbelleği (ETag / Last-Modified ile koşullu istek).
+
+    data = HTTP_CACHE.fetch(url, progress=cb, cancel=event)
+
+- İlk istekte gövde CACHE_DIR/http/<sha1>.bin, başlıklar <sha1>.json olarak saklanır.
+- Sonraki isteklerde If-None-Match / If-Modified-Since gönderilir; 304 gelirse diskteki gövde döner.
+- Ağ hatasında elde kopya varsa o döner (çevrimdışı çalışma).
+- progress(alınan_byte, toplam|None) ve cancel (threading.Event) worker thread'den kullanılmak içindir.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import threading
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.error import HTTPError, URLError
+
+from settings import CACHE_DIR
+
+CHUNK = 1 << 16
+USER_AGENT = "PortfolioContentEditor/1.0"
+
+
+class FetchCancelled(Exception):
+    pass
+
+
+class HttpCache:
+    def __init__(self, cache_dir: str | Path, timeout: float = 10.0):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    # ---- disk ----
+    def _paths(self, url: str):
+        h = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{h}.json", self.cache_dir / f"{h}.bin"
+
+    def cached_meta(self, url: str) -> Optional[Dict[str, str]]:
+        meta_p, body_p = self._paths(url)
+        try:
+            with meta_p.open("r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return meta if body_p.exists() else None
+
+    def cached_body(self, url: str) -> Optional[bytes]:
+        _meta_p, body_p = self._paths(url)
+        try:
+            return body_p.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _store(self, url: str, headers, body: bytes):
+        meta_p, body_p = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_type": headers.get("Content-Type"),
+        }
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = body_p.with_suffix(".bin.tmp")
+            tmp.write_bytes(body)
+            tmp.replace(body_p)
+            meta_p.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+    # ---- network ----
+    def fetch(
+        self,
+        url: str,
+        progress: Callable[[int, Optional[int]], None] | None = None,
+        cancel: threading.Event | None = None,
+    ) -> bytes:
+        meta = self.cached_meta(url)
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        if meta:
+            if meta.get("etag"):
+                req.add_header("If-None-Match", meta["etag"])
+            if meta.get("last_modified"):
+                req.add_header("If-Modified-Since", meta["last_modified"])
+
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                total = resp.headers.get("Content-Length")
+                total = int(total) if total and total.isdigit() else None
+                buf = bytearray()
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        raise FetchCancelled(url)
+                    chunk = resp.read(CHUNK)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    if progress:
+                        progress(len(buf), total)
+                body = bytes(buf)
+                self._store(url, resp.headers, body)
+                return body
+        except HTTPError as e:
+            if e.code == 304 and meta:
+                body = self.cached_body(url)
+                if body is not None:
+                    if progress:
+                        progress(len(body), len(body))
+                    return body
+            raise
+        except (URLError, TimeoutError, OSError):
+            body = self.cached_body(url) if meta else None
+            if body is not None:
+                return body
+            raise
+
+
+HTTP_CACHE = HttpCache(CACHE_DIR / "http")
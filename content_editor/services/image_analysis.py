@@ -0,0 +1,108 @@
+"""
+Görseller için LQIP (küçük bulanık placeholder) ve renk analizi.
+
+- placeholder: en uzun kenarı 16px olan WebP (Pillow'da WebP yoksa PNG), data URI
+- avg_color:   alfa ağırlıklı ortalama renk (#rrggbb)
+- dominant_color: 4 bit/kanal kuantize histogramın en kalabalık kovasının ortalaması
+
+Hesap NumPy ile vektörel yapılır; çok dosya varsa ProcessPoolExecutor ile paralel.
+Pillow / NumPy yoksa analiz atlanır (boş dict).
+"""
+from __future__ import annotations
+import base64
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+try:
+    from PIL import Image, features
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+try:
+    import numpy as np
+    NUMPY_OK = True
+except Exception:
+    NUMPY_OK = False
+
+
+PLACEHOLDER_SIZE = 16
+ANALYSIS_SIZE = 64
+RASTER_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".ico")
+
+
+def can_analyze(path: str) -> bool:
+    return PIL_OK and NUMPY_OK and path.lower().endswith(RASTER_EXTS)
+
+
+def _hex(rgb) -> str:
+    r, g, b = (int(round(float(c))) for c in rgb)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _open_small(path: str, size: int):
+    im = Image.open(path)
+    # JPEG: decoder seviyesinde küçült (tam çözünürlük decode edilmez)
+    im.draft("RGB", (size * 2, size * 2))
+    im = im.convert("RGBA")
+    im.thumbnail((size, size), Image.BILINEAR)
+    return im
+
+
+def colors_from_rgba(arr) -> Dict[str, str]:
+    """arr: (h, w, 4) uint8. Alfa ağırlıklı ortalama ve baskın renk."""
+    px = arr.reshape(-1, 4).astype(np.float32)
+    alpha = px[:, 3] / 255.0
+    wsum = float(alpha.sum())
+    if wsum <= 0:
+        return {"avg_color": "#000000", "dominant_color": "#000000"}
+    rgb = px[:, :3]
+    avg = (rgb * alpha[:, None]).sum(axis=0) / wsum
+
+    q = rgb.astype(np.uint16) >> 4                       # 16 seviye/kanal
+    bucket = (q[:, 0] << 8) | (q[:, 1] << 4) | q[:, 2]   # 4096 kova
+    counts = np.bincount(bucket, weights=alpha, minlength=4096)
+    top = int(counts.argmax())
+    mask = (bucket == top) & (alpha > 0)
+    dom = (rgb[mask] * alpha[mask, None]).sum(axis=0) / float(alpha[mask].sum())
+    return {"avg_color": _hex(avg), "dominant_color": _hex(dom)}
+
+
+def _encode_placeholder(im) -> str:
+    small = im.copy()
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.LANCZOS)
+    buf = io.BytesIO()
+    if features.check("webp"):
+        small.save(buf, format="WEBP", quality=40, method=6)
+        mime = "image/webp"
+    else:
+        small.save(buf, format="PNG", optimize=True)
+        mime = "image/png"
+    return f"data:{mime};base64,{base64.b64encode(buf.getvalue()).decode('ascii')}"
+
+
+def analyze_image(path: str) -> Dict[str, Any]:
+    if not can_analyze(path):
+        return {}
+    try:
+        im = _open_small(path, ANALYSIS_SIZE)
+        out = colors_from_rgba(np.asarray(im, dtype=np.uint8))
+        out["placeholder"] = _encode_placeholder(im)
+        return out
+    except Exception:
+        return {}
+
+
+def analyze_many(paths: List[str], max_workers: int | None = None) -> Dict[str, Dict[str, Any]]:
+    """path -> analiz. Birden fazla dosyada süreç havuzu kullanır."""
+    todo = [p for p in paths if can_analyze(p)]
+    if not todo:
+        return {}
+    if len(todo) == 1:
+        return {todo[0]: analyze_image(todo[0])}
+    workers = max_workers or min(len(todo), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(analyze_image, todo, chunksize=max(1, len(todo) // (workers * 4)))
+        return dict(zip(todo, results))
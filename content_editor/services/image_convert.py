@@ -0,0 +1,50 @@
+"""
+Seçicilere (MultiImagePicker / IconPicker) eklenen yerel görsellerin public/ altına dönüştürülmesi.
+
+    path, poster = convert_local(src, "/.../images/projects/Foo_1", poster="/.../Foo_1_poster.png")
+
+- Hareketliler animasyonlu WebP (desteklenmiyorsa GIF) olur; poster verilirse ilk kareden PNG poster
+- SVG (keep_svg=True) rasterleştirilmez, küçültülür
+- Diğerleri RGBA PNG; Pillow yoksa dosya olduğu gibi kopyalanır
+Animasyon kodlaması (WebP method=6) saniyeler sürebilir: sekmeler bunu app.tasks.run_process ile
+çağırır. Modül düzeyi fonksiyon ve düz argümanlar -> süreç havuzuna picklable.
+"""
+from __future__ import annotations
+import os
+import shutil
+from typing import Optional, Tuple
+
+from services.svg_optimize import minify_file
+
+try:
+    from PIL import Image
+    from services.animated_image import is_animated, write_animation, write_poster
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+
+def convert_local(src: str, dst_stem: str, poster: Optional[str] = None,
+                  keep_svg: bool = False) -> Tuple[str, Optional[str]]:
+    """src'yi dst_stem + uygun uzantı olarak yazar. (yazılan yol, poster yolu | None) döner."""
+    os.makedirs(os.path.dirname(dst_stem) or ".", exist_ok=True)
+    if keep_svg and src.lower().endswith(".svg"):
+        dst = dst_stem + ".svg"
+        minify_file(src, dst)       # vektör kalır; metadata/editör verisi atılır
+        return dst, None
+    if PIL_OK and is_animated(src):
+        dst = str(write_animation(src, dst_stem))
+        if poster:
+            write_poster(src, poster)
+        return dst, poster
+    dst = dst_stem + ".png"
+    if PIL_OK:
+        im = Image.open(src)
+        try:
+            im = im.convert("RGBA")
+        except Exception:
+            pass
+        im.save(dst, format="PNG")
+    else:
+        shutil.copyfile(src, dst)
+    return dst, None
@@ -0,0 +1,287 @@
+"""
+İçerikteki tüm bağlantıların (credential_url, links.*, socials url, stack link ...) kontrolü.
+
+- asyncio ile eşzamanlı; her host için keep-alive bağlantı havuzu (http.client) ve
+  nezaket sınırları (host başına eşzamanlı istek + istekler arası minimum süre).
+- Önce HEAD; 405/403/501 ya da bağlantı hatasında GET (gövde okunmaz).
+- Yönlendirmeler elle izlenir (en fazla 5). Sonuç hâlâ 3xx ise (döngü ya da Location'sız
+  yönlendirme) bağlantı kırık sayılır.
+- Sonuçlar CACHE_DIR/links.json'da TTL ile saklanır; tekrar çalıştırınca sadece bayatlar kontrol edilir.
+"""
+from __future__ import annotations
+import asyncio
+import http.client
+import json
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from settings import CACHE_DIR, ENTITY_NAMES
+
+USER_AGENT = "Mozilla/5.0 (compatible; PortfolioLinkChecker/1.0)"
+OK_TTL = 24 * 3600        # başarılı sonuç 1 gün geçerli
+FAIL_TTL = 3600           # başarısız sonuç 1 saat sonra tekrar denenir
+PER_HOST = 2
+HOST_DELAY = 0.25         # aynı host'a ardışık istekler arası (sn)
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+TIMEOUT = 10.0
+
+# entity -> kontrol edilecek alan yolları ("links.*" = links altındaki tüm string'ler)
+LINK_FIELDS: Dict[str, List[str]] = {
+    "info": ["links.*"],
+    "socials": ["url"],
+    "experience": ["links.*"],
+    "competitions": ["links.*"],
+    "projects": ["links.*"],
+    "certificates": ["credential_url"],
+    "courses": [],
+    "stack": ["link"],
+}
+
+
+def _is_url(s: Any) -> bool:
+    return isinstance(s, str) and s.strip().lower().startswith(("http://", "https://"))
+
+
+def record_label(rec: Dict[str, Any]) -> str:
+    for k in ("title", "name", "platform", "full_name"):
+        v = rec.get(k)
+        if isinstance(v, dict):
+            v = v.get("en") or v.get("tr")
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+    return ""
+
+
+@dataclass(frozen=True)
+class LinkRef:
+    entity: str
+    index: Optional[int]
+    field: str
+    url: str
+    label: str = ""
+
+
+def _fields_of(rec: Dict[str, Any], spec: str) -> List[Tuple[str, Any]]:
+    if spec.endswith(".*"):
+        grp = rec.get(spec[:-2])
+        if isinstance(grp, dict):
+            return [(f"{spec[:-2]}.{k}", v) for k, v in grp.items()]
+        return []
+    return [(spec, rec.get(spec))]
+
+
+def collect_links(entities: Dict[str, Any]) -> List[LinkRef]:
+    out: List[LinkRef] = []
+    for name, data in entities.items():
+        specs = LINK_FIELDS.get(name, [])
+        recs = list(enumerate(data)) if isinstance(data, list) else [(None, data)]
+        for i, rec in recs:
+            if not isinstance(rec, dict):
+                continue
+            for spec in specs:
+                for fpath, v in _fields_of(rec, spec):
+                    if _is_url(v):
+                        out.append(LinkRef(name, i, fpath, v.strip(), record_label(rec)))
+    return out
+
+
+@dataclass
+class LinkResult:
+    url: str
+    ok: bool
+    status: Optional[int]
+    final_url: Optional[str]
+    error: Optional[str]
+    checked_at: float
+    method: str = "HEAD"
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+class ResultCache:
+    def __init__(self, path: str | Path, ok_ttl: float = OK_TTL, fail_ttl: float = FAIL_TTL):
+        self.path = Path(path)
+        self.ok_ttl, self.fail_ttl = ok_ttl, fail_ttl
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                self.entries = json.load(f) or {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def fresh(self, url: str, now: float | None = None) -> Optional[LinkResult]:
+        e = self.entries.get(url)
+        if not e:
+            return None
+        ttl = self.ok_ttl if e.get("ok") else self.fail_ttl
+        if (now or time.time()) - e.get("checked_at", 0) > ttl:
+            return None
+        return LinkResult(**e)
+
+    def put(self, res: LinkResult):
+        self.entries[res.url] = res.to_json()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.entries, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+class HostPool:
+    """(scheme, host, port) başına boşta bekleyen keep-alive bağlantılar."""
+
+    def __init__(self, timeout: float = TIMEOUT):
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    def acquire(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        with self._lock:
+            lst = self._idle.get(key)
+            if lst:
+                return lst.pop()
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, scheme: str, host: str, port: int, conn: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.setdefault((scheme, host, port), []).append(conn)
+
+    def close(self):
+        with self._lock:
+            for lst in self._idle.values():
+                for c in lst:
+                    try:
+                        c.close()
+                    except Exception:
+                        pass
+            self._idle.clear()
+
+
+class LinkChecker:
+    def __init__(self, cache: ResultCache | None = None, per_host: int = PER_HOST,
+                 host_delay: float = HOST_DELAY, max_workers: int = 16, timeout: float = TIMEOUT):
+        self.cache = cache or ResultCache(CACHE_DIR / "links.json")
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.max_workers = max_workers
+        self.pool = HostPool(timeout)
+
+    # ---- senkron tek istek (executor içinde) ----
+    def _request(self, method: str, url: str) -> Tuple[int, Optional[str]]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        host = parts.hostname or ""
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        conn = self.pool.acquire(scheme, host, port)
+        try:
+            conn.request(method, path, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+            resp = conn.getresponse()
+            # GET'te gövdeyi okumadan bağlantı tekrar kullanılamaz -> kapat
+            if method == "HEAD":
+                resp.read()
+                reusable = not resp.will_close
+            else:
+                reusable = False
+            status, location = resp.status, resp.getheader("Location")
+        except Exception:
+            conn.close()
+            raise
+        if reusable:
+            self.pool.release(scheme, host, port, conn)
+        else:
+            conn.close()
+        return status, location
+
+    # ---- async ----
+    async def _check_one(self, url: str, loop, ex, host_state) -> LinkResult:
+        method = "HEAD"
+        current = url
+        status: Optional[int] = None
+        error: Optional[str] = None
+        for _ in range(MAX_REDIRECTS + 1):
+            host = urlsplit(current).netloc.lower()
+            state = host_state.setdefault(host, [asyncio.Semaphore(self.per_host), 0.0])
+            async with state[0]:
+                wait = state[1] + self.host_delay - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                state[1] = time.monotonic()
+                try:
+                    status, location = await loop.run_in_executor(ex, self._request, method, current)
+                    error = None
+                except Exception as e:
+                    status, location, error = None, None, f"{type(e).__name__}: {e}"
+            if method == "HEAD" and (status is None or status in (403, 405, 501)):
+                method = "GET"           # HEAD desteklemeyen sunucular
+                continue
+            if status in REDIRECT_CODES and location:
+                current = urljoin(current, location)
+                continue
+            break
+        ok = status is not None and 200 <= status < 300
+        if status is not None and 300 <= status < 400 and error is None:
+            if status in REDIRECT_CODES:
+                error = "too many redirects" if location else "redirect without Location"
+            else:
+                error = f"unexpected {status} response"
+        return LinkResult(url=url, ok=ok, status=status, final_url=current if current != url else None,
+                          error=error, checked_at=time.time(), method=method)
+
+    async def check_async(self, urls: List[str], force: bool = False,
+                          progress: Callable[[int, int], None] | None = None) -> Dict[str, LinkResult]:
+        unique = list(dict.fromkeys(urls))
+        results: Dict[str, LinkResult] = {}
+        todo = []
+        for u in unique:
+            hit = None if force else self.cache.fresh(u)
+            if hit:
+                results[u] = hit
+            else:
+                todo.append(u)
+        loop = asyncio.get_running_loop()
+        host_state: Dict[str, list] = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="links") as ex:
+            async def run(u):
+                nonlocal done
+                r = await self._check_one(u, loop, ex, host_state)
+                results[u] = r
+                self.cache.put(r)
+                done += 1
+                if progress:
+                    progress(done, len(todo))
+            await asyncio.gather(*(run(u) for u in todo))
+        self.pool.close()
+        if todo:
+            self.cache.save()
+        return results
+
+    def check(self, urls: List[str], force: bool = False,
+              progress: Callable[[int, int], None] | None = None) -> Dict[str, LinkResult]:
+        return asyncio.run(self.check_async(urls, force=force, progress=progress))
+
+
+def check_repo_links(repo, force: bool = False, checker: LinkChecker | None = None,
+                     progress: Callable[[int, int], None] | None = None
+                     ) -> List[Tuple[LinkRef, LinkResult]]:
+    entities = {name: repo.load(name) for name in ENTITY_NAMES}
+    refs = collect_links(entities)
+    checker = checker or LinkChecker()
+    results = checker.check([r.url for r in refs], force=force, progress=progress)
+    return [(r, results[r.url]) for r in refs]
@@ -0,0 +1,211 @@
+"""
+Neredeyse-kopya kayıt tespiti (sertifika / yarışma / deneyim ... yeniden girilmiş kayıtlar).
+
+    idx = DupeIndex(DUPE_FIELDS["certificates"])
+    idx.rebuild((id(r), r) for r in certificates)
+    idx.pairs()                 # [(kayıt_a, kayıt_b, benzerlik)], en benzer önce
+    idx.similar(new_rec)        # eklemeden önce: [(kayıt, benzerlik)]
+
+- Bloklama: her kayıt, ad token'larının her biri ile (kurum, token) ve (ay, token) bloklarına
+  girer (kurum/tarih yoksa (token)). Sadece aynı bloktaki kayıtlar karşılaştırılır; MAX_BLOCK'tan
+  büyük bloklar (çok yaygın token'lar) atlanır — gerçek kopyalar zaten daha nadir bir token'ı da
+  paylaşır. Böylece O(n²) yerine blok boyutlarıyla orantılı.
+- Benzerlik: normalize edilmiş (aksansız, küçük harf, noktalama yok) adlar üzerinde
+  difflib oranı; önce ucuz üst sınırlar (real_quick_ratio / quick_ratio).
+- Adlardaki sayılar farklıysa kopya sayılmaz: "Machine Learning 101" ile "... 201" ayrı seviyeler.
+  Aynı şekilde iki tarafta da karşılığı olmayan (yazım hatası sayılamayacak kadar farklı) birer kelime
+  varsa ayrı kayıtlardır: "Deep Learning - ANN" / "... - CNN". Tek tarafta fazladan kelime kopyadır.
+- Artımlı (add / remove / update) — liste sekmesi mutasyon kancalarından güncellenir.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from services.search_index import tokenize
+
+DEFAULT_THRESHOLD = 0.85
+MAX_BLOCK = 64
+TYPO_RATIO = 0.75       # farklı iki kelime bu orandan benzerse yazım farkı sayılır
+
+
+@dataclass(frozen=True)
+class DupeFields:
+    name: str
+    group: Optional[str] = None      # kurum / issuer
+    date: Optional[str] = None
+
+
+DUPE_FIELDS: Dict[str, DupeFields] = {
+    "certificates": DupeFields("name", "issuer", "issued_at"),
+    "competitions": DupeFields("name", "organization", "start"),
+    "experience": DupeFields("title", "organization", "start"),
+    "projects": DupeFields("title", None, "date"),
+    "courses": DupeFields("name", None, "semester"),
+}
+
+
+def _text(v: Any) -> str:
+    if isinstance(v, dict):     # i18n
+        v = v.get("en") or v.get("tr") or ""
+    return v if isinstance(v, str) else ""
+
+
+def _month(v: Any) -> str:
+    """Tarih kovası: "2024-03-..." / "03.2024" / "Mar 2024" -> "2024-03"; yoksa ham metnin ilk 7 karakteri."""
+    s = _text(v).strip()
+    toks = tokenize(s)
+    year = next((t for t in toks if len(t) == 4 and t.isdigit()), "")
+    if not year:
+        return s[:7].casefold()
+    rest = [t for t in toks if t != year]
+    return f"{year}-{rest[0] if rest else ''}"
+
+
+class _Info:
+    __slots__ = ("rec", "norm", "tokens", "numbers", "keys")
+
+    def __init__(self, rec, tokens, keys):
+        self.rec, self.tokens, self.keys = rec, frozenset(tokens), keys
+        self.norm = " ".join(tokens)
+        self.numbers = frozenset(t for t in tokens if t.isdigit())
+
+
+def _substituted(a: frozenset, b: frozenset) -> bool:
+    """İki tarafta da yazım farkıyla açıklanamayan birer kelime var mı?"""
+    da, db = a - b, b - a
+    if not da or not db:
+        return False
+
+    def close(x, others):
+        return any(SequenceMatcher(None, x, y).ratio() >= TYPO_RATIO for y in others)
+
+    return any(not close(x, db) for x in da) and any(not close(y, da) for y in db)
+
+
+class DupeIndex:
+    def __init__(self, fields: DupeFields, threshold: float = DEFAULT_THRESHOLD):
+        self.fields = fields
+        self.threshold = threshold
+        self._info: Dict[int, _Info] = {}
+        self._blocks: Dict[Tuple[str, ...], Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+    # ---------- güncelleme ----------
+    def _describe(self, rec: Dict[str, Any]) -> _Info:
+        f = self.fields
+        toks = tokenize(_text(rec.get(f.name)))
+        group = " ".join(tokenize(_text(rec.get(f.group)))) if f.group else ""
+        month = _month(rec.get(f.date)) if f.date else ""
+        keys = set()
+        for t in toks:
+            if group:
+                keys.add(("g", group, t))
+            if month:
+                keys.add(("d", month, t))
+            if not group and not month:
+                keys.add(("n", t))
+        return _Info(rec, toks, tuple(keys))
+
+    def rebuild(self, items: Iterable[Tuple[int, Any]]) -> None:
+        self._info.clear()
+        self._blocks.clear()
+        for k, rec in items:
+            self.add(k, rec)
+
+    def add(self, k: int, rec: Any) -> None:
+        if k in self._info:
+            self.remove(k)
+        info = self._describe(rec)
+        self._info[k] = info
+        for key in info.keys:
+            self._blocks.setdefault(key, set()).add(k)
+
+    def remove(self, k: int) -> None:
+        info = self._info.pop(k, None)
+        if info is None:
+            return
+        for key in info.keys:
+            ids = self._blocks.get(key)
+            if ids is not None:
+                ids.discard(k)
+                if not ids:
+                    del self._blocks[key]
+
+    def update(self, old: int, new: int, rec: Any) -> None:
+        self.remove(old)
+        self.add(new, rec)
+
+    # ---------- karşılaştırma ----------
+    def _score(self, a: _Info, b: _Info) -> float:
+        if not a.norm or not b.norm:
+            return 0.0
+        if a.numbers != b.numbers and a.numbers and b.numbers:
+            return 0.0
+        if a.norm == b.norm:
+            return 1.0
+        sm = SequenceMatcher(None, a.norm, b.norm, autojunk=False)
+        t = self.threshold
+        if sm.real_quick_ratio() < t or sm.quick_ratio() < t:
+            return 0.0
+        r = sm.ratio()
+        if r < t:
+            return 0.0
+        if a.norm.replace(" ", "") != b.norm.replace(" ", "") and _substituted(a.tokens, b.tokens):
+            return 0.0      # "DeepLearning" / "Deep Learning" kopya; "ANN" / "CNN" değil
+        return r
+
+    def similar(self, rec: Dict[str, Any], skip: Optional[int] = None) -> List[Tuple[Any, float]]:
+        """rec'e benzeyen kayıtlar (eklemeden önce uyarı için); en benzer önce."""
+        me = self._describe(rec)
+        cand: Set[int] = set()
+        for key in me.keys:
+            ids = self._blocks.get(key)
+            if ids is not None and len(ids) <= MAX_BLOCK:
+                cand |= ids
+        cand.discard(skip)
+        out = []
+        for k in cand:
+            s = self._score(me, self._info[k])
+            if s >= self.threshold:
+                out.append((self._info[k].rec, s))
+        out.sort(key=lambda x: -x[1])
+        return out
+
+    def pairs(self) -> List[Tuple[Any, Any, float]]:
+        """Tüm olası kopya çiftleri (her çift bir kez); en benzer önce."""
+        seen: Set[Tuple[int, int]] = set()
+        out = []
+        info = self._info
+        for ids in self._blocks.values():
+            if len(ids) < 2 or len(ids) > MAX_BLOCK:
+                continue
+            members = sorted(ids)
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    if (a, b) in seen:
+                        continue
+                    seen.add((a, b))
+                    s = self._score(info[a], info[b])
+                    if s >= self.threshold:
+                        out.append((info[a].rec, info[b].rec, s))
+        out.sort(key=lambda x: -x[2])
+        return out
+
+
+def find_duplicates(entity: str, records: List[Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[int, int, float]]:
+    """CLI: (indeks_a, indeks_b, benzerlik) — kayıtlı sıraya göre a < b."""
+    fields = DUPE_FIELDS.get(entity)
+    if fields is None:
+        return []
+    idx = DupeIndex(fields, threshold)
+    idx.rebuild((i, r) for i, r in enumerate(records) if isinstance(r, dict))
+    pos = {id(r): i for i, r in enumerate(records)}
+    out = []
+    for a, b, s in idx.pairs():
+        i, j = sorted((pos[id(a)], pos[id(b)]))
+        out.append((i, j, s))
+    return out
@@ -0,0 +1,286 @@
+"""
+Algısal hash (pHash / dHash) ile kopya ve neredeyse-kopya görsel tespiti.
+
+- phash: 128x128 gri görüntünün 2B DCT'si (NumPy matris çarpımı), sol-üst 32x32 katsayı,
+         medyana göre bit -> 1024 bit. Klasik 64 bitlik pHash aynı şablondan basılmış
+         (sadece yazısı farklı) sertifikaları ayırt edemiyor; 1024 bit ile ayrışıyorlar.
+- dhash: 9x8 gri görüntüde yatay komşu farkı (64 bit, rapor için ikincil ölçü)
+- Arama: çoklu indeks (multi-index hashing): 1024 bit 16 adet 64 bitlik parçaya bölünür, her parça
+  ayrı sözlükte. 1024 bitte BK-tree r=14'te neredeyse hiç budamıyordu (20k görselde sorgu başına
+  ~2000 düğüm); parça sözlükleri sorguyu birkaç aday doğrulamasına indirir.
+
+Hash'ler StatCache'te tutulur; build() tekrar çağrılabilir: yalnızca yeni/değişen dosyalar hash'lenir,
+silinenler çıkarılır. shared_index() public dizini başına tek indeks verir (seçiciler her bırakmada
+klasörü yeniden taramaz).
+"""
+from __future__ import annotations
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from settings import CACHE_DIR
+from services.asset_refs import scan_assets
+from services.stat_cache import StatCache, stat_key
+
+try:
+    from PIL import Image
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+try:
+    import numpy as np
+    NUMPY_OK = True
+except Exception:
+    NUMPY_OK = False
+
+
+RASTER_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".ico")
+# 1024 bitten en fazla bu kadarı farklıysa "neredeyse aynı"
+# (1/3 ölçek ~6 bit, JPEG q60 ~10 bit; aynı şablonlu farklı sertifikalar 18+ bit)
+DEFAULT_THRESHOLD = 14
+
+_DCT_N = 128
+_HASH_SIDE = 32
+_PHASH_HEX = _HASH_SIDE * _HASH_SIDE // 4
+MIH_CHUNKS = 16
+_dct_matrix = None
+
+
+def _dct() -> "np.ndarray":
+    global _dct_matrix
+    if _dct_matrix is None:
+        n = np.arange(_DCT_N)
+        m = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * _DCT_N))
+        m[0] *= 1 / np.sqrt(2)
+        _dct_matrix = m * np.sqrt(2 / _DCT_N)
+    return _dct_matrix
+
+
+def _bits_to_int(bits) -> int:
+    return int.from_bytes(np.packbits(np.asarray(bits, dtype=bool).ravel()).tobytes(), "big")
+
+
+def _gray(path: str, size: Tuple[int, int]):
+    im = Image.open(path)
+    im.draft("L", (size[0] * 4, size[1] * 4))
+    if im.mode in ("RGBA", "LA", "P"):
+        # şeffaf alanları beyaz zemine oturt (logo/ikonlar)
+        im = im.convert("RGBA")
+        bg = Image.new("RGBA", im.size, (255, 255, 255, 255))
+        im = Image.alpha_composite(bg, im)
+    return np.asarray(im.convert("L").resize(size, Image.LANCZOS), dtype=np.float64)
+
+
+def phash_array(gray) -> int:
+    d = _dct()
+    coeffs = d @ gray @ d.T
+    low = coeffs[:_HASH_SIDE, :_HASH_SIDE].ravel()
+    med = np.median(low[1:])    # DC katsayısı medyanı bozmasın
+    return _bits_to_int(low > med)
+
+
+def dhash_array(gray) -> int:
+    return _bits_to_int(gray[:, 1:] > gray[:, :-1])
+
+
+def hash_image(path: str) -> Dict[str, str]:
+    """{"phash": "256 hex", "dhash": "16 hex"}; okunamazsa {}."""
+    if not (PIL_OK and NUMPY_OK and path.lower().endswith(RASTER_EXTS)):
+        return {}
+    try:
+        ph = phash_array(_gray(path, (_DCT_N, _DCT_N)))
+        dh = dhash_array(_gray(path, (9, 8)))
+    except Exception:
+        return {}
+    return {"phash": f"{ph:0{_PHASH_HEX}x}", "dhash": f"{dh:016x}"}
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class MultiIndex:
+    """
+    Hamming araması için çoklu indeks. Uzaklığı <= r olan iki hash'in en az bir parçası
+    r // chunks bitten fazla farklı olamaz (güvercin yuvası): r < chunks için parçanın kendisi,
+    r < 2 * chunks için 1 bit komşuları da yoklanır; daha büyük r'de tüm hash'ler taranır.
+    Adaylar tam Hamming uzaklığıyla doğrulanır -> sonuç kesin, kaçırma yok.
+    """
+
+    def __init__(self, bits: int = _HASH_SIDE * _HASH_SIDE, chunks: int = MIH_CHUNKS):
+        self.chunks = chunks
+        self.width = bits // chunks
+        self._mask = (1 << self.width) - 1
+        self._tables: List[Dict[int, Set[str]]] = [{} for _ in range(chunks)]
+        self._hashes: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def _parts(self, h: int) -> Iterator[int]:
+        for i in range(self.chunks):
+            yield (h >> (i * self.width)) & self._mask
+
+    def add(self, h: int, key: str):
+        self.remove(key)
+        self._hashes[key] = h
+        for table, part in zip(self._tables, self._parts(h)):
+            table.setdefault(part, set()).add(key)
+
+    def remove(self, key: str):
+        h = self._hashes.pop(key, None)
+        if h is None:
+            return
+        for table, part in zip(self._tables, self._parts(h)):
+            keys = table[part]
+            keys.discard(key)
+            if not keys:
+                del table[part]
+
+    def candidates(self, h: int, radius: int):
+        sub = radius // self.chunks
+        if sub > 1:
+            return self._hashes.keys()
+        out: Set[str] = set()
+        for table, part in zip(self._tables, self._parts(h)):
+            hit = table.get(part)
+            if hit:
+                out |= hit
+            if sub:
+                for b in range(self.width):
+                    hit = table.get(part ^ (1 << b))
+                    if hit:
+                        out |= hit
+        return out
+
+    def query(self, h: int, radius: int) -> List[Tuple[int, str]]:
+        """Uzaklığı <= radius olan (uzaklık, key) listesi, yakından uzağa."""
+        out: List[Tuple[int, str]] = []
+        for key in self.candidates(h, radius):
+            d = hamming(h, self._hashes[key])
+            if d <= radius:
+                out.append((d, key))
+        out.sort()
+        return out
+
+
+class PerceptualIndex:
+    """public/ altındaki tüm görsellerin hash'leri + çoklu indeks (build() artımlı tazeler)."""
+
+    def __init__(self, public_dir: str | Path, cache: StatCache | None = None):
+        self.public_dir = Path(public_dir)
+        self.cache = cache or StatCache(CACHE_DIR / "phash.json")
+        self.hashes: Dict[str, Tuple[int, int]] = {}   # rel -> (phash, dhash)
+        self.index = MultiIndex()
+        self._stats: Dict[str, Tuple[int, int]] = {}   # rel -> indekse girdiği andaki (size, mtime_ns)
+        self._lock = threading.RLock()                 # seçiciler worker thread'lerden paylaşır
+
+    def build(self) -> "PerceptualIndex":
+        with self._lock:
+            files = [rel for rel in scan_assets(self.public_dir) if rel.lower().endswith(RASTER_EXTS)]
+            keep = set(files)
+            for rel in [r for r in self._stats if r not in keep]:
+                self._remove(rel)
+
+            misses: Dict[str, os.stat_result] = {}
+            for rel in files:
+                try:
+                    st = os.stat(self.public_dir / rel)
+                except OSError:
+                    continue
+                if self._stats.get(rel) == stat_key(st):
+                    continue        # önceki build'den beri değişmedi
+                hit = self.cache.lookup(rel, st)
+                if hit is not None:
+                    self._add(rel, hit, st)
+                else:
+                    misses[rel] = st
+
+            todo = list(misses)
+            if len(todo) > 1:
+                workers = min(len(todo), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as ex:
+                    results = list(ex.map(hash_image, [str(self.public_dir / r) for r in todo],
+                                          chunksize=max(1, len(todo) // (workers * 4))))
+            else:
+                results = [hash_image(str(self.public_dir / r)) for r in todo]
+            for rel, value in zip(todo, results):
+                self.cache.store(rel, misses[rel], value)
+                self._add(rel, value, misses[rel])
+
+            self.cache.prune(keep)
+            self.cache.save()
+        return self
+
+    def _add(self, rel: str, value: Dict[str, str], st: os.stat_result):
+        self._stats[rel] = stat_key(st)
+        if not value:
+            self._remove_hash(rel)
+            return
+        ph, dh = int(value["phash"], 16), int(value["dhash"], 16)
+        self.hashes[rel] = (ph, dh)
+        self.index.add(ph, rel)
+
+    def _remove_hash(self, rel: str):
+        self.hashes.pop(rel, None)
+        self.index.remove(rel)
+
+    def _remove(self, rel: str):
+        self._stats.pop(rel, None)
+        self._remove_hash(rel)
+
+    def matches_for_hash(self, value: Dict[str, str], threshold: int = DEFAULT_THRESHOLD,
+                         exclude: str | None = None) -> List[Tuple[int, str]]:
+        if not value:
+            return []
+        with self._lock:
+            hits = self.index.query(int(value["phash"], 16), threshold)
+        return [(d, rel) for d, rel in hits if rel != exclude]
+
+    def matches_for_file(self, path: str, threshold: int = DEFAULT_THRESHOLD) -> List[Tuple[int, str]]:
+        """Henüz public/ altında olmayan (yeni eklenen) bir dosyaya benzeyen mevcut görseller."""
+        return self.matches_for_hash(hash_image(path), threshold)
+
+    def iter_pairs(self, threshold: int = DEFAULT_THRESHOLD) -> Iterator[Tuple[int, str, str]]:
+        """(uzaklık, a, b) ve a < b; her çift bir kez."""
+        for rel, (ph, _dh) in self.hashes.items():
+            for d, other in self.index.query(ph, threshold):
+                if other > rel:
+                    yield d, rel, other
+
+    def duplicate_groups(self, threshold: int = DEFAULT_THRESHOLD) -> List[List[str]]:
+        """Birbirine zincirle bağlı benzer görselleri gruplar (union-find)."""
+        parent: Dict[str, str] = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for _d, a, b in self.iter_pairs(threshold):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[rb] = ra
+        groups: Dict[str, List[str]] = {}
+        for x in parent:
+            groups.setdefault(find(x), []).append(x)
+        return sorted((sorted(g) for g in groups.values()), key=lambda g: g[0])
+
+
+_SHARED: Dict[Path, PerceptualIndex] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_index(public_dir: str | Path) -> PerceptualIndex:
+    """Public dizini başına tek indeks; çağıran build() ile tazeler (değişmeyen dosyalar atlanır)."""
+    key = Path(public_dir).resolve()
+    with _SHARED_LOCK:
+        index = _SHARED.get(key)
+        if index is None:
+            index = _SHARED[key] = PerceptualIndex(key)
+        return index
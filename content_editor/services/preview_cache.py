@@ -0,0 +1,91 @@
+"""
+Önizleme görselleri için iki katmanlı önbellek (bellek LRU + disk).
+
+Anahtar: (mutlak yol, mtime_ns, hedef kutu). Değer: kutuya sığdırılmış RGBA PIL.Image.
+Dosya değişmedikçe tam çözünürlüklü fotoğraf bir daha decode edilmez; editör yeniden
+açıldığında da disk katmanından (CACHE_DIR/previews/*.png) küçük hali okunur.
+"""
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from settings import CACHE_DIR
+
+Box = Tuple[int, int]
+
+
+class PreviewCache:
+    def __init__(self, cache_dir: str | Path, max_items: int = 32):
+        self.cache_dir = Path(cache_dir)
+        self.max_items = max_items
+        self._mem: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()   # get() task runtime thread'lerinden de çağrılır
+
+    @staticmethod
+    def _path_id(abs_path: str) -> str:
+        return hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:16]
+
+    def _disk_path(self, abs_path: str, mtime_ns: int, box: Box) -> Path:
+        return self.cache_dir / f"{self._path_id(abs_path)}_{mtime_ns}_{box[0]}x{box[1]}.png"
+
+    def get(self, path: str, box: Box) -> Image.Image:
+        """Kutuya sığdırılmış görsel. Çağıran değiştirmemeli (paylaşılan nesne)."""
+        abs_path = os.path.abspath(path)
+        mtime_ns = os.stat(abs_path).st_mtime_ns
+        key = (abs_path, mtime_ns, tuple(box))
+
+        with self._lock:
+            img = self._mem.get(key)
+            if img is not None:
+                self._mem.move_to_end(key)
+                return img
+
+        disk = self._disk_path(abs_path, mtime_ns, box)
+        img = self._read_disk(disk)
+        if img is None:
+            img = self._decode(abs_path, box)
+            self._write_disk(disk, abs_path, box, img)
+
+        with self._lock:
+            self._mem[key] = img
+            while len(self._mem) > self.max_items:
+                self._mem.popitem(last=False)
+        return img
+
+    @staticmethod
+    def _decode(abs_path: str, box: Box) -> Image.Image:
+        im = Image.open(abs_path)
+        im.draft("RGB", (box[0] * 2, box[1] * 2))
+        im = im.convert("RGBA")
+        im.thumbnail(box, Image.LANCZOS)
+        return im
+
+    @staticmethod
+    def _read_disk(disk: Path) -> Optional[Image.Image]:
+        try:
+            with Image.open(disk) as im:
+                im.load()
+                return im.convert("RGBA")
+        except Exception:
+            return None
+
+    def _write_disk(self, disk: Path, abs_path: str, box: Box, img: Image.Image):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # aynı dosyanın eski mtime'lı önizlemelerini temizle
+            for old in self.cache_dir.glob(f"{self._path_id(abs_path)}_*_{box[0]}x{box[1]}.png"):
+                old.unlink(missing_ok=True)
+            tmp = disk.with_suffix(".tmp")
+            img.save(tmp, format="PNG")
+            tmp.replace(disk)
+        except Exception:
+            pass
+
+
+PREVIEWS = PreviewCache(CACHE_DIR / "previews")
@@ -0,0 +1,241 @@
+"""
+Ctrl+P hızlı geçiş için tüm entity'lerdeki kayıtlar üzerinde trigram indeksi.
+
+    qi = QuickIndex()
+    qi.set_entity("projects", projects)      # ilk kurulum ya da kayıt sonrası (fark uygulanır)
+    for hit in qi.search("cnn torch"):       # en iyi eşleşmeler önce
+        hit.entity, hit.rec, hit.label
+
+- İndekslenen metin: başlık/ad (i18n dahil), issuer/organization/team, stack/tech/areas/topics vb.
+  (QUICK_FIELDS). Açıklama gibi uzun metinler dahil değil -> indeks küçük, sonuç anlamlı.
+- Her kelime " " + kelime olarak trigramlara bölünür; " py" kelime başını işaretler, bu yüzden
+  iki harflik sorgular da çalışır.
+- Önce tüm sorgu kelimelerini (kelime başı olarak) içeren kayıtlar: en nadir posting'den başlayan
+  kesişim, aday kümesi sıradaki posting'den VERIFY_FACTOR kat küçülünce durur; kalan adaylar
+  metin üzerinde doğrulanır (çok kelimeli sorguda ~20 büyük listeyi kesiştirmek yerine).
+- Yeterli sonuç yoksa yazım hatasına toleranslı tur: en nadir posting'lerden toplam FUZZY_BUDGET
+  girdiye kadarı Counter ile sayılır (döngü C'de); en çok eşleşen limit * RANK_POOL aday tüm
+  trigramlarla metinde doğrulanır, en az FUZZY_RATIO'su eşleşmeli. Yaygın trigramlar sayılmadığı
+  için yaklaşık ama süre liste boyundan bağımsız olarak sınırlı.
+- Posting'ler liste (kayıt başına tek int nesnesi paylaşılır); silinenler mezar taşıyla atlanır ve
+  çok birikince posting'ler sıkıştırılır.
+- set_entity kimlik (id(kayıt)) farkıyla çalışır: liste sekmeleri Add/Update'te yeni dict ürettiği
+  için kayıt sonrası sadece değişenler yeniden indekslenir.
+"""
+from __future__ import annotations
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from services.search_index import tokenize
+
+QUICK_FIELDS = ("title", "name", "issuer", "organization", "team", "platform", "username",
+                "category", "stack", "tech", "areas", "topics")
+LABEL_FIELDS = ("title", "name", "platform")
+SECONDARY_FIELDS = ("issuer", "organization", "team", "username", "category")
+FUZZY_RATIO = 0.6
+COMPACT_RATIO = 0.25      # mezar taşı / toplam posting girdisi bunu aşınca sıkıştır
+RANK_POOL = 8             # büyük sonuç kümesinde sıralanacak aday: limit * RANK_POOL
+VERIFY_FACTOR = 32        # aday * 32 < kalan posting girdisi: kesişim yerine metinde doğrula
+FUZZY_BUDGET = 60_000     # toleranslı turda sayılan en fazla posting girdisi
+
+
+def _text(v: Any) -> str:
+    if isinstance(v, str):
+        return v
+    if isinstance(v, dict):       # i18n {"en": ..., "tr": ...}
+        return " ".join(x for x in v.values() if isinstance(x, str))
+    if isinstance(v, (list, tuple)):
+        return " ".join(x for x in v if isinstance(x, str))
+    return ""
+
+
+def _first_text(rec: Dict[str, Any], fields: Iterable[str]) -> str:
+    for f in fields:
+        v = rec.get(f)
+        if isinstance(v, dict):
+            v = v.get("en") or next((x for x in v.values() if isinstance(x, str) and x), "")
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+    return ""
+
+
+def record_label(rec: Dict[str, Any]) -> Tuple[str, str]:
+    """(ana başlık, ikincil bilgi) — palette gösterim için."""
+    return _first_text(rec, LABEL_FIELDS) or "(untitled)", _first_text(rec, SECONDARY_FIELDS)
+
+
+def _grams(words: Iterable[str]) -> Set[str]:
+    out: Set[str] = set()
+    for w in words:
+        w = " " + w
+        for i in range(len(w) - 2):
+            out.add(w[i:i + 3])
+    return out
+
+
+@dataclass
+class QuickHit:
+    entity: str
+    rec: Dict[str, Any]
+    label: str
+    detail: str
+    score: float
+
+
+class _Doc:
+    __slots__ = ("entity", "rec", "text", "label", "detail", "num")
+
+    def __init__(self, entity, rec, text, label, detail, num):
+        self.entity, self.rec, self.text = entity, rec, text
+        self.label, self.detail, self.num = label, detail, num
+
+
+class QuickIndex:
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._docs: Dict[int, _Doc] = {}                      # doc no -> doc (canlı)
+        self._lens: List[int] = []                            # doc no -> metin uzunluğu
+        self._by_entity: Dict[str, Dict[int, int]] = {}       # entity -> id(kayıt) -> doc no
+        self._next = 0
+        self._entries = 0          # toplam posting girdisi
+        self._dead = 0             # silinmiş doc'lara ait girdiler
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---------- güncelleme ----------
+    def set_entity(self, entity: str, records: List[Any]) -> Tuple[int, int]:
+        """Entity'nin güncel listesini uygula; (eklenen, silinen) döner."""
+        known = self._by_entity.setdefault(entity, {})
+        current = {id(r): r for r in records if isinstance(r, dict)}
+        gone = [k for k in known if k not in current]
+        for k in gone:
+            self._remove(known.pop(k))
+        added = 0
+        for k, rec in current.items():
+            if k not in known:
+                known[k] = self._add(entity, rec)
+                added += 1
+        if self._entries and self._dead / self._entries > COMPACT_RATIO:
+            self._compact()
+        return added, len(gone)
+
+    def drop_entity(self, entity: str) -> None:
+        for num in self._by_entity.pop(entity, {}).values():
+            self._remove(num)
+
+    def _add(self, entity: str, rec: Dict[str, Any]) -> int:
+        text = " " + " ".join(tokenize(" ".join(_text(rec.get(f)) for f in QUICK_FIELDS)))
+        label, detail = record_label(rec)
+        num = self._next
+        self._next += 1
+        doc = _Doc(entity, rec, text, label, detail, num)
+        self._docs[num] = doc
+        self._lens.append(len(text))
+        grams = _grams(text.split())
+        postings = self._postings
+        for g in grams:
+            lst = postings.get(g)
+            if lst is None:
+                postings[g] = lst = []
+            lst.append(num)
+        self._entries += len(grams)
+        return num
+
+    def _remove(self, num: int) -> None:
+        doc = self._docs.pop(num, None)
+        if doc is not None:
+            self._dead += len(_grams(doc.text.split()))
+
+    def _compact(self) -> None:
+        live = self._docs
+        for g in list(self._postings):
+            lst = [n for n in self._postings[g] if n in live]
+            if lst:
+                self._postings[g] = lst
+            else:
+                del self._postings[g]
+        self._entries -= self._dead
+        self._dead = 0
+
+    # ---------- sorgu ----------
+    def search(self, query: str, limit: int = 50) -> List[QuickHit]:
+        words = tokenize(query or "")
+        grams = _grams(words)
+        if not grams:
+            return []
+        get = self._postings.get
+        postings = sorted((get(g, ()) for g in grams), key=len)
+        live = self._docs
+
+        # 1) tam: tüm trigramlar. Önce her kelimenin en nadir trigramı (birkaç liste adayları hızla
+        # daraltır), sonra kalanlar; aday kümesi kalan listelerden çok küçükse metinde doğrulanır
+        size = lambda g: len(get(g, ()))        # noqa: E731
+        firsts = {min(gs, key=size) for gs in map(_grams, ([w] for w in words)) if gs}
+        order = sorted(firsts, key=size) + sorted(grams - firsts, key=size)
+        exact: Set[int] = set(get(order[0], ()))
+        remaining = sum(map(size, order[1:]))
+        rest = []
+        for k, g in enumerate(order[1:], 1):
+            if not exact or len(exact) * VERIFY_FACTOR <= remaining:
+                rest = order[k:]
+                break
+            lst = get(g, ())
+            exact.intersection_update(lst)
+            remaining -= len(lst)
+        # trigram metinde geçiyor <=> kayıtta var (" ab" kelime başı, "abc" kelime içi)
+        exact = {n for n in exact if n in live and all(g in live[n].text for g in rest)} \
+            if rest or self._dead else exact
+        out = self._rank(exact, " " + " ".join(words), limit)
+
+        # 2) yazım hatası toleranslı tur (tam sonuç azsa): nadir trigramlar C'de sayılır (Counter)
+        if len(out) < limit and len(grams) >= 3:
+            need = max(2, int(len(grams) * FUZZY_RATIO + 0.999))
+            counts: Counter = Counter()
+            used = 0
+            for lst in postings:
+                if used and used + len(lst) > FUZZY_BUDGET:
+                    break
+                counts.update(lst)
+                used += len(lst)
+            # sayılan (nadir) trigramlarda en çok eşleşenler, tüm trigramlarla doğrulanır
+            cand = []
+            for n, _k in counts.most_common(limit * RANK_POOL + len(exact)):
+                if n in exact or n not in live:
+                    continue
+                text = live[n].text
+                c = sum(1 for g in grams if g in text)
+                if c >= need:
+                    cand.append((c, n))
+            best = heapq.nlargest(limit - len(out), cand)
+            out += [self._hit(live[n], 0.9 * c / len(grams)) for c, n in best]
+        return out
+
+    def _rank(self, nums: Set[int], needle: str, limit: int) -> List[QuickHit]:
+        """
+        Tam eşleşmeler: sorgu metnin başında (başlığın ilk kelimesi) > bitişik geçiyor > dağınık;
+        eşitlikte kısa metin önde. Büyük kümelerde önce uzunluğa göre (C hızında) daraltılır.
+        """
+        live = self._docs
+        if len(nums) > limit * RANK_POOL:
+            nums = heapq.nsmallest(limit * RANK_POOL, nums, key=self._lens.__getitem__)
+
+        def key(n):
+            pos = live[n].text.find(needle)
+            return (0 if pos == 0 else 1 if pos > 0 else 2, self._lens[n], n)
+
+        out = []
+        for n in sorted(nums, key=key)[:limit]:
+            d = live[n]
+            out.append(self._hit(d, 1.5 if needle in d.text else 1.0))
+        return out
+
+    @staticmethod
+    def _hit(d: _Doc, score: float) -> QuickHit:
+        return QuickHit(d.entity, d.rec, d.label, d.detail, score)
+
+    def stats(self) -> Dict[str, int]:
+        return {"records": len(self._docs), "grams": len(self._postings),
+                "entries": self._entries - self._dead}
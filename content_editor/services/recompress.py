@@ -0,0 +1,228 @@
+"""
+public/images altındaki mevcut görselleri toplu yeniden sıkıştırma (kayıpsız).
+
+- PNG: optimize (zlib 9) + kayıpsız mod daraltma (opak RGBA -> RGB, <=256 renk -> palet;
+  palet dönüşümü piksel piksel doğrulanır)
+- JPEG: sadece jpegtran varsa (-copy all -optimize -progressive): DCT katsayıları aynen
+  korunur, sadece Huffman kodlaması değişir. Pillow ile açıp yeniden kodlamak (quality="keep"
+  bile) pikselleri değiştirir; jpegtran yoksa JPEG'lere dokunulmaz.
+- --webp: PNG/BMP için kayıpsız WebP de denenir; kazanırsa dosya .webp olur ve JSON referansları
+  güncellenir
+- Dosya ancak küçüldüyse değiştirilir.
+- Tüm çekirdekler (ProcessPoolExecutor). İlerleme StatCache durum dosyasına yazılır; kesilen
+  çalışma kaldığı yerden devam eder, işlenmiş ve değişmemiş dosyalar tekrar açılmaz.
+"""
+from __future__ import annotations
+import io
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from settings import CACHE_DIR, content_to_public_dir
+from services.asset_refs import rename_refs
+from services.stat_cache import StatCache
+
+try:
+    from PIL import Image, features
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+JPEGTRAN = shutil.which("jpegtran")
+NO_JPEGTRAN = "skipped (no jpegtran)"
+
+PNG_EXTS = (".png", ".bmp")
+JPEG_EXTS = (".jpg", ".jpeg")
+STATE_FILE = CACHE_DIR / "recompress_state.json"
+SAVE_EVERY = 16
+
+
+def _encode_png(im) -> bytes:
+    buf = io.BytesIO()
+    im.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def _png_candidates(im):
+    """Kayıpsız PNG adayları: olduğu gibi, opak RGBA -> RGB, <=256 renk -> palet (doğrulanmış)."""
+    yield im
+    if im.mode == "RGBA" and im.getextrema()[3][0] == 255:
+        im = im.convert("RGB")
+        yield im
+    if im.mode in ("RGB", "RGBA") and im.getcolors(256) is not None:
+        method = Image.Quantize.FASTOCTREE if im.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        p = im.quantize(colors=256, method=method, dither=Image.Dither.NONE)
+        if p.convert(im.mode).tobytes() == im.tobytes():
+            yield p
+
+
+def _best_png(im) -> bytes:
+    return min((_encode_png(c) for c in _png_candidates(im)), key=len)
+
+
+def _encode_jpeg(path: Path) -> bytes:
+    """Kayıpsız: jpegtran katsayıları yeniden kodlamadan sadece entropi kodlamasını optimize eder."""
+    res = subprocess.run([JPEGTRAN, "-copy", "all", "-optimize", "-progressive", str(path)],
+                         capture_output=True, check=True)
+    return res.stdout
+
+
+def _encode_webp_lossless(im) -> bytes:
+    buf = io.BytesIO()
+    mode = "RGBA" if im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info else "RGB"
+    im.convert(mode).save(buf, format="WEBP", lossless=True, quality=100, method=6, exact=True)
+    return buf.getvalue()
+
+
+def recompress_file(abs_path: str, rel: str, webp: bool = False) -> Dict[str, Any]:
+    """
+    Worker: tek dosyayı yeniden kodlar, küçüldüyse yazar.
+    {"rel", "new_rel" (webp'e döndüyse), "before", "after", "kind", "error"}
+    """
+    path = Path(abs_path)
+    before = path.stat().st_size
+    out: Dict[str, Any] = {"rel": rel, "new_rel": None, "before": before, "after": before,
+                           "kind": "unchanged", "error": None}
+    ext = path.suffix.lower()
+    try:
+        with Image.open(path) as im:
+            if getattr(im, "n_frames", 1) > 1:
+                out["kind"] = "skipped (animated)"
+                return out
+            if ext in JPEG_EXTS:
+                if not JPEGTRAN:
+                    out["kind"] = NO_JPEGTRAN
+                    return out
+                best, best_ext = _encode_jpeg(path), ext
+            elif ext in PNG_EXTS:
+                im.load()
+                best, best_ext = _best_png(im), ".png"
+                if webp:
+                    w = _encode_webp_lossless(im)
+                    if len(w) < len(best):
+                        best, best_ext = w, ".webp"
+            else:
+                out["kind"] = "skipped"
+                return out
+    except Exception as e:
+        out["error"] = f"{type(e).__name__}: {e}"
+        return out
+
+    if len(best) >= before:
+        return out
+    dst = path.with_suffix(best_ext)
+    if dst != path and dst.exists():      # aynı adda başka bir dosyanın üstüne yazma
+        return out
+    tmp = dst.with_suffix(dst.suffix + ".tmp")
+    tmp.write_bytes(best)
+    tmp.replace(dst)
+    if dst != path:
+        path.unlink()
+        out["new_rel"] = str(Path(rel).with_suffix(best_ext).as_posix())
+    out["after"] = len(best)
+    out["kind"] = "webp" if best_ext == ".webp" else "recompressed"
+    return out
+
+
+@dataclass
+class DirSavings:
+    files: int = 0
+    changed: int = 0
+    before: int = 0
+    after: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+
+@dataclass
+class RecompressReport:
+    results: List[Dict[str, Any]]
+    resumed: int
+    renames: Dict[str, str]
+    saved_entities: List[str]
+
+    def by_directory(self) -> Dict[str, DirSavings]:
+        dirs: Dict[str, DirSavings] = {}
+        for r in self.results:
+            d = dirs.setdefault(Path(r["rel"]).parent.as_posix(), DirSavings())
+            d.files += 1
+            d.before += r["before"]
+            d.after += r["after"]
+            d.changed += r["before"] != r["after"]
+        return dict(sorted(dirs.items()))
+
+
+def iter_images(public_dir: Path, subdir: str = "images"):
+    base = public_dir / subdir
+    for p in sorted(base.rglob("*")):
+        if p.is_file() and p.suffix.lower() in PNG_EXTS + JPEG_EXTS:
+            yield p
+
+
+def recompress_tree(repo, subdir: str = "images", webp: bool = False,
+                    max_workers: Optional[int] = None, state: Optional[StatCache] = None,
+                    progress: Callable[[int, int], None] | None = None) -> RecompressReport:
+    if not PIL_OK:
+        raise RuntimeError("Pillow is required (pip install pillow)")
+    if webp and not features.check("webp"):
+        raise RuntimeError("This Pillow build has no WebP support")
+    public_dir = content_to_public_dir(repo.content_root)
+    state = state or StatCache(STATE_FILE)
+    mode = "webp" if webp else "png"
+
+    todo, results = [], []
+    resumed = 0
+    for p in iter_images(public_dir, subdir):
+        rel = p.relative_to(public_dir).as_posix()
+        hit = state.lookup(rel, os.stat(p))
+        # önceki çalıştırmada işlendi ve o zamandan beri değişmedi
+        if hit is not None and (hit.get("mode") == mode or (hit.get("mode") == "webp" and not webp)):
+            results.append({"rel": rel, "new_rel": None, "before": hit["before"], "after": hit["after"],
+                            "kind": "cached", "error": None})
+            resumed += 1
+        else:
+            todo.append((str(p), rel))
+
+    renames: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    saved_entities: List[str] = []
+
+    def checkpoint():
+        # kesilirse JSON'lar ile diskteki dosya adları tutarlı kalsın
+        state.save()
+        for name in rename_refs(repo, pending):
+            if name not in saved_entities:
+                saved_entities.append(name)
+        pending.clear()
+
+    if todo:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as ex:
+            futs = [ex.submit(recompress_file, a, r, webp) for a, r in todo]
+            try:
+                for n, fut in enumerate(as_completed(futs), 1):
+                    r = fut.result()
+                    results.append(r)
+                    final_rel = r["new_rel"] or r["rel"]
+                    if r["new_rel"]:
+                        renames[r["rel"]] = pending[r["rel"]] = r["new_rel"]
+                    if not r["error"] and r["kind"] != NO_JPEGTRAN:     # jpegtran kurulunca denensin
+                        state.store(final_rel, os.stat(public_dir / final_rel),
+                                    {"before": r["before"], "after": r["after"], "mode": mode})
+                    if n % SAVE_EVERY == 0:
+                        checkpoint()
+                    if progress:
+                        progress(n, len(todo))
+            finally:
+                for f in futs:
+                    f.cancel()
+                checkpoint()
+
+    results.sort(key=lambda r: r["rel"])
+    return RecompressReport(results, resumed, renames, saved_entities)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, List
 from settings import PROJECT_ROOT, autodetect_content_root
 
 
@@ -45,6 +48,14 @@ def _jsonify(obj: Any) -> Any:
     return str(obj)
 
 
+def snapshot(data: Any) -> Any:
+    """
+    Verinin JSON'a hazır derin kopyası. Tk thread'inde alınır; arka planda yazılırken
+    arayüzün veriyi değiştirmesi yazılan kopyayı etkilemez.
+    """
+    return _jsonify(data)
+
+
 class Repository:
     """
     Tüm JSON IO işlemleri burada. content_root:
@@ -53,6 +64,7 @@ class Repository:
     """
 
     def __init__(self, content_root: str | Path | None = None):
+        self._save_listeners: List[Callable[[str], None]] = []
         self.set_content_root(content_root or autodetect_content_root())
 
     # --- root normalize ---
@@ -79,12 +91,48 @@ class Repository:
 
     def save(self, name: str, data: Any) -> str:
         """Veriyi güvenli biçimde JSON'a dönüştürerek yazar."""
+        return self.commit(name, self.stage(name, data))
+
+    def stage(self, name: str, data: Any) -> Path:
+        """
+        JSON'u hedefin yanında benzersiz bir geçici dosyaya yazar; hedefe dokunmaz (bkz. commit /
+        discard_staged). Her çağrı kendi dosyasını alır: Save All ile write-behind aynı entity'yi
+        aynı anda yazsa da birbirlerinin yarım dosyasını yerine koyamazlar.
+        """
         p = Path(self.path_for(name))
         p.parent.mkdir(parents=True, exist_ok=True)
         json_ready = _jsonify(data)
 
-        tmp = p.with_suffix(".json.tmp")
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(json_ready, f, ensure_ascii=False, indent=2)
+        fd, tmp_name = tempfile.mkstemp(dir=p.parent, prefix=f".{name}.", suffix=".json.tmp")
+        tmp = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(json_ready, f, ensure_ascii=False, indent=2)
+            # mkstemp 0600 açar; yerine konan dosya eskisinin izinlerini korusun
+            os.chmod(tmp, stat.S_IMODE(p.stat().st_mode) if p.exists() else 0o644)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return tmp
+
+    def commit(self, name: str, tmp: Path) -> str:
+        """stage() çıktısını atomik olarak yerine koyar."""
+        p = Path(self.path_for(name))
         tmp.replace(p)
+        self._notify_saved(name)
         return str(p)
+
+    @staticmethod
+    def discard_staged(tmp: Path) -> None:
+        Path(tmp).unlink(missing_ok=True)
+
+    # --- save listeners (ör. assets.json yeniden üretimi) ---
+    def add_save_listener(self, cb: Callable[[str], None]) -> None:
+        self._save_listeners.append(cb)
+
+    def _notify_saved(self, name: str) -> None:
+        for cb in list(self._save_listeners):
+            try:
+                cb(name)
+            except Exception:
+                pass
@@ -0,0 +1,102 @@
+"""
+Save All / Save Current Tab için iki aşamalı kayıt.
+
+    jobs = [SaveJob("info", snapshot(out), copies=[(src, dst)]), SaveJob("projects", snapshot(data))]
+    results = run_save(repo, jobs, progress)
+
+- Tk thread'inde sadece form durumu okunur (SaveJob: entity adı + veri kopyası + kopyalanacak görseller).
+- Worker'da 1. aşama (stage): görseller <hedef>.tmp'ye kopyalanır, JSON hedefin yanında
+  benzersiz bir .json.tmp'ye yazılır (write-behind aynı anda aynı entity'yi yazabilir).
+  Hedef dosyalara dokunulmaz; hata olursa o entity'nin tmp'leri silinir.
+- 2. aşama (commit): hazırlanabilen her entity için önce görseller, sonra JSON yerine konur
+  (sadece rename). Hiçbir JSON henüz diskte olmayan bir görsele işaret etmez; yarım yazılmış dosya
+  kalmaz. Hazırlanamayan entity'lerin dosyaları eski halleriyle kalır.
+- Sonuç entity bazında döner (EntityResult); hata bir sonraki entity'yi etkilemez.
+"""
+from __future__ import annotations
+import os
+import shutil
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+
+@dataclass
+class SaveJob:
+    name: str
+    data: Any                                                  # snapshot (JSON'a hazır kopya)
+    copies: List[Tuple[str, str]] = field(default_factory=list)  # (kaynak, public altındaki hedef)
+    on_saved: Optional[Callable[[], None]] = None              # Tk thread'inde, başarıdan sonra
+
+
+@dataclass
+class EntityResult:
+    name: str
+    ok: bool
+    error: str = ""
+    path: str = ""
+
+
+def _tmp_for(dst: str | Path) -> Path:
+    dst = Path(dst)
+    return dst.with_name(dst.name + ".tmp")
+
+
+def _stage(repo, job: SaveJob) -> Tuple[Path, List[Tuple[Path, Path]]]:
+    staged: List[Tuple[Path, Path]] = []
+    try:
+        for src, dst in job.copies:
+            tmp = _tmp_for(dst)
+            tmp.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, tmp)
+            staged.append((tmp, Path(dst)))
+        return repo.stage(job.name, job.data), staged
+    except BaseException:
+        for tmp, _dst in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+
+def run_save(repo, jobs: List[SaveJob],
+             progress: Callable[[int, int, str], None] | None = None) -> List[EntityResult]:
+    """Worker thread'de çalışır. İlerleme: (adım, toplam adım, entity adı)."""
+    total = 2 * len(jobs)
+    step = 0
+    results: List[EntityResult] = []
+    staged = []
+
+    def tick(name: str):
+        nonlocal step
+        step += 1
+        if progress:
+            progress(step, total, name)
+
+    # 1) stage
+    for job in jobs:
+        try:
+            staged.append((job, *_stage(repo, job)))
+        except Exception as e:
+            traceback.print_exc()
+            results.append(EntityResult(job.name, False, f"{type(e).__name__}: {e}"))
+            tick(job.name)      # commit adımı da yok
+        tick(job.name)
+
+    # 2) commit (sadece rename)
+    for job, json_tmp, assets in staged:
+        try:
+            for tmp, dst in assets:
+                os.replace(tmp, dst)
+            path = repo.commit(job.name, json_tmp)
+            results.append(EntityResult(job.name, True, path=path))
+        except Exception as e:
+            traceback.print_exc()
+            for tmp, _dst in assets:
+                tmp.unlink(missing_ok=True)
+            repo.discard_staged(json_tmp)
+            results.append(EntityResult(job.name, False, f"{type(e).__name__}: {e}"))
+        tick(job.name)
+
+    order = {j.name: i for i, j in enumerate(jobs)}
+    results.sort(key=lambda r: order.get(r.name, len(order)))
+    return results
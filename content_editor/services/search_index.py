@@ -0,0 +1,165 @@
+"""
+Liste sekmeleri için artımlı token ters indeksi (arama / filtre çubuğu).
+
+    idx = SearchIndex()
+    idx.add(id(rec), rec)          # ekle
+    idx.update(id(old), id(new), new)   # güncelle
+    idx.remove(id(rec))            # sil
+    hits = idx.search("deep lea")  # None: filtre yok, aksi halde doc id kümesi
+
+- Kaydın tüm string değerleri (i18n {"en", "tr"} dahil, iç içe dict/list) ve sayıları token'lanır;
+  görsel yolları (images/...) ve türetilmiş alanlar (*_unix, *_iso, order_index) hariç.
+- Büyük/küçük harf ve aksan duyarsız ("istanbul" -> "İstanbul", "gorsel" -> "görsel").
+- Her sorgu token'ı önek olarak eşleşir; tüm token'lar eşleşmeli (AND).
+- Yazarken sorgu bir öncekinin uzantısıysa ("dee" -> "deep") ve önceki sonuç küçükse sadece o süzülür.
+- Sözlük sıralı tutulur (bisect); önek araması sözlükte aralık taraması.
+"""
+from __future__ import annotations
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from services.asset_refs import is_asset_ref
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+FILTER_LIMIT = 2000     # önceki sonuç bundan küçükse süz, değilse indeksten hesapla
+
+
+def fold(text: str) -> str:
+    """Küçük harf + aksansız (Türkçe ı/İ dahil)."""
+    text = text.replace("ı", "i").replace("İ", "i").casefold()
+    if text.isascii():
+        return text
+    return _COMBINING.sub("", unicodedata.normalize("NFKD", text))
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(fold(text))
+
+
+_DERIVED = ("_unix", "_iso")      # tarih alanlarının türevleri (aynı bilgi metin olarak da var)
+
+
+def _record_strings(rec: Any) -> List[str]:
+    """Aranabilir değerler (özyineleme yerine yığın; büyük listelerde belirgin fark)."""
+    out: List[str] = []
+    stack = [rec]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, str):
+            if "/" not in v or not is_asset_ref(v):
+                out.append(v)
+        elif isinstance(v, dict):
+            for k, x in v.items():
+                if k != "order_index" and not k.endswith(_DERIVED):
+                    stack.append(x)
+        elif isinstance(v, (list, tuple)):
+            stack.extend(v)
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out.append(str(v))
+    return out
+
+
+def record_tokens(rec: Any) -> FrozenSet[str]:
+    # tek fold + tek regex geçişi (değer başına çağrıdan belirgin hızlı)
+    return frozenset(_WORD.findall(fold("\n".join(_record_strings(rec)))))
+
+
+class SearchIndex:
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._docs: Dict[int, FrozenSet[str]] = {}
+        self._vocab: List[str] = []           # sıralı, önek araması için
+        self._last: Optional[Tuple[Tuple[str, ...], Set[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---------- güncelleme ----------
+    def clear(self) -> None:
+        self._postings.clear()
+        self._docs.clear()
+        self._vocab.clear()
+        self._last = None
+
+    def rebuild(self, items: Iterable[Tuple[int, Any]]) -> None:
+        """Toplu kurulum (load): sözlük bir kez sıralanır."""
+        self.clear()
+        for doc_id, rec in items:
+            toks = record_tokens(rec)
+            self._docs[doc_id] = toks
+            for t in toks:
+                self._postings.setdefault(t, set()).add(doc_id)
+        self._vocab = sorted(self._postings)
+
+    def add(self, doc_id: int, rec: Any) -> None:
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        toks = record_tokens(rec)
+        self._docs[doc_id] = toks
+        for t in toks:
+            ids = self._postings.get(t)
+            if ids is None:
+                self._postings[t] = ids = set()
+                insort(self._vocab, t)
+            ids.add(doc_id)
+        self._last = None
+
+    def remove(self, doc_id: int) -> None:
+        toks = self._docs.pop(doc_id, None)
+        if toks is None:
+            return
+        for t in toks:
+            ids = self._postings.get(t)
+            if ids is None:
+                continue
+            ids.discard(doc_id)
+            if not ids:
+                del self._postings[t]
+                i = bisect_left(self._vocab, t)
+                if i < len(self._vocab) and self._vocab[i] == t:
+                    del self._vocab[i]
+        self._last = None
+
+    def update(self, old_id: int, new_id: int, rec: Any) -> None:
+        self.remove(old_id)
+        self.add(new_id, rec)
+
+    # ---------- sorgu ----------
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        i = bisect_left(self._vocab, prefix)
+        vocab, postings = self._vocab, self._postings
+        out: Set[int] = set()
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            out |= postings[vocab[i]]
+            i += 1
+        return out
+
+    def _extends_last(self, q: Tuple[str, ...]) -> bool:
+        if self._last is None:
+            return False
+        prev = self._last[0]
+        # her eski token'ın yerinde onu uzatan bir token var (+ yenileri)
+        return len(q) >= len(prev) and all(q[i].startswith(prev[i]) for i in range(len(prev)))
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        q = tuple(tokenize(query or ""))
+        if not q:
+            self._last = None
+            return None
+        if self._extends_last(q) and len(self._last[1]) <= FILTER_LIMIT:
+            docs = self._docs
+            cand = self._last[1]
+            hits = {d for d in cand
+                    if all(any(t.startswith(p) for t in docs[d]) for p in q)}
+        else:
+            hits: Set[int] = set()
+            for n, p in enumerate(sorted(set(q), key=len, reverse=True)):
+                ids = self._prefix_ids(p)
+                hits = ids if n == 0 else hits & ids
+                if not hits:
+                    break
+        self._last = (q, hits)
+        return set(hits)
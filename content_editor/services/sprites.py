@@ -0,0 +1,351 @@
+"""
+Stack logoları ve sosyal ikonlar için sprite üretimi (tek tek onlarca küçük istek yerine 1-2 dosya).
+
+- Raster logolar (stack[].logo_path, socials[].icon) SPRITE_PX'e küçültülüp skyline bottom-left
+  bin-packing ile ATLAS_WIDTH genişliğinde PNG atlas(lar)a yerleştirilir.
+- Vektör logolar (.svg) tek bir <symbol> sprite'ında toplanır; iç id'ler çakışmasın diye önek alır.
+- Koordinat haritası public/content/sprites/sprites.json:
+
+    {"version": 2, "source": "<imza>",
+     "atlases": [{"file": "content/sprites/logos-0-1a2b3c4d.png", "width": 512, "height": 136}],
+     "sprites": {"content/stack_logos/x.png": {"atlas": 0, "x": 0, "y": 0, "w": 64, "h": 48}},
+     "symbols": {"content/stack_logos/y.svg": {"file": "content/sprites/logos-5e6f7a8b.svg",
+                                              "id": "y", "viewBox": "0 0 128 128"}}}
+
+- İmza girdi dosyalarının (yol, içerik sha1) listesidir: clone / checkout mtime'ları değiştirse de
+  commit'lenmiş sprites.json güncel sayılır. İçerik hash'leri StatCache'te; değişmeyen dosya okunmaz.
+- Atlas ve sprite dosya adları kendi içeriklerinin hash'ini taşır: yeniden üretilen sayfa yeni bir
+  URL'dir, tarayıcı / CDN eski atlası sunmaz. sprites.json no-cache ile okunur.
+"""
+from __future__ import annotations
+import hashlib
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from settings import CACHE_DIR, content_to_public_dir
+from services.asset_refs import normalize_ref
+from services.stat_cache import StatCache
+from services.svg_optimize import SVG_NS, minify_svg
+
+try:
+    from PIL import Image
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+SPRITE_DIR = "content/sprites"
+MAP_NAME = "sprites.json"
+SPRITE_VERSION = 2
+SPRITE_PX = 64          # en uzun kenar (36px gösterim için ~2x)
+PADDING = 2             # komşu sprite'lar arasında taşma olmasın
+ATLAS_WIDTH = 512
+MAX_ATLAS_HEIGHT = 1024
+
+RASTER_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".ico")
+
+_URL_REF = re.compile(r"url\(\s*(['\"]?)#([^'\")\s]+)\1\s*\)")
+
+
+# ---------- girdiler ----------
+def sprite_inputs(entities: Dict[str, Any]) -> List[str]:
+    """stack logo_path + socials icon içindeki yerel (URL olmayan) yollar, tekrarsız ve sıralı."""
+    out: List[str] = []
+    for rec in entities.get("stack") or []:
+        if isinstance(rec, dict):
+            out.append(rec.get("logo_path") or "")
+    for rec in entities.get("socials") or []:
+        if isinstance(rec, dict):
+            out.append(rec.get("icon") or "")
+    refs = [normalize_ref(v) for v in out if isinstance(v, str)]
+    refs = [r for r in refs if r and not r.lower().startswith(("http://", "https://", "data:"))]
+    return sorted(set(refs))
+
+
+def _file_sha1(path: str) -> Dict[str, str]:
+    with open(path, "rb") as f:
+        return {"sha1": hashlib.sha1(f.read()).hexdigest()}
+
+
+def source_signature(public_dir: Path, refs: List[str], cache: Optional[StatCache] = None) -> str:
+    """Ayarlar + (yol, içerik sha1) listesi; mtime'a bağlı değil."""
+    cache = cache or StatCache(CACHE_DIR / "sprite_sources.json")
+    h = hashlib.sha1(f"v{SPRITE_VERSION}:{SPRITE_PX}:{PADDING}:{ATLAS_WIDTH}".encode())
+    for rel in refs:
+        try:
+            digest = cache.get_or_compute(rel, public_dir / rel, _file_sha1)
+        except OSError:
+            digest = None
+        h.update(f"{rel}|{digest['sha1'] if digest else 'missing'}\n".encode("utf-8"))
+    cache.prune(set(refs))
+    cache.save()
+    return h.hexdigest()
+
+
+def content_name(stem: str, data: bytes, ext: str) -> str:
+    """SPRITE_DIR altında içerik hash'li ad: logos-0-1a2b3c4d.png"""
+    return f"{SPRITE_DIR}/{stem}-{hashlib.sha1(data).hexdigest()[:8]}{ext}"
+
+
+# ---------- bin packing ----------
+class SkylinePacker:
+    """
+    Skyline bottom-left: ufuk çizgisi (x, y, genişlik) segmentleri tutulur; her dikdörtgen
+    en düşük tepe noktasına (eşitlikte en solda) yerleştirilir.
+    """
+
+    def __init__(self, width: int, max_height: int):
+        self.width = width
+        self.max_height = max_height
+        self.skyline: List[List[int]] = [[0, 0, width]]    # [x, y, w]
+        self.height = 0
+
+    def _fit(self, i: int, w: int) -> Optional[int]:
+        x = self.skyline[i][0]
+        if x + w > self.width:
+            return None
+        y, remaining, j = 0, w, i
+        while remaining > 0:
+            y = max(y, self.skyline[j][1])
+            remaining -= self.skyline[j][2]
+            j += 1
+            if remaining > 0 and j >= len(self.skyline):
+                return None
+        return y
+
+    def insert(self, w: int, h: int) -> Optional[Tuple[int, int]]:
+        best = None   # (top, x, index, y)
+        for i in range(len(self.skyline)):
+            y = self._fit(i, w)
+            if y is None or y + h > self.max_height:
+                continue
+            cand = (y + h, self.skyline[i][0], i, y)
+            if best is None or cand < best:
+                best = cand
+        if best is None:
+            return None
+        _top, x, i, y = best
+        self._add_level(i, x, y + h, w)
+        self.height = max(self.height, y + h)
+        return x, y
+
+    def _add_level(self, i: int, x: int, y: int, w: int):
+        self.skyline.insert(i, [x, y, w])
+        j = i + 1
+        while j < len(self.skyline):
+            seg = self.skyline[j]
+            prev_end = self.skyline[j - 1][0] + self.skyline[j - 1][2]
+            if seg[0] >= prev_end:
+                break
+            shrink = prev_end - seg[0]
+            seg[0] += shrink
+            seg[2] -= shrink
+            if seg[2] <= 0:
+                del self.skyline[j]
+            else:
+                break
+        # aynı yükseklikteki komşuları birleştir
+        k = 0
+        while k < len(self.skyline) - 1:
+            if self.skyline[k][1] == self.skyline[k + 1][1]:
+                self.skyline[k][2] += self.skyline[k + 1][2]
+                del self.skyline[k + 1]
+            else:
+                k += 1
+
+
+def pack(sizes: Dict[str, Tuple[int, int]], width: int = ATLAS_WIDTH,
+         max_height: int = MAX_ATLAS_HEIGHT, padding: int = PADDING
+         ) -> List[Tuple[SkylinePacker, Dict[str, Tuple[int, int]]]]:
+    """Yükseklik (sonra genişlik) azalan sırada yerleştirir; sığmayanlar yeni atlasa geçer."""
+    order = sorted(sizes, key=lambda k: (-sizes[k][1], -sizes[k][0], k))
+    bins: List[Tuple[SkylinePacker, Dict[str, Tuple[int, int]]]] = []
+    for key in order:
+        w, h = sizes[key][0] + padding, sizes[key][1] + padding
+        for packer, placed in bins:
+            pos = packer.insert(w, h)
+            if pos is not None:
+                placed[key] = pos
+                break
+        else:
+            packer = SkylinePacker(width, max_height)
+            pos = packer.insert(w, h)
+            if pos is None:
+                raise ValueError(f"sprite too large for atlas: {key} ({w}x{h})")
+            bins.append((packer, {key: pos}))
+    return bins
+
+
+# ---------- SVG symbol sprite ----------
+def _symbol_id(rel: str, taken: set) -> str:
+    base = re.sub(r"[^0-9A-Za-z_-]+", "-", Path(rel).stem).strip("-").lower() or "logo"
+    if base[0].isdigit():
+        base = "s-" + base
+    sid, n = base, 2
+    while sid in taken:
+        sid, n = f"{base}-{n}", n + 1
+    taken.add(sid)
+    return sid
+
+
+def _prefix_ids(root: ET.Element, prefix: str) -> None:
+    """Sembol içindeki id'leri ve url(#..)/href="#.." referanslarını önekler."""
+    ids = {el.get("id") for el in root.iter() if el.get("id")}
+    if not ids:
+        return
+
+    def fix(v: str) -> str:
+        return _URL_REF.sub(lambda m: f"url(#{prefix}{m.group(2)})" if m.group(2) in ids else m.group(0), v)
+
+    for el in root.iter():
+        for k, v in list(el.attrib.items()):
+            if k == "id":
+                el.set(k, prefix + v)
+            elif k.endswith("href") and v.startswith("#") and v[1:] in ids:
+                el.set(k, "#" + prefix + v[1:])
+            elif "url(" in v:
+                el.set(k, fix(v))
+        if el.tag.endswith("style") and el.text:
+            el.text = fix(el.text)
+
+
+def build_symbol_sprite(public_dir: Path, refs: List[str]) -> Tuple[Optional[bytes], Dict[str, Dict[str, str]]]:
+    sprite = ET.Element(f"{{{SVG_NS}}}svg")
+    symbols: Dict[str, Dict[str, str]] = {}
+    taken: set = set()
+    for rel in refs:
+        try:
+            root = ET.fromstring(minify_svg((public_dir / rel).read_bytes()))
+        except (OSError, ET.ParseError):
+            continue
+        sid = _symbol_id(rel, taken)
+        _prefix_ids(root, f"{sid}-")
+        vb = root.get("viewBox")
+        if not vb:
+            w = re.match(r"[\d.]+", root.get("width") or "")
+            h = re.match(r"[\d.]+", root.get("height") or "")
+            vb = f"0 0 {w.group(0) if w else 100} {h.group(0) if h else 100}"
+        sym = ET.SubElement(sprite, f"{{{SVG_NS}}}symbol", {"id": sid, "viewBox": vb})
+        for k in ("preserveAspectRatio", "fill", "stroke"):
+            if root.get(k):
+                sym.set(k, root.get(k))
+        sym.extend(list(root))
+        symbols[rel] = {"id": sid, "viewBox": vb}
+    if not symbols:
+        return None, {}
+    data = ET.tostring(sprite, encoding="unicode").encode("utf-8")
+    name = content_name("logos", data, ".svg")
+    for sym in symbols.values():
+        sym["file"] = name
+    return data, symbols
+
+
+# ---------- raster atlas ----------
+def _load_thumb(path: Path):
+    im = Image.open(path)
+    if getattr(im, "n_frames", 1) > 1:
+        im.seek(0)
+    im = im.convert("RGBA")
+    im.thumbnail((SPRITE_PX, SPRITE_PX), Image.LANCZOS)
+    return im
+
+
+def build_atlases(public_dir: Path, refs: List[str]) -> Tuple[List[Tuple[bytes, Dict[str, Any]]], Dict[str, Dict[str, int]]]:
+    """([(PNG verisi, {"file", "width", "height"}), ...], sprite koordinatları)."""
+    images = {}
+    for rel in refs:
+        try:
+            images[rel] = _load_thumb(public_dir / rel)
+        except Exception:
+            continue
+    if not images:
+        return [], {}
+    bins = pack({k: im.size for k, im in images.items()})
+    atlases: List[Tuple[bytes, Dict[str, Any]]] = []
+    sprites: Dict[str, Dict[str, int]] = {}
+    for n, (packer, placed) in enumerate(bins):
+        sheet = Image.new("RGBA", (ATLAS_WIDTH, max(1, packer.height)), (0, 0, 0, 0))
+        for rel, (x, y) in placed.items():
+            im = images[rel]
+            sheet.paste(im, (x, y))
+            sprites[rel] = {"atlas": n, "x": x, "y": y, "w": im.width, "h": im.height}
+        # boş sağ kenarı kırp
+        bbox = sheet.getbbox()
+        if bbox:
+            sheet = sheet.crop((0, 0, bbox[2], sheet.height))
+        buf = io.BytesIO()
+        sheet.save(buf, format="PNG", optimize=True)
+        data = buf.getvalue()
+        atlases.append((data, {"file": content_name(f"logos-{n}", data, ".png"),
+                               "width": sheet.width, "height": sheet.height}))
+    return atlases, sprites
+
+
+# ---------- giriş noktası ----------
+@dataclass
+class SpriteResult:
+    changed: bool
+    rasters: int = 0
+    symbols: int = 0
+    atlases: int = 0
+    map_path: Optional[Path] = None
+
+
+def _write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def map_path(content_root) -> Path:
+    return content_to_public_dir(Path(content_root)) / SPRITE_DIR / MAP_NAME
+
+
+def build_sprites(repo, force: bool = False, cache: Optional[StatCache] = None) -> SpriteResult:
+    public_dir = content_to_public_dir(repo.content_root)
+    out_dir = public_dir / SPRITE_DIR
+    mp = out_dir / MAP_NAME
+    entities = {name: repo.load(name) for name in ("stack", "socials")}
+    refs = [r for r in sprite_inputs(entities) if (public_dir / r).is_file()]
+    sig = source_signature(public_dir, refs, cache)
+
+    try:
+        with mp.open("r", encoding="utf-8") as f:
+            old = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        old = None
+    if not force and old and old.get("source") == sig:
+        files = [a["file"] for a in old.get("atlases", [])]
+        files += list({s["file"] for s in old.get("symbols", {}).values()})
+        if all((public_dir / f).is_file() for f in files):
+            return SpriteResult(False, len(old.get("sprites", {})), len(old.get("symbols", {})),
+                                len(old.get("atlases", [])), mp)
+
+    svg_refs = [r for r in refs if r.lower().endswith(".svg")]
+    raster_refs = [r for r in refs if r.lower().endswith(RASTER_EXTS)] if PIL_OK else []
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, Any] = {"version": SPRITE_VERSION, "source": sig,
+                                "atlases": [], "sprites": {}, "symbols": {}}
+    sheets, manifest["sprites"] = build_atlases(public_dir, raster_refs)
+    for data, meta in sheets:
+        _write(public_dir / meta["file"], data)
+        manifest["atlases"].append(meta)
+
+    sprite_svg, manifest["symbols"] = build_symbol_sprite(public_dir, svg_refs)
+    if sprite_svg:
+        _write(public_dir / next(iter(manifest["symbols"].values()))["file"], sprite_svg)
+
+    _write(mp, json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    # eski sayfalar harita yenilendikten sonra silinir (harita hiç olmayan dosyayı göstermez)
+    keep = {(public_dir / a["file"]).name for a in manifest["atlases"]}
+    keep |= {(public_dir / s["file"]).name for s in manifest["symbols"].values()}
+    for stale in list(out_dir.glob("logos*.png")) + list(out_dir.glob("logos*.svg")):
+        if stale.name not in keep:
+            stale.unlink(missing_ok=True)
+    return SpriteResult(True, len(manifest["sprites"]), len(manifest["symbols"]),
+                        len(manifest["atlases"]), mp)
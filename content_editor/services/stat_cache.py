@@ -0,0 +1,83 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.file_service import ensure_dir
+
+
+def stat_key(st: os.stat_result) -> Tuple[int, int]:
+    return (st.st_size, st.st_mtime_ns)
+
+
+class StatCache:
+    """
+    Dosya başına hesaplanan değerleri (boyut, hash, ölçüler ...) (size, mtime_ns) parmak izine
+    bağlı olarak saklar. Dosya değişmediyse tekrar açılmaz; JSON olarak diske kalıcı yazılır.
+
+        cache = StatCache(CACHE_DIR / "assets.json")
+        info = cache.get_or_compute("images/x.png", abs_path, compute)
+        cache.save()
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if isinstance(raw, dict) and raw.get("version") == self.VERSION:
+            self._entries = raw.get("entries") or {}
+
+    def lookup(self, key: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        e = self._entries.get(key)
+        if e and tuple(e.get("stat") or ()) == stat_key(st):
+            return e.get("value")
+        return None
+
+    def store(self, key: str, st: os.stat_result, value: Dict[str, Any]):
+        self._entries[key] = {"stat": list(stat_key(st)), "value": value}
+        self._dirty = True
+
+    def get_or_compute(
+        self, key: str, abs_path: str | Path, compute: Callable[[str], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Dosya yoksa None. Parmak izi tutuyorsa önbellekten, tutmuyorsa compute(abs_path)."""
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+        hit = self.lookup(key, st)
+        if hit is not None:
+            return hit
+        value = compute(str(abs_path))
+        self.store(key, st, value)
+        return value
+
+    def prune(self, keep) -> int:
+        """keep içinde olmayan anahtarları atar."""
+        drop = [k for k in self._entries if k not in keep]
+        for k in drop:
+            del self._entries[k]
+        if drop:
+            self._dirty = True
+        return len(drop)
+
+    def save(self):
+        if not self._dirty:
+            return
+        ensure_dir(str(self.path.parent))
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": self._entries}, f, ensure_ascii=False)
+        tmp.replace(self.path)
+        self._dirty = False
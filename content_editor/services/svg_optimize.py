@@ -0,0 +1,281 @@
+"""
+SVG küçültücü (stdlib xml.etree ile; ek bağımlılık yok).
+
+- Yorumlar, <metadata>, işlem talimatları, DOCTYPE atılır
+- Editör isim alanları (Inkscape, Sodipodi, Sketch, Illustrator, Serif, RDF/CC/DC) eleman ve
+  öznitelikleriyle silinir; kullanılmayan xmlns bildirimleri serileştirmede kendiliğinden düşer
+- Sayılar (d komut bilerek, points, transform, viewBox, geometri öznitelikleri) `precision` ondalığa yuvarlanır;
+  viewBox çok küçükse hassasiyet otomatik artırılır
+- <defs> içinde hiçbir url(#id) / href="#id" ile kullanılmayan tanımlar silinir
+- Metin dışı elemanlardaki boşluk düğümleri atılır
+
+Sonuç orijinalden büyük çıkarsa ya da dosya ayrıştırılamazsa orijinal döner.
+optimize_tree() public/ altındaki SVG'leri StatCache ile artımlı işler (küçültülmüş dosya tekrar açılmaz).
+"""
+from __future__ import annotations
+import os
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from settings import ASSET_SUBDIRS, CACHE_DIR
+from services.stat_cache import StatCache
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+EDITOR_NS = (
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://ns.adobe.com/",
+    "http://www.serif.com/",
+    "https://www.figma.com/",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "http://creativecommons.org/ns#",
+    "http://purl.org/dc/elements/1.1/",
+)
+
+NUMERIC_ATTRS = {
+    "d", "points", "transform", "gradientTransform", "patternTransform", "viewBox",
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "fx", "fy",
+    "width", "height", "stroke-width", "offset",
+}
+TEXT_TAGS = {"text", "tspan", "textPath", "style", "script", "title", "desc"}
+
+_NUM = re.compile(r"-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+_PATH_NUM = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_SEP = re.compile(r"[\s,]*")
+PATH_ARGS = {"m": 2, "l": 2, "h": 1, "v": 1, "c": 6, "s": 4, "q": 4, "t": 2, "a": 7, "z": 0}
+_URL_REF = re.compile(r"url\(\s*['\"]?#([^'\")\s]+)")
+DEFAULT_PRECISION = 3
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _ns(name: str) -> str:
+    return name[1:].split("}", 1)[0] if name.startswith("{") else ""
+
+
+def _is_editor(name: str) -> bool:
+    ns = _ns(name)
+    return bool(ns) and ns.startswith(EDITOR_NS)
+
+
+def format_number(v: float, precision: int) -> str:
+    s = f"{round(v, precision):.{precision}f}".rstrip("0").rstrip(".")
+    if s in ("-0", ""):
+        s = "0"
+    if s.startswith("0."):
+        s = s[1:]
+    elif s.startswith("-0."):
+        s = "-" + s[2:]
+    return s
+
+
+def round_numbers(value: str, precision: int) -> str:
+    return _NUM.sub(lambda m: format_number(float(m.group(0)), precision), value)
+
+
+def _join_path(tokens: List[str]) -> str:
+    out: List[str] = []
+    prev = ""
+    for t in tokens:
+        if out and not t[0].isalpha() and not prev[-1].isalpha():
+            # ayraç yalnız gerekliyse: "-" ve ondalıklı sayıdan sonraki "." yeni sayı başlatır
+            if not (t[0] == "-" or (t[0] == "." and ("." in prev or "e" in prev))):
+                out.append(" ")
+        out.append(t)
+        prev = t
+    return "".join(out)
+
+
+def round_path(d: str, precision: int) -> str:
+    """
+    Yol verisini komut bilerek ayrıştırıp yuvarlar. Yay (A/a) bayrakları tek karakterlik 0/1'dir;
+    SVGO'nun sıkıştırdığı "a5 5 0 0110 10" gibi yazımda genel sayı düzeni bayrakları x ile
+    birleştirirdi. Tanınmayan bir şey çıkarsa d olduğu gibi döner.
+    """
+    tokens: List[str] = []
+    i, n = 0, len(d)
+    cmd = ""
+    argi = 0
+    while True:
+        i = _PATH_SEP.match(d, i).end()
+        if i >= n:
+            break
+        c = d[i]
+        if c.lower() in PATH_ARGS:
+            cmd, argi = c, 0
+            tokens.append(c)
+            i += 1
+            continue
+        count = PATH_ARGS.get(cmd.lower(), 0)
+        if not count:
+            return d
+        if cmd in "Aa" and argi % 7 in (3, 4):
+            if c not in "01":
+                return d
+            tokens.append(c)
+            i += 1
+        else:
+            m = _PATH_NUM.match(d, i)
+            if not m:
+                return d
+            tokens.append(format_number(float(m.group(0)), precision))
+            i = m.end()
+        argi += 1
+    return _join_path(tokens)
+
+
+def _precision_for(root: ET.Element, precision: int) -> int:
+    """viewBox 0 0 1 1 gibi küçük koordinat sistemlerinde 3 ondalık görünür bozulma yaratır."""
+    vb = root.get("viewBox")
+    try:
+        w, h = [abs(float(x)) for x in re.split(r"[\s,]+", vb.strip())][2:4]
+    except Exception:
+        return precision
+    span = max(w, h)
+    if span and span < 10:
+        return precision + 2
+    if span and span < 100:
+        return precision + 1
+    return precision
+
+
+def _referenced_ids(root: ET.Element) -> Set[str]:
+    ids: Set[str] = set()
+    for el in root.iter():
+        for k, v in el.attrib.items():
+            ids.update(_URL_REF.findall(v))
+            if _local(k) == "href" and v.startswith("#"):
+                ids.add(v[1:])
+        if _local(el.tag) == "style" and el.text:
+            ids.update(_URL_REF.findall(el.text))
+    return ids
+
+
+def _drop_unused_defs(root: ET.Element) -> None:
+    while True:
+        used = _referenced_ids(root)
+        removed = False
+        for defs in [e for e in root.iter() if _local(e.tag) == "defs"]:
+            for child in list(defs):
+                if _local(child.tag) == "style":
+                    continue
+                if child.get("id") not in used:
+                    defs.remove(child)
+                    removed = True
+        if not removed:
+            break
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if _local(child.tag) == "defs" and len(child) == 0:
+                parent.remove(child)
+
+
+def _clean(el: ET.Element, precision: int, in_text: bool = False) -> None:
+    for k in list(el.attrib):
+        if _is_editor(k):
+            del el.attrib[k]
+        elif _local(k) == "d" and not _ns(k):
+            el.set(k, round_path(el.attrib[k], precision))
+        elif _local(k) in NUMERIC_ATTRS and not _ns(k):
+            el.set(k, round_numbers(el.attrib[k], precision).strip())
+    in_text = in_text or _local(el.tag) in TEXT_TAGS
+    if not in_text and el.text is not None and not el.text.strip():
+        el.text = None
+    for child in list(el):
+        if _is_editor(child.tag) or _local(child.tag) == "metadata":
+            el.remove(child)
+            continue
+        if not in_text and child.tail is not None and not child.tail.strip():
+            child.tail = None
+        _clean(child, precision, in_text)
+
+
+def minify_svg(data: bytes, precision: int = DEFAULT_PRECISION) -> bytes:
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError:
+        return data
+    if _local(root.tag) != "svg":
+        return data
+    _clean(root, _precision_for(root, precision))
+    _drop_unused_defs(root)
+    out = ET.tostring(root, encoding="unicode").encode("utf-8")
+    return out if len(out) < len(data) else data
+
+
+def minify_file(src: str | Path, dst: str | Path | None = None,
+                precision: int = DEFAULT_PRECISION) -> tuple[int, int]:
+    """src'yi küçültüp dst'ye (varsayılan: yerinde) yazar. (önce, sonra) byte döner."""
+    src, dst = Path(src), Path(dst or src)
+    data = src.read_bytes()
+    out = minify_svg(data, precision)
+    if dst != src or out != data:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_suffix(dst.suffix + ".tmp")
+        tmp.write_bytes(out)
+        tmp.replace(dst)
+    return len(data), len(out)
+
+
+@dataclass
+class SvgResult:
+    rel: str
+    before: int
+    after: int
+    cached: bool = False
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+
+def iter_svgs(public_dir: Path, subdirs: Iterable[Path] = ASSET_SUBDIRS) -> Iterable[Path]:
+    for sub in subdirs:
+        base = public_dir / sub
+        if base.is_dir():
+            yield from sorted(base.rglob("*.svg"))
+
+
+def optimize_tree(public_dir: str | Path, dry_run: bool = False,
+                  precision: int = DEFAULT_PRECISION,
+                  cache: Optional[StatCache] = None) -> List[SvgResult]:
+    """
+    public/ altındaki SVG'leri yerinde küçültür. Önceki çalıştırmada küçültülmüş ve o günden beri
+    değişmemiş dosyalar (size, mtime_ns) önbellekten raporlanır, tekrar açılmaz.
+    """
+    public_dir = Path(public_dir)
+    cache = cache or StatCache(CACHE_DIR / "svgmin.json")
+    results: List[SvgResult] = []
+    seen: Dict[str, bool] = {}
+    for path in iter_svgs(public_dir):
+        rel = path.relative_to(public_dir).as_posix()
+        seen[rel] = True
+        st = os.stat(path)
+        hit = cache.lookup(rel, st)
+        if hit is not None and hit.get("precision") == precision:
+            results.append(SvgResult(rel, hit["before"], hit["after"], cached=True))
+            continue
+        data = path.read_bytes()
+        out = minify_svg(data, precision)
+        if not dry_run:
+            if out != data:
+                tmp = path.with_suffix(".svg.tmp")
+                tmp.write_bytes(out)
+                tmp.replace(path)
+            cache.store(rel, os.stat(path),
+                        {"before": len(data), "after": len(out), "precision": precision})
+        results.append(SvgResult(rel, len(data), len(out)))
+    if not dry_run:
+        cache.prune(seen)
+        cache.save()
+    return results
@@ -0,0 +1,206 @@
+"""
+Stack adlarına entity'ler arası referans indeksi (etiket -> hangi kayıtta, hangi alanda).
+
+    refs = TagRefIndex()
+    refs.set_entity("stack", stack)                 # tanımlar (stack.json adları)
+    refs.set_entity("projects", projects)           # referanslar (projects[].stack ...)
+    refs.unknown()                                  # stack.json'da olmayan referanslar
+    changes = refs.plan_rename("Tensorflow", "TensorFlow")
+    # -> {"projects": {id(eski_kayıt): yeni_kayıt, ...}, "stack": {...}}  (None: kaydı sil)
+
+- Anahtarlar büyük/küçük harf ve aksan duyarsız (search_index.fold): "Tensorflow" ile
+  "TensorFlow" aynı etiket; yeniden adlandırma yazımı düzeltmek için de kullanılır.
+- Yeni ad zaten varsa birleştirme: listelerde tekrar oluşmaz, fazla stack.json kaydı silinir.
+- Planlar kayıtları yerinde değiştirmez; dosya başına tek kayıtla uygulanır (GUI: sekme
+  replace_records, CLI: repo.save).
+- set_entity kimlik (id(kayıt)) farkıyla çalışır (bkz. services/quick_index.py).
+"""
+from __future__ import annotations
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.search_index import fold
+
+# entity -> stack adına referans veren liste alanları
+REF_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "projects": ("stack",),
+    "certificates": ("stack",),
+    "competitions": ("stack",),
+    "experience": ("stack", "tech"),     # tech: eski kayıtlarla uyum için stack'in kopyası
+}
+DEFINING_ENTITY = "stack"
+
+RecKey = Tuple[str, int]      # (entity, id(kayıt))
+
+
+def tag_key(tag: str) -> str:
+    return fold(tag.strip())
+
+
+@dataclass
+class TagInfo:
+    key: str
+    name: str           # stack.json adı ya da en sık yazım
+    uses: int           # referans veren kayıt sayısı
+    defined: bool
+    spellings: Dict[str, int]
+
+
+def rewrite_list(values: List[Any], old_key: str, new: str) -> List[Any]:
+    """old_key'e denk gelen öğeleri new ile değiştir; new zaten varsa tekrarlama (ilk konum kalır)."""
+    out, seen = [], set()
+    new_key = tag_key(new)
+    for v in values:
+        if isinstance(v, str):
+            k = tag_key(v)
+            if k == old_key:
+                v, k = new, new_key
+            if k in seen:
+                continue
+            seen.add(k)
+        out.append(v)
+    return out
+
+
+class TagRefIndex:
+    def __init__(self):
+        self.refs: Dict[str, Dict[RecKey, Tuple[Any, Tuple[str, ...]]]] = {}   # key -> kayıt -> (kayıt, alanlar)
+        self.defined: Dict[str, Dict[int, Any]] = {}                          # key -> id -> stack kaydı
+        self._spellings: Dict[str, Counter] = {}
+        self._seen: Dict[str, Dict[int, Tuple[Any, Dict[str, Tuple[str, ...]]]]] = {}
+
+    # ---------- güncelleme ----------
+    @staticmethod
+    def _record_keys(entity: str, rec: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+        """{anahtar: (alan, ...)} — kaydın referansları (ya da stack için tanımı)."""
+        if entity == DEFINING_ENTITY:
+            name = rec.get("name")
+            return {tag_key(name): ("name",)} if isinstance(name, str) and name.strip() else {}
+        out: Dict[str, List[str]] = {}
+        for field in REF_FIELDS.get(entity, ()):
+            vals = rec.get(field)
+            if not isinstance(vals, list):
+                continue
+            for v in vals:
+                if isinstance(v, str) and v.strip():
+                    fields = out.setdefault(tag_key(v), [])
+                    if field not in fields:
+                        fields.append(field)
+        return {k: tuple(f) for k, f in out.items()}
+
+    def set_entity(self, entity: str, records: List[Any]) -> None:
+        if entity != DEFINING_ENTITY and entity not in REF_FIELDS:
+            return
+        seen = self._seen.setdefault(entity, {})
+        current = {id(r): r for r in records if isinstance(r, dict)}
+        for k in [k for k in seen if k not in current]:
+            rec, keys = seen.pop(k)
+            self._drop(entity, k, rec, keys)
+        for k, rec in current.items():
+            if k not in seen:
+                keys = self._record_keys(entity, rec)
+                seen[k] = (rec, keys)
+                self._put(entity, k, rec, keys)
+
+    def _put(self, entity, k, rec, keys):
+        for key, fields in keys.items():
+            if entity == DEFINING_ENTITY:
+                self.defined.setdefault(key, {})[k] = rec
+                continue
+            self.refs.setdefault(key, {})[(entity, k)] = (rec, fields)
+            sp = self._spellings.setdefault(key, Counter())
+            for v in self._spelled(rec, fields, key):
+                sp[v] += 1
+
+    def _drop(self, entity, k, rec, keys):
+        for key, fields in keys.items():
+            if entity == DEFINING_ENTITY:
+                d = self.defined.get(key)
+                if d is not None:
+                    d.pop(k, None)
+                    if not d:
+                        del self.defined[key]
+                continue
+            r = self.refs.get(key)
+            if r is not None:
+                r.pop((entity, k), None)
+                if not r:
+                    del self.refs[key]
+            sp = self._spellings.get(key)
+            if sp is not None:
+                for v in self._spelled(rec, fields, key):
+                    sp[v] -= 1
+                    if sp[v] <= 0:
+                        del sp[v]
+                if not sp:
+                    del self._spellings[key]
+
+    @staticmethod
+    def _spelled(rec, fields, key) -> set:
+        """Kayıttaki bu anahtarın yazımları (experience stack/tech aynı listeyi taşır: bir kez)."""
+        return {v.strip() for f in fields for v in rec.get(f) or []
+                if isinstance(v, str) and tag_key(v) == key}
+
+    # ---------- sorgu ----------
+    def name_of(self, key: str) -> str:
+        for rec in self.defined.get(key, {}).values():
+            return rec.get("name", "").strip()
+        sp = self._spellings.get(key)
+        return sp.most_common(1)[0][0] if sp else key
+
+    def refs_of(self, tag: str) -> List[Tuple[str, Any, Tuple[str, ...]]]:
+        return [(ent, rec, fields) for (ent, _k), (rec, fields) in self.refs.get(tag_key(tag), {}).items()]
+
+    def tags(self) -> List[TagInfo]:
+        keys = set(self.refs) | set(self.defined)
+        out = [TagInfo(k, self.name_of(k), len(self.refs.get(k, ())), k in self.defined,
+                       dict(self._spellings.get(k, {}))) for k in keys]
+        out.sort(key=lambda t: (-t.uses, t.name.casefold()))
+        return out
+
+    def unknown(self) -> List[TagInfo]:
+        """Hiçbir stack.json kaydına karşılık gelmeyen referanslar."""
+        return [t for t in self.tags() if not t.defined]
+
+    # ---------- yeniden adlandırma / birleştirme ----------
+    def plan_rename(self, old: str, new: str) -> Dict[str, Dict[int, Optional[Dict[str, Any]]]]:
+        """
+        entity -> {id(eski kayıt): yeni kayıt | None (sil)}. Yazım düzeltmesi (aynı anahtar) de
+        desteklenir: tüm farklı yazımlar new'e çekilir.
+        """
+        old_key, new = tag_key(old), new.strip()
+        new_key = tag_key(new)
+        if not old_key or not new:
+            return {}
+        changes: Dict[str, Dict[int, Optional[Dict[str, Any]]]] = {}
+        for (entity, k), (rec, fields) in self.refs.get(old_key, {}).items():
+            updated = dict(rec)
+            for f in fields:
+                updated[f] = rewrite_list(rec.get(f) or [], old_key, new)
+            if updated != rec:
+                changes.setdefault(entity, {})[k] = updated
+        # stack.json: hedef zaten tanımlıysa (başka kayıt) eskiyi sil, değilse adını değiştir
+        olds = self.defined.get(old_key, {})
+        target = [k for k in self.defined.get(new_key, {}) if new_key != old_key or k not in olds]
+        keep_one = not target
+        for k, rec in olds.items():
+            if keep_one:
+                keep_one = False
+                if rec.get("name") != new:
+                    changes.setdefault(DEFINING_ENTITY, {})[k] = dict(rec, name=new)
+            else:
+                changes.setdefault(DEFINING_ENTITY, {})[k] = None
+        return changes
+
+
+def apply_changes(records: List[Any], changes: Dict[int, Optional[Dict[str, Any]]]) -> List[Any]:
+    """plan_rename sonucunu bir listeye uygula (yeni liste; sıra korunur)."""
+    out = []
+    for rec in records:
+        if id(rec) in changes:
+            rec = changes[id(rec)]
+            if rec is None:
+                continue
+        out.append(rec)
+    return out
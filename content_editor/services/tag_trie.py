@@ -0,0 +1,197 @@
+"""
+Stack / areas / topics alanları için önek trie'si (CommaListEntry otomatik tamamlama).
+
+    vocab = TagVocabulary()
+    vocab.set_entity("projects", projects)       # ilk kurulum ya da kayıt sonrası (fark uygulanır)
+    vocab.complete("stack", "pyt")               # -> ["Python", "PyTorch", ...] (sıklığa göre)
+
+- Eşleşme büyük/küçük harf ve aksan duyarsız (search_index.fold); "Pytorch" ile "PyTorch" aynı
+  etiket sayılır. Gösterilen yazım: stack.json'daki ad, yoksa en sık kullanılan yazım.
+- Her düğüm alt ağacının en sık TOP_K etiketini önbellekte tutar; tamamlama önek uzunluğu kadar
+  adım + önbellek okumasıdır (on binlerce etikette de anlık). Sayı artınca yol üzerindeki önbellekler
+  yerinde güncellenir; azalınca ilgili düğümler geçersizlenir ve ilk sorguda çocukların
+  önbelleklerinden birleştirilerek yeniden kurulur.
+- set_entity kimlik (id(kayıt)) farkıyla çalışır (bkz. services/quick_index.py).
+"""
+from __future__ import annotations
+import heapq
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from services.search_index import fold
+
+TOP_K = 8
+BULK_ADD = 256      # bundan çok ekleme: önbellekler yerinde güncellenmez, tembel kurulur
+
+# tür -> [(entity, alan)]; experience eski kayıtlarda sadece "tech" taşır
+TAG_SOURCES: Dict[str, List[Tuple[str, str]]] = {
+    "stack": [("stack", "name"), ("projects", "stack"), ("certificates", "stack"),
+              ("competitions", "stack"), ("experience", "stack")],
+    "areas": [("projects", "areas")],
+    "topics": [("projects", "topics")],
+}
+_FALLBACK = {("experience", "stack"): "tech"}
+
+
+class _Node:
+    __slots__ = ("children", "top", "tag")
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = {}
+        self.top: Optional[List[Tuple[int, str]]] = None   # [(-sayı, anahtar)], None: yeniden kur
+        self.tag: Optional[str] = None                      # bu düğümde biten anahtar
+
+
+class TagTrie:
+    def __init__(self):
+        self._root = _Node()
+        self.counts: Dict[str, int] = {}                 # anahtar (fold) -> kullanım sayısı
+        self._spellings: Dict[str, Counter] = {}         # anahtar -> yazım sayıları
+        self.canonical: Dict[str, str] = {}              # anahtar -> stack.json adı
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    # ---------- güncelleme ----------
+    def add(self, tag: str, n: int = 1, keep_top: bool = True) -> None:
+        key = fold(tag.strip())
+        if not key:
+            return
+        self._spellings.setdefault(key, Counter())[tag.strip()] += n
+        count = self.counts.get(key, 0) + n
+        self.counts[key] = count
+        node = self._root
+        path = [node]
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                node.children[ch] = nxt = _Node()
+                nxt.top = [] if keep_top else None
+            node = nxt
+            path.append(node)
+        node.tag = key
+        if not keep_top:
+            for p in path:
+                p.top = None
+            return
+        entry = (-count, key)
+        for p in path:
+            if p.top is None:
+                continue
+            top = [e for e in p.top if e[1] != key]
+            if len(top) < TOP_K or entry < top[-1]:
+                top.append(entry)
+                top.sort()
+                del top[TOP_K:]
+            p.top = top
+
+    def add_many(self, tags: Iterable[str]) -> None:
+        """Toplu ekleme (load): önbellekler güncellenmez, ilk sorguda kurulur."""
+        for tag, n in Counter(t.strip() for t in tags).items():
+            self.add(tag, n, keep_top=False)
+        self._top(self._root)       # önbellekleri şimdi kur (load arka planda; ilk tuş anlık)
+
+    def remove(self, tag: str, n: int = 1) -> None:
+        key = fold(tag.strip())
+        count = self.counts.get(key)
+        if count is None:
+            return
+        sp = self._spellings.get(key)
+        if sp is not None:
+            sp[tag.strip()] -= n
+            if sp[tag.strip()] <= 0:
+                del sp[tag.strip()]
+        count -= n
+        node, path = self._root, [self._root]
+        for ch in key:
+            node = node.children[ch]
+            path.append(node)
+        if count <= 0:
+            del self.counts[key]
+            self._spellings.pop(key, None)
+            node.tag = None
+        else:
+            self.counts[key] = count
+        # sıra düştü: bu etiketi önbellekte tutan düğümler yeniden kurulacak
+        for p in path:
+            if p.top is not None and any(e[1] == key for e in p.top):
+                p.top = None
+
+    # ---------- sorgu ----------
+    def _top(self, node: _Node) -> List[Tuple[int, str]]:
+        if node.top is None:
+            cands = [t for child in node.children.values() for t in self._top(child)]
+            if node.tag is not None:
+                cands.append((-self.counts[node.tag], node.tag))
+            node.top = heapq.nsmallest(TOP_K, cands)
+        return node.top
+
+    def complete(self, prefix: str, k: int = TOP_K, exclude: Iterable[str] = ()) -> List[str]:
+        key = fold(prefix.strip())
+        node = self._root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        skip = {fold(x) for x in exclude}
+        return [self.display(t) for _c, t in self._top(node) if t not in skip][:k]
+
+    def display(self, key: str) -> str:
+        name = self.canonical.get(key)
+        if name:
+            return name
+        sp = self._spellings.get(key)
+        return sp.most_common(1)[0][0] if sp else key
+
+
+class TagVocabulary:
+    """Tür başına bir TagTrie; entity listelerinden beslenir."""
+
+    def __init__(self):
+        self.tries: Dict[str, TagTrie] = {kind: TagTrie() for kind in TAG_SOURCES}
+        self._seen: Dict[str, Dict[int, Tuple[Any, List[Tuple[str, str]]]]] = {}
+
+    @staticmethod
+    def record_tags(entity: str, rec: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """[(tür, etiket)] — kaydın tamamlamaya kattığı değerler."""
+        out = []
+        for kind, sources in TAG_SOURCES.items():
+            for ent, field in sources:
+                if ent != entity:
+                    continue
+                v = rec.get(field)
+                if not v and (ent, field) in _FALLBACK:
+                    v = rec.get(_FALLBACK[(ent, field)])
+                vals = v if isinstance(v, list) else [v]
+                out += [(kind, x) for x in vals if isinstance(x, str) and x.strip()]
+        return out
+
+    def set_entity(self, entity: str, records: List[Any]) -> None:
+        seen = self._seen.setdefault(entity, {})
+        current = {id(r): r for r in records if isinstance(r, dict)}
+        for k in [k for k in seen if k not in current]:
+            for kind, tag in seen.pop(k)[1]:
+                self.tries[kind].remove(tag)
+                if entity == "stack":
+                    self.tries[kind].canonical.pop(fold(tag.strip()), None)
+        added: Dict[str, List[str]] = {}
+        for k, rec in current.items():
+            if k in seen:
+                continue
+            tags = self.record_tags(entity, rec)
+            seen[k] = (rec, tags)
+            for kind, tag in tags:
+                added.setdefault(kind, []).append(tag)
+        for kind, tags in added.items():
+            trie = self.tries[kind]
+            if len(tags) > BULK_ADD:
+                trie.add_many(tags)
+            else:
+                for tag in tags:
+                    trie.add(tag)
+            if entity == "stack":
+                trie.canonical.update((fold(t.strip()), t.strip()) for t in tags)
+
+    def complete(self, kind: str, prefix: str, k: int = TOP_K, exclude: Iterable[str] = ()) -> List[str]:
+        trie = self.tries.get(kind)
+        return trie.complete(prefix, k, exclude) if trie is not None and prefix.strip() else []
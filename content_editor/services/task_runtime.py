@@ -0,0 +1,237 @@
+"""
+Tk için ortak arka plan iş çalıştırıcısı (tüm sekmeler paylaşır).
+
+    handle = app.tasks.run_thread(work, path, on_done=show, on_progress=bar_update, title="Preview")
+    handle.cancel()
+
+- run_thread(fn, ...): fn(ctx, *args) thread havuzunda çalışır; ctx.progress(done, total, msg)
+  ilerleme bildirir, ctx.cancelled / ctx.check() iptali sorar.
+- run_process(fn, ...): fn(*args) süreç havuzunda (CPU ağırlıklı iş; fn ve argümanlar picklable olmalı).
+- post(fn, *args): herhangi bir thread'den Tk thread'inde çalıştırılacak çağrı.
+- Sonuçlar/ilerleme tek kuyruktan after() ile okunur; bir turda en fazla FRAME_BUDGET kadar
+  çalışılır, kalan sonraki tura kalır -> arayüz bir kareden uzun bloklanmaz.
+- Geri çağrılar (on_done / on_error / on_progress / on_cancel) her zaman Tk thread'inde çağrılır.
+  on_error verilmezse hata messagebox ile gösterilir. İptal edilen işin sonucu on_done'a gitmez.
+"""
+from __future__ import annotations
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from tkinter import messagebox
+from typing import Any, Callable, Dict, Optional
+
+POLL_MS = 16            # iş varken (~1 kare)
+IDLE_POLL_MS = 100      # boştayken post() gecikmesi
+FRAME_BUDGET = 0.008    # bir turda geri çağrılara ayrılan süre (sn)
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class TaskContext:
+    """Worker tarafı: ilerleme bildirimi ve iptal kontrolü."""
+
+    def __init__(self, handle: "TaskHandle"):
+        self._handle = handle
+
+    @property
+    def cancelled(self) -> bool:
+        return self._handle._cancel.is_set()
+
+    @property
+    def cancel_event(self) -> threading.Event:
+        return self._handle._cancel
+
+    def check(self) -> None:
+        if self._handle._cancel.is_set():
+            raise TaskCancelled(self._handle.title)
+
+    def progress(self, done: float, total: Optional[float] = None, message: str = "") -> None:
+        # sık çağrılar birikmesin: sadece en son değer teslim edilir
+        h = self._handle
+        with h._lock:
+            first = h._progress is None
+            h._progress = (done, total, message)
+        if first:
+            h._runtime._queue.put(("progress", h))
+
+
+class TaskHandle:
+    def __init__(self, runtime: "TaskRuntime", title: str, on_done, on_error, on_progress, on_cancel):
+        self.id = next(runtime._ids)
+        self.title = title
+        self._runtime = runtime
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._progress = None
+        self._future: Optional[Future] = None
+        self._finished = False
+        self.on_done, self.on_error = on_done, on_error
+        self.on_progress, self.on_cancel = on_progress, on_cancel
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._finished
+
+    def cancel(self) -> None:
+        """İptal ister. Henüz başlamadıysa hiç çalışmaz; çalışıyorsa ctx.cancelled True olur."""
+        if self._finished or self._cancel.is_set():
+            return
+        self._cancel.set()
+        if self._future is not None:
+            self._future.cancel()
+
+
+class TaskRuntime:
+    def __init__(self, root, threads: int = 4, processes: Optional[int] = None):
+        self.root = root
+        self._threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="task")
+        self._procs: Optional[ProcessPoolExecutor] = None
+        self._n_procs = processes or os.cpu_count() or 1
+        self._queue: "queue.Queue" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._active: Dict[int, TaskHandle] = {}
+        self._after_id = None
+        self._closed = False
+        self._schedule(IDLE_POLL_MS)
+
+    # ---------- gönderim ----------
+    def run_thread(self, fn: Callable[..., Any], *args, on_done=None, on_error=None,
+                   on_progress=None, on_cancel=None, title: str = "Task", **kwargs) -> TaskHandle:
+        h = TaskHandle(self, title, on_done, on_error, on_progress, on_cancel)
+        ctx = TaskContext(h)
+
+        def call():
+            if h._cancel.is_set():
+                raise TaskCancelled(title)
+            return fn(ctx, *args, **kwargs)
+
+        return self._track(h, self._threads.submit(call))
+
+    def run_process(self, fn: Callable[..., Any], *args, on_done=None, on_error=None,
+                    on_cancel=None, title: str = "Task") -> TaskHandle:
+        if self._procs is None:
+            self._procs = ProcessPoolExecutor(max_workers=self._n_procs)
+        h = TaskHandle(self, title, on_done, on_error, None, on_cancel)
+        return self._track(h, self._procs.submit(fn, *args))
+
+    def post(self, fn: Callable[..., Any], *args) -> None:
+        """Thread-safe: fn(*args) bir sonraki turda Tk thread'inde çağrılır."""
+        self._queue.put(("call", fn, args))
+
+    def _track(self, h: TaskHandle, fut: Future) -> TaskHandle:
+        h._future = fut
+        self._active[h.id] = h
+        fut.add_done_callback(lambda f: self._queue.put(("done", h, f)))
+        self._schedule(POLL_MS)
+        return h
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._active)
+
+    # ---------- Tk tarafı ----------
+    def _schedule(self, ms: int):
+        if self._closed:
+            return
+        if self._after_id is not None:
+            if ms >= IDLE_POLL_MS:
+                return
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = self.root.after(ms, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        deadline = time.perf_counter() + FRAME_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._dispatch(msg)
+            except Exception:
+                traceback.print_exc()
+        more = not self._queue.empty()
+        self._schedule(POLL_MS if (self._active or more) else IDLE_POLL_MS)
+
+    def _dispatch(self, msg):
+        kind = msg[0]
+        if kind == "call":
+            msg[1](*msg[2])
+        elif kind == "progress":
+            h: TaskHandle = msg[1]
+            with h._lock:
+                p, h._progress = h._progress, None
+            if p is not None and h.on_progress and not h._cancel.is_set() and not h._finished:
+                h.on_progress(*p)
+        elif kind == "done":
+            h, fut = msg[1], msg[2]
+            h._finished = True
+            self._active.pop(h.id, None)
+            if h._cancel.is_set() or fut.cancelled():
+                if h.on_cancel:
+                    h.on_cancel()
+                return
+            exc = fut.exception()
+            if isinstance(exc, TaskCancelled):
+                if h.on_cancel:
+                    h.on_cancel()
+            elif exc is not None:
+                self._report(h, exc)
+            elif h.on_done:
+                h.on_done(fut.result())
+
+    def _report(self, h: TaskHandle, exc: BaseException):
+        if h.on_error:
+            h.on_error(exc)
+            return
+        traceback.print_exception(type(exc), exc, exc.__traceback__, file=sys.stderr)
+        messagebox.showerror(h.title, f"{type(exc).__name__}: {exc}")
+
+    def cancel_all(self):
+        for h in list(self._active.values()):
+            h.cancel()
+
+    def shutdown(self):
+        self._closed = True
+        self.cancel_all()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._procs is not None:
+            self._procs.shutdown(wait=False, cancel_futures=True)
+
+
+_DEFAULT: Optional[TaskRuntime] = None
+
+
+def set_default_runtime(rt: TaskRuntime) -> None:
+    global _DEFAULT
+    _DEFAULT = rt
+
+
+def get_runtime(widget=None) -> TaskRuntime:
+    """Uygulamanın runtime'ı; yoksa (widget tek başına kullanılıyorsa) onun toplevel'ına bir tane kurar."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        if widget is None:
+            raise RuntimeError("no TaskRuntime configured")
+        _DEFAULT = TaskRuntime(widget.winfo_toplevel())
+    return _DEFAULT
@@ -0,0 +1,179 @@
+"""
+Liste sekmeleri için geri al / yinele geçmişi (Ctrl+Z / Ctrl+Y).
+
+    hist = UndoHistory()
+    before = list(data)                 # geçici sığ kopya (tutulmaz)
+    ... data değişir ...
+    hist.record(before, data)
+    step = hist.undo(data)              # data yerinde geri alınır; step.removed / step.inserted
+
+- Tam liste kopyası yerine değişen aralıklar saklanır: önce/sonra listelerinin kimlikçe (is) ortak
+  başı ve sonu atılır; ortada kalan kısımda yerinde duran kayıtlar (sonraki sırası artan en uzun alt
+  dizi) çapa olur, aralarındaki her değişen parça ayrı bir splice (başlangıç, çıkan, giren) olur.
+  Birbirinden uzak iki kaydın toplu silinmesi/taşınması iki küçük splice'tır, aradaki liste değil.
+  Kayıt dict'leri paylaşılır (sekmeler kayıtları yerinde değiştirmez, yenisini koyar) ->
+  bellek düzenlemenin boyutuyla orantılı, liste uzunluğundan bağımsız.
+- Aynı coalesce anahtarıyla COALESCE_S içinde gelen düzenlemeler (ör. art arda Up/Down) tek adım.
+- Kaydetme sekmenin write-behind'ı ile: hızlı Ctrl+Z'ler tek dosya yazımında birleşir.
+"""
+from __future__ import annotations
+import time
+from bisect import bisect_left
+from collections import deque
+from itertools import compress, count, islice
+from operator import is_not, lt
+from dataclasses import dataclass, field
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+MAX_STEPS = 200
+COALESCE_S = 1.0
+SPLICE_COST = 4         # parça başına ek yük (kayıt slotu cinsinden); tek splice daha ucuzsa o seçilir
+
+
+@dataclass
+class Splice:
+    start: int
+    removed: Tuple[Any, ...]
+    inserted: Tuple[Any, ...]
+
+    def apply(self, data: List[Any]) -> None:
+        data[self.start:self.start + len(self.removed)] = self.inserted
+
+    def revert(self, data: List[Any]) -> None:
+        data[self.start:self.start + len(self.inserted)] = self.removed
+
+
+def splice_diff(before: Sequence[Any], after: Sequence[Any]) -> Optional[Splice]:
+    """Kimlikçe ortak baş/son dışındaki aralık; değişiklik yoksa None."""
+    n, m = len(before), len(after)
+    lim = min(n, m)
+    # ilk farklı konum; compress/count/map C tarafında döner (Python döngüsünün ~2 katı hız)
+    i = next(compress(count(), map(is_not, before, after)), lim)
+    j = next(compress(count(), map(is_not, islice(reversed(before), lim - i),
+                                   islice(reversed(after), lim - i))), lim - i)
+    if i == n == m:
+        return None
+    return Splice(i, tuple(before[i:n - j]), tuple(after[i:m - j]))
+
+
+def _increasing_run(seq: List[int]) -> List[int]:
+    """seq'in kesin artan en uzun alt dizisinin indeksleri (O(n log n))."""
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    prev = [-1] * len(seq)
+    for i, v in enumerate(seq):
+        k = bisect_left(tails, v)
+        if k:
+            prev[i] = tail_idx[k - 1]
+        if k == len(tails):
+            tails.append(v)
+            tail_idx.append(i)
+        else:
+            tails[k], tail_idx[k] = v, i
+    out: List[int] = []
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        out.append(i)
+        i = prev[i]
+    return out[::-1]
+
+
+def diff_splices(before: Sequence[Any], after: Sequence[Any]) -> List[Splice]:
+    """
+    before -> after için sırayla uygulanacak splice'lar (değişiklik yoksa boş). Her parçanın
+    başlangıcı önceki parçalar uygulanmış listeye göredir; geri alma ters sırada yapılır.
+    """
+    whole = splice_diff(before, after)
+    if whole is None:
+        return []
+    mid_b, mid_a = whole.removed, whole.inserted
+    if not mid_b or not mid_a:
+        return [whole]
+    pos = {id(r): k for k, r in enumerate(mid_a)}
+    if len(pos) != len(mid_a) or len({id(r) for r in mid_b}) != len(mid_b):
+        return [whole]      # aynı kayıt iki kez: kimlikle eşleme belirsiz
+    common = [(b, pos[id(r)]) for b, r in enumerate(mid_b) if id(r) in pos]
+    seq = [a for _b, a in common]
+    if not all(map(lt, seq, islice(seq, 1, None))):
+        # taşınan kayıtlar: yerinde kalanlar en uzun artan alt dizi, diğerleri çık + gir
+        common = [common[k] for k in _increasing_run(seq)]
+    parts: List[Splice] = []
+    pb = pa = -1
+    for b, a in common + [(len(mid_b), len(mid_a))]:
+        if b - pb > 1 or a - pa > 1:
+            parts.append(Splice(whole.start + pa + 1, mid_b[pb + 1:b], mid_a[pa + 1:a]))
+        pb, pa = b, a
+    cost = sum(len(p.removed) + len(p.inserted) for p in parts) + SPLICE_COST * len(parts)
+    if cost >= len(mid_b) + len(mid_a) + SPLICE_COST:
+        return [whole]      # ör. sıralama: her şey yer değiştirdi
+    return parts
+
+
+@dataclass
+class Step:
+    parts: List[Splice] = field(default_factory=list)
+    key: Optional[Hashable] = None
+    at: float = 0.0
+
+    @property
+    def removed(self) -> List[Any]:
+        return [r for p in self.parts for r in p.removed]
+
+    @property
+    def inserted(self) -> List[Any]:
+        return [r for p in self.parts for r in p.inserted]
+
+
+class UndoHistory:
+    def __init__(self, max_steps: int = MAX_STEPS):
+        self._undo: "deque[Step]" = deque(maxlen=max_steps)
+        self._redo: List[Step] = []
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def record(self, before: Sequence[Any], after: Sequence[Any],
+               coalesce: Optional[Hashable] = None) -> bool:
+        """before -> after farkını yeni adım olarak ekle (değişiklik yoksa False)."""
+        parts = diff_splices(before, after)
+        if not parts:
+            return False
+        now = time.monotonic()
+        self._redo.clear()
+        last = self._undo[-1] if self._undo else None
+        if coalesce is not None and last is not None and last.key == coalesce and now - last.at < COALESCE_S:
+            last.parts.extend(parts)
+            last.at = now
+        else:
+            self._undo.append(Step(parts, coalesce, now))
+        return True
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self, data: List[Any]) -> Optional[Step]:
+        """Son adımı data üzerinde geri al; dönen adımda removed = geri gelenler, inserted = gidenler."""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        for p in reversed(step.parts):
+            p.revert(data)
+        self._redo.append(step)
+        return step
+
+    def redo(self, data: List[Any]) -> Optional[Step]:
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        for p in step.parts:
+            p.apply(data)
+        step.key = None         # yinelenen adım sonraki düzenlemeyle birleşmesin
+        self._undo.append(step)
+        return step
+
+    def __len__(self) -> int:
+        return len(self._undo)
@@ -0,0 +1,312 @@
+"""
+Uzak (hot-link) görselleri yerel public/ ağacına indirme ("vendoring").
+
+Taranan alanlar:
+  - stack[].logo_url           -> logo_path doldurulur (logo_url kaynak olarak kalır)
+  - socials[].icon, *.icon     -> yerinde yerel yol
+  - *.images[i]                -> yerinde yerel yol
+  - info.profile_photo.url     -> profile_photo.path (+ photo), url = None
+  - info.university_logo.path|url, info.photo
+
+Dosyalar public/images/vendor/<host>/<ad>-<urlhash>.<ext> altına yazılır; her kayıtta
+"vendored": {"<yerel yol>": "<kaynak url>"} tutulur (liste konumuna değil dosyaya bağlı: görseller
+yeniden sıralansa da doğru dosya yenilenir). --refresh bu URL'leri koşullu istekle
+(HttpCache: ETag/Last-Modified) yeniden çeker; kayıtta artık geçmeyen yollar atlanır.
+İndirme: sınırlı thread havuzu, host başına eşzamanlılık sınırı, geri çekilmeli yeniden deneme.
+"""
+from __future__ import annotations
+import hashlib
+import mimetypes
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, unquote
+
+from settings import ENTITY_NAMES, content_to_public_dir
+from services.http_cache import HTTP_CACHE, HttpCache
+
+VENDOR_DIR = "images/vendor"
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg", ".ico", ".bmp", ".avif")
+PER_HOST = 4
+
+
+def _is_url(s: Any) -> bool:
+    return isinstance(s, str) and s.strip().lower().startswith(("http://", "https://"))
+
+
+@dataclass
+class RemoteRef:
+    entity: str
+    index: Optional[int]     # info için None
+    field: str               # "logo_url", "icon", "images[2]", "profile_photo.url" ...
+    url: str
+
+    def label(self) -> str:
+        return f"{self.entity}[{self.index}].{self.field}" if self.index is not None else f"{self.entity}.{self.field}"
+
+
+def _record_refs(entity: str, index: Optional[int], rec: Dict[str, Any]) -> List[RemoteRef]:
+    out: List[RemoteRef] = []
+    if entity == "stack":
+        if _is_url(rec.get("logo_url")) and not rec.get("logo_path"):
+            out.append(RemoteRef(entity, index, "logo_url", rec["logo_url"].strip()))
+    if _is_url(rec.get("icon")):
+        out.append(RemoteRef(entity, index, "icon", rec["icon"].strip()))
+    for i, v in enumerate(rec.get("images") or []):
+        if _is_url(v):
+            out.append(RemoteRef(entity, index, f"images[{i}]", v.strip()))
+    if entity == "info":
+        for grp in ("profile_photo", "university_logo"):
+            g = rec.get(grp) or {}
+            for k in ("url", "path"):
+                if _is_url(g.get(k)):
+                    out.append(RemoteRef(entity, index, f"{grp}.{k}", g[k].strip()))
+                    break
+        if _is_url(rec.get("photo")) and not any(r.field.startswith("profile_photo") for r in out):
+            out.append(RemoteRef(entity, index, "photo", rec["photo"].strip()))
+    return out
+
+
+def find_remote_refs(entities: Dict[str, Any]) -> List[RemoteRef]:
+    refs: List[RemoteRef] = []
+    for name, data in entities.items():
+        if isinstance(data, list):
+            for i, rec in enumerate(data):
+                if isinstance(rec, dict):
+                    refs.extend(_record_refs(name, i, rec))
+        elif isinstance(data, dict):
+            refs.extend(_record_refs(name, None, data))
+    return refs
+
+
+def apply_local(rec: Dict[str, Any], ref: RemoteRef, rel: str) -> None:
+    """Kayıttaki referansı yerel yola çevirir ve kaynak URL'i rec['vendored'][rel]'e yazar."""
+    vendored = rec.setdefault("vendored", {})
+    vendored[rel] = ref.url
+    f = ref.field
+    if f == "logo_url":
+        rec["logo_path"] = rel
+    elif f.startswith("images["):
+        i = int(f[len("images["):-1])
+        rec["images"][i] = rel
+        if rec.get("icon") == ref.url:      # kapak aynı görselse onu da çevir
+            rec["icon"] = rel
+    elif f in ("profile_photo.url", "profile_photo.path", "photo"):
+        rec["profile_photo"] = {"path": rel, "url": None}
+        rec["photo"] = rel
+    elif f.startswith("university_logo."):
+        rec["university_logo"] = {"path": rel, "url": None}
+    else:
+        rec[f] = rel
+
+
+def _strings(value: Any, out: set) -> set:
+    if isinstance(value, str):
+        out.add(value)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _strings(v, out)
+    elif isinstance(value, list):
+        for v in value:
+            _strings(v, out)
+    return out
+
+
+def vendored_files(rec: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Kayıtta hâlâ kullanılan (rel, url) çiftleri. Eski biçimdeki alan anahtarları ("images[2]")
+    yalnız o konumdaki dosya adı URL'in özetini taşıyorsa kabul edilir.
+    """
+    vendored = rec.get("vendored")
+    if not isinstance(vendored, dict):
+        return []
+    used = _strings({k: v for k, v in rec.items() if k != "vendored"}, set())
+    out: List[Tuple[str, str]] = []
+    for key, url in vendored.items():
+        if not isinstance(url, str):
+            continue
+        rel = key if key.startswith(VENDOR_DIR + "/") else _current_value(rec, key)
+        if not (isinstance(rel, str) and rel.startswith(VENDOR_DIR + "/") and rel in used):
+            continue
+        if rel != key and Path(rel).stem.rsplit("-", 1)[-1] != _url_hash(url):
+            continue
+        out.append((rel, url))
+    return out
+
+
+def prune_vendored(rec: Dict[str, Any]) -> None:
+    """Düzenlenen kayıtta artık geçmeyen kaynakları at, eski anahtarları yola çevir."""
+    if "vendored" not in rec:
+        return
+    files = vendored_files(rec)
+    if files:
+        rec["vendored"] = dict(files)
+    else:
+        del rec["vendored"]
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+
+
+def vendored_rel(url: str, content_type: Optional[str] = None) -> str:
+    parts = urlsplit(url)
+    host = re.sub(r"[^0-9A-Za-z.-]+", "_", parts.hostname or "unknown")
+    name = unquote(Path(parts.path).name) or "asset"
+    stem, ext = Path(name).stem, Path(name).suffix.lower()
+    if ext not in IMAGE_EXTS:
+        ext = mimetypes.guess_extension((content_type or "").split(";")[0].strip()) or ".img"
+        if ext == ".jpe":
+            ext = ".jpg"
+    stem = re.sub(r"[^0-9A-Za-z_-]+", "_", stem).strip("_")[:60] or "asset"
+    return f"{VENDOR_DIR}/{host}/{stem}-{_url_hash(url)}{ext}"
+
+
+class Downloader:
+    """Sınırlı eşzamanlılık + host başına sınır + yeniden deneme ile HttpCache üzerinden indirir."""
+
+    def __init__(self, http: HttpCache = HTTP_CACHE, max_workers: int = 8, retries: int = 3,
+                 backoff: float = 0.5, per_host: int = PER_HOST):
+        self.http = http
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.per_host = per_host
+        self._hosts: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_sem(self, url: str) -> threading.Semaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            sem = self._hosts.get(host)
+            if sem is None:
+                sem = self._hosts[host] = threading.Semaphore(self.per_host)
+            return sem
+
+    def fetch(self, url: str) -> Tuple[bytes, Optional[str]]:
+        last: Optional[BaseException] = None
+        for attempt in range(self.retries + 1):
+            try:
+                with self._host_sem(url):
+                    body = self.http.fetch(url)
+                meta = self.http.cached_meta(url) or {}
+                return body, meta.get("content_type")
+            except HTTPError as e:
+                last = e
+                if e.code < 500 and e.code != 429:   # kalıcı hata, tekrar deneme
+                    break
+            except Exception as e:
+                last = e
+            if attempt < self.retries:
+                time.sleep(self.backoff * (2 ** attempt))
+        raise last  # type: ignore[misc]
+
+    def fetch_all(self, urls: List[str]) -> Dict[str, Any]:
+        """url -> (bytes, content_type) ya da Exception."""
+        unique = list(dict.fromkeys(urls))
+        out: Dict[str, Any] = {}
+        if not unique:
+            return out
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as ex:
+            futs = {u: ex.submit(self.fetch, u) for u in unique}
+            for u, fut in futs.items():
+                try:
+                    out[u] = fut.result()
+                except Exception as e:
+                    out[u] = e
+        return out
+
+
+@dataclass
+class VendorReport:
+    vendored: List[Tuple[str, str, str]] = field(default_factory=list)    # (label, url, rel)
+    refreshed: List[Tuple[str, str]] = field(default_factory=list)        # (rel, url) içerik değişti
+    failed: List[Tuple[str, str, str]] = field(default_factory=list)      # (label, url, hata)
+    saved_entities: List[str] = field(default_factory=list)
+
+
+def _write_bytes(path: Path, data: bytes) -> bool:
+    """İçerik aynıysa dokunma. Yazıldıysa True."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
+
+
+def vendor_assets(repo, refresh: bool = False, dry_run: bool = False,
+                  downloader: Downloader | None = None) -> VendorReport:
+    downloader = downloader or Downloader()
+    public_dir = content_to_public_dir(repo.content_root)
+    entities = {name: repo.load(name) for name in ENTITY_NAMES}
+    report = VendorReport()
+
+    refs = find_remote_refs(entities)
+    # refresh: önceden indirilmiş dosyaların kaynakları
+    stale: List[Tuple[str, str]] = []   # (rel, url)
+    if refresh:
+        for data in entities.values():
+            recs = data if isinstance(data, list) else [data]
+            for rec in recs:
+                if isinstance(rec, dict):
+                    stale.extend(vendored_files(rec))
+        stale = list(dict.fromkeys(stale))
+
+    if dry_run:
+        report.vendored = [(r.label(), r.url, vendored_rel(r.url)) for r in refs]
+        return report
+
+    results = downloader.fetch_all([r.url for r in refs] + [u for _rel, u in stale])
+
+    dirty: set = set()
+    for ref in refs:
+        res = results.get(ref.url)
+        if isinstance(res, Exception) or res is None:
+            report.failed.append((ref.label(), ref.url, str(res)))
+            continue
+        body, ctype = res
+        rel = vendored_rel(ref.url, ctype)
+        _write_bytes(public_dir / rel, body)
+        data = entities[ref.entity]
+        rec = data[ref.index] if ref.index is not None else data
+        apply_local(rec, ref, rel)
+        prune_vendored(rec)             # eski konum anahtarlarını yola çevirir
+        dirty.add(ref.entity)
+        report.vendored.append((ref.label(), ref.url, rel))
+
+    for rel, url in stale:
+        res = results.get(url)
+        if isinstance(res, Exception) or res is None:
+            report.failed.append((rel, url, str(res)))
+            continue
+        if _write_bytes(public_dir / rel, res[0]):
+            report.refreshed.append((rel, url))
+
+    for name in ENTITY_NAMES:
+        if name in dirty:
+            repo.save(name, entities[name])
+            report.saved_entities.append(name)
+    return report
+
+
+def _current_value(rec: Dict[str, Any], fpath: str) -> Any:
+    """'images[2]' / 'profile_photo.path' / 'icon' alan yolundaki değer."""
+    m = re.fullmatch(r"(\w+)\[(\d+)\]", fpath)
+    if m:
+        seq = rec.get(m.group(1)) or []
+        i = int(m.group(2))
+        return seq[i] if i < len(seq) else None
+    cur: Any = rec
+    for part in fpath.split("."):
+        cur = cur.get(part) if isinstance(cur, dict) else None
+    return cur
@@ -0,0 +1,131 @@
+"""
+Entity JSON'ları için birleştirici (coalescing) arka plan kaydı.
+
+    app.writer.schedule("projects", self.data)
+
+- Veri çağrı anında Tk thread'inde kopyalanır (snapshot); sonraki değişiklikler yazılan kopyayı bozmaz.
+- DELAY_MS içinde gelen ardışık kayıtlar (Up/Down, art arda Add) tek yazıma iner.
+- Aynı entity için bir yazım sürerken gelenler beklenir; bitince sadece en son hal yazılır.
+- Repository.save zaten tmp + replace ile atomik yazar.
+- flush(): bekleyen her şeyi senkron yazar (pencere kapanırken / Save All öncesi). Beklediği
+  yazımların sonradan kuyruktan gelen geri çağrıları nesil sayacıyla yok sayılır (eski bir
+  snapshot yeniden kuyruğa girip yeni içeriğin üstüne yazılmaz).
+- hold(names) / release(names): Save All aynı entity'leri kendi hattıyla yazarken write-behind
+  bekler; arada yapılan düzenlemeler kuyrukta kalır ve hat bitince (daha yeni oldukları için) yazılır.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from services.repository import snapshot
+from services.task_runtime import TaskRuntime
+
+DELAY_MS = 150
+
+
+class WriteBehind:
+    def __init__(self, runtime: TaskRuntime, repo, on_error: Callable[[str, BaseException], None] | None = None):
+        self.runtime = runtime
+        self.repo = repo
+        self.on_error = on_error
+        self._pending: Dict[str, Any] = {}        # name -> en son snapshot
+        self._timers: Dict[str, Any] = {}         # name -> after id
+        self._inflight: Dict[str, Tuple[Any, Any]] = {}   # name -> (TaskHandle, snapshot)
+        self._gen = 0                             # flush() artırır; eski nesil geri çağrıları yok sayılır
+        self._held: Set[str] = set()              # Save All'un yazdığı entity'ler
+
+    def schedule(self, name: str, data: Any, delay_ms: int = DELAY_MS) -> None:
+        self._pending[name] = snapshot(data)
+        t = self._timers.pop(name, None)
+        if t is not None:
+            self.runtime.root.after_cancel(t)
+        self._timers[name] = self.runtime.root.after(delay_ms, lambda: self._start(name))
+
+    def pending(self, name: Optional[str] = None) -> bool:
+        if name is None:
+            return bool(self._pending or self._inflight)
+        return name in self._pending or name in self._inflight
+
+    def _start(self, name: str):
+        self._timers.pop(name, None)
+        if name in self._inflight or name not in self._pending or name in self._held:
+            return      # bitince _finished / release tekrar bakar
+        data = self._pending.pop(name)
+        gen = self._gen
+        h = self.runtime.run_thread(
+            lambda _ctx: self.repo.save(name, data),
+            on_done=lambda _p: self._finished(name, data, gen),
+            on_error=lambda e: self._failed(name, data, e, gen),
+            title=f"Save {name}",
+        )
+        self._inflight[name] = (h, data)
+
+    def _stale(self, name: str, data: Any, gen: int) -> bool:
+        # flush() ya da hold() bu yazımı zaten bekledi
+        return gen != self._gen or self._inflight.get(name, (None, None))[1] is not data
+
+    def _finished(self, name: str, data: Any, gen: int):
+        if self._stale(name, data, gen):
+            return
+        self._inflight.pop(name, None)
+        if name in self._pending and name not in self._timers:
+            self._start(name)
+
+    def _failed(self, name: str, data: Any, exc: BaseException, gen: int):
+        if self._stale(name, data, gen):
+            return      # flush() yeniden denedi / Save All daha yenisini yazıyor
+        self._inflight.pop(name, None)
+        # daha yeni bir snapshot yoksa başarısız olanı geri koy; flush() tekrar dener
+        self._pending.setdefault(name, data)
+        if self.on_error:
+            self.on_error(name, exc)
+
+    def flush(self) -> None:
+        """Bekleyenleri Tk thread'inde hemen yazar (kısa; sadece JSON)."""
+        for name, t in list(self._timers.items()):
+            self.runtime.root.after_cancel(t)
+        self._timers.clear()
+        self._gen += 1
+        for name, (h, data) in self._inflight.items():
+            fut = h._future
+            if fut is not None:
+                try:
+                    fut.result()
+                except Exception:
+                    self._pending.setdefault(name, data)    # daha yeni snapshot yoksa tekrar dene
+        self._inflight.clear()
+        while self._pending:
+            name, data = self._pending.popitem()
+            self.repo.save(name, data)
+
+    def hold(self, names: Iterable[str]) -> None:
+        """
+        Save All başlarken (Tk thread'inde, snapshot alındıktan hemen sonra): bekleyen eski
+        snapshot'lar atılır, süren yazımların bitmesi beklenir (hattın yazdığının üstüne sonradan
+        eski içerik düşmesin). Bundan sonra gelen schedule'lar release'e kadar bekler.
+        """
+        for name in names:
+            self._held.add(name)
+            self.discard(name)      # Save All'un snapshot'ı bunlardan yeni
+            h, _data = self._inflight.pop(name, (None, None))
+            fut = getattr(h, "_future", None)
+            if fut is not None:
+                try:
+                    fut.result()
+                except Exception:
+                    pass            # hat zaten daha yenisini yazacak; geri çağrısı yok sayılır
+
+    def release(self, names: Iterable[str]) -> None:
+        """Save All bitti: bekletilen (daha yeni) düzenlemeleri yaz."""
+        for name in names:
+            self._held.discard(name)
+            if name in self._pending and name not in self._timers:
+                self._start(name)
+
+    def discard(self, name: Optional[str] = None) -> None:
+        """Bekleyen (henüz başlamamış) yazımları at; ör. diskten yeniden yüklerken."""
+        names = [name] if name else list(self._pending)
+        for n in names:
+            self._pending.pop(n, None)
+            t = self._timers.pop(n, None)
+            if t is not None:
+                self.runtime.root.after_cancel(t)
@@ -33,3 +33,23 @@ def content_to_public_dir(content_root: Path) -> Path:
     """
     p = Path(content_root)
     return p if p.name == "public" else p.parent
+
+# Editörün yönettiği tüm entity JSON'ları (content_root/<name>.json)
+ENTITY_NAMES = [
+    "info", "socials", "experience", "competitions",
+    "projects", "certificates", "courses", "stack",
+]
+
+# public/ altında editörün dosya yazdığı görsel klasörleri
+ASSET_SUBDIRS = [
+    Path("images"),
+    Path("content") / "stack_logos",
+]
+
+# Editörün yerel önbellekleri (git'e girmez)
+CACHE_DIR = APP_DIR / ".cache"
+
+# Liste sekmeleri: "auto" | "tree" | "virtual" (sekme adı -> mod; yoksa sekmenin list_mode'u).
+# "auto" kayıt sayısı VIRTUAL_LIST_THRESHOLD'u geçince sadece görünen satırları çizer.
+LIST_VIEW_MODES: dict = {}
+VIRTUAL_LIST_THRESHOLD = 5000
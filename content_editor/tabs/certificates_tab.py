@@ -12,6 +12,9 @@ from .list_tab import ListEntityTab
 class CertificatesTab(ListEntityTab):
     entity_name = "certificates"
     columns = ["name", "issuer", "issued_at"]
+    group_fields = [("category", "Category")]
+    bulk_fields = [("issuer", "Issuer"), ("category", "Category")]
+    bulk_tag_fields = [("stack", "Stack")]
 
     def build_form(self, parent):
         f = ttk.Frame(parent)
@@ -44,6 +47,7 @@ class CertificatesTab(ListEntityTab):
         self.cred_url = LabeledEntry(f, "Credential URL", 60)
         self.details_en = EnOnlyText(f, "Details (EN)", height=6)
         self.stack = CommaListEntry(f, "Stack (comma separated)")
+        self.stack.set_completer(self.app.tag_completer("stack"))
 
         # --- Görseller
         self.gallery = MultiImagePicker(
@@ -66,6 +70,9 @@ class CertificatesTab(ListEntityTab):
         f.columnconfigure(0, weight=1)
         return f
 
+    def media_pickers(self):
+        return [self.gallery]
+
     def record_from_form(self) -> Dict[str, Any]:
         issued_str, (issued_iso, issued_unix) = self.issued_picker.get(), self.issued_picker.get_iso_unix()
         g = self.gallery.get()
@@ -121,3 +128,21 @@ class CertificatesTab(ListEntityTab):
     def summary_row(self, rec: Dict[str, Any]) -> List[Any]:
         name = (rec.get("name", {}) or {}).get("en", "")
         return [name, rec.get("issuer", ""), rec.get("issued_at", "")]
+
+    def group_values(self, field: str, rec: Dict[str, Any]) -> List[str]:
+        if field == "category":
+            return [rec.get("category_label") or rec.get("category") or ""]
+        return super().group_values(field, rec)
+
+    def bulk_set(self, rec: Dict[str, Any], field: str, value: str) -> None:
+        if field == "category":
+            # anahtar ("seminar") ya da etiket kabul edilir; ikisi birlikte yazılır
+            labels = {"technical": "TECHNICAL CERTIFICATIONS",
+                      "seminar": "SEMINAR PARTICIPATION CERTIFICATIONS"}
+            key = next((k for k, lbl in labels.items() if value.casefold() in (k, lbl.casefold())), None)
+            if key is None:
+                raise ValueError(f"Unknown category '{value}'. Use one of: "
+                                 + ", ".join(f"{k} ({lbl})" for k, lbl in labels.items()))
+            rec["category"], rec["category_label"] = key, labels[key]
+            return
+        super().bulk_set(rec, field, value)
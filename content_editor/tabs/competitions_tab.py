@@ -11,6 +11,8 @@ from .list_tab import ListEntityTab
 class CompetitionsTab(ListEntityTab):
     entity_name = "competitions"
     columns = ["name", "team", "start"]
+    bulk_fields = [("organization", "Organization")]
+    bulk_tag_fields = [("stack", "Stack")]
 
     def build_form(self, parent):
         f = ttk.Frame(parent)
@@ -24,6 +26,7 @@ class CompetitionsTab(ListEntityTab):
         self.details_en = EnOnlyText(f, "Details (EN)", height=6)
         self.highlights_en = EnOnlyList(f, "Highlights (EN)", height=6)
         self.stack = CommaListEntry(f, "Stack (comma separated)")
+        self.stack.set_completer(self.app.tag_completer("stack"))
 
         self.gallery = MultiImagePicker(
             f, public_dir_cb=self.public_dir, tab_key="competitions_tab",
@@ -38,6 +41,9 @@ class CompetitionsTab(ListEntityTab):
         f.columnconfigure(0, weight=1)
         return f
 
+    def media_pickers(self):
+        return [self.gallery]
+
     def record_from_form(self) -> Dict[str, Any]:
         dr = self.dr.get()
         g = self.gallery.get()
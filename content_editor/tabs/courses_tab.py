@@ -1,7 +1,8 @@
 from __future__ import annotations
+import re
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from widgets.fields import LabeledEntry
 from .list_tab import ListEntityTab
 
@@ -15,6 +16,8 @@ class CoursesTab(ListEntityTab):
     """
     entity_name = "courses"
     columns = ["name", "semester", "type"]
+    group_fields = [("type", "Type"), ("semester", "Semester")]
+    bulk_fields = [("semester", "Semester")]
 
     ELECTIVE_SUBS = ["Area Elective", "Non-area Elective", "Universitive Elective"]
 
@@ -80,3 +83,22 @@ class CoursesTab(ListEntityTab):
     def summary_row(self, rec: Dict[str, Any]) -> List[Any]:
         t = "Elective" if rec.get("type") == "elective" else "Mandatory"
         return [rec.get("name",""), rec.get("semester",""), t]
+
+    def sort_key(self, col: str, rec: Dict[str, Any], shown: Any) -> Tuple[int, float, str]:
+        # "10th semester" metin olarak "4th semester"dan önce gelirdi -> sayıya göre
+        if col == "semester":
+            m = re.search(r"\d+", str(rec.get("semester") or ""))
+            if m:
+                return (0, float(m.group()), "")
+        return super().sort_key(col, rec, shown)
+
+    def group_values(self, field: str, rec: Dict[str, Any]) -> List[str]:
+        if field == "type":
+            return ["Elective" if rec.get("type") == "elective" else "Mandatory"]
+        return super().group_values(field, rec)
+
+    def group_sort_key(self, field: str, value: str) -> Any:
+        if field == "semester":
+            m = re.search(r"\d+", value)
+            return (m is None, float(m.group()) if m else 0.0, value.casefold())
+        return super().group_sort_key(field, value)
@@ -11,6 +11,8 @@ from .list_tab import ListEntityTab
 class ExperienceTab(ListEntityTab):
     entity_name = "experience"
     columns = ["title", "organization", "start"]
+    bulk_fields = [("organization", "Organization")]
+    bulk_tag_fields = [("stack", "Stack")]
 
     def build_form(self, parent):
         f = ttk.Frame(parent)
@@ -22,6 +24,7 @@ class ExperienceTab(ListEntityTab):
         self.details_en = EnOnlyText(f, "Details (EN)", height=6)
         self.highlights_en = EnOnlyList(f, "Highlights (EN)", height=6)
         self.stack = CommaListEntry(f, "Stack (comma separated)")
+        self.stack.set_completer(self.app.tag_completer("stack"))
 
         self.gallery = MultiImagePicker(
             f, public_dir_cb=self.public_dir, tab_key="experience_tab",
@@ -36,6 +39,9 @@ class ExperienceTab(ListEntityTab):
         f.columnconfigure(0, weight=1)
         return f
 
+    def media_pickers(self):
+        return [self.gallery]
+
     def record_from_form(self) -> Dict[str, Any]:
         dr = self.dr.get()
         g = self.gallery.get()
@@ -69,3 +75,12 @@ class ExperienceTab(ListEntityTab):
     def summary_row(self, rec: Dict[str, Any]) -> List[Any]:
         title = (rec.get("title", {}) or {}).get("en", "")
         return [title, rec.get("organization", ""), rec.get("start", "")]
+
+    def bulk_add_tag(self, rec: Dict[str, Any], field: str, tag: str) -> None:
+        if field == "stack":
+            # eski kayıtlarda sadece "tech" olabilir; ikisi aynı listeyi taşır
+            rec["stack"] = list(rec.get("stack") or rec.get("tech") or [])
+            super().bulk_add_tag(rec, field, tag)
+            rec["tech"] = rec["stack"]
+            return
+        super().bulk_add_tag(rec, field, tag)
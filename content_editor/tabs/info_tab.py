@@ -6,33 +6,35 @@ Info Tab
 - Profil foto dosya adı sabit: images/info_profile/profile_photo.<ext>
 - Üniversite logosu dosya adı üniversite adına göre: images/universities/<University_Name>.<ext>
 - Kaydettiğinde JSON'a göreli path (images/...) yazılır.
+- Önizlemeler PREVIEWS önbelleğinden (path, mtime, kutu) gelir; her load()'da tam boy decode yok.
 """
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import io, os, shutil, re
 from pathlib import Path
-import urllib.request
 from urllib.error import URLError
 from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from .base_tab import BaseTab
+from services.preview_cache import PREVIEWS
+from services.http_cache import HTTP_CACHE
+from services.repository import snapshot
+from services.save_pipeline import SaveJob
 from widgets.scrollable import ScrollableFrame
 from widgets.dynamic_form import DynamicForm
 
 # ---------- küçük yardımcılar ----------
 IMG_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".svg", ".ico")
 
-def _load_image_from_path(path: str):
+def _load_image_from_url(url: str, box, progress=None, cancel=None):
+    """Worker thread'de çalışır: HTTP önbellekli indir, decode et, kutuya sığdır."""
     from PIL import Image
-    return Image.open(path).convert("RGBA")
-
-def _load_image_from_url(url: str):
-    from PIL import Image
-    with urllib.request.urlopen(url, timeout=10) as resp:
-        data = resp.read()
-    return Image.open(io.BytesIO(data)).convert("RGBA")
+    data = HTTP_CACHE.fetch(url, progress=progress, cancel=cancel)
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    img.thumbnail(box, Image.LANCZOS)
+    return img
 
 def _fit_image(img, max_w: int, max_h: int):
     from PIL import Image
@@ -77,6 +79,8 @@ class InfoTab(BaseTab):
 
         self._img_prof_tk = None
         self._img_uni_tk = None
+        # arka plan görsel işleri: which ("profile"|"uni") -> TaskHandle
+        self._url_jobs: Dict[str, Any] = {}
 
         # ---- UI ----
         self.scroll = ScrollableFrame(self)
@@ -104,6 +108,7 @@ class InfoTab(BaseTab):
             .grid(row=0, column=1)
         ttk.Label(prof, text="Öneri: kare görsel, max ~1024px; büyük görseller otomatik küçültülür.")\
             .grid(row=2, column=1, sticky="w")
+        self.prog_prof, self.btn_prof_cancel = self._make_progress_row(prof, "profile")
 
         # Dinamik Form
         self.form = DynamicForm(self.scroll.interior)
@@ -129,6 +134,7 @@ class InfoTab(BaseTab):
             .grid(row=0, column=1)
         ttk.Label(uni, text="PNG/JPG önerilir; şeffaf arkaplan desteklenir.")\
             .grid(row=2, column=1, sticky="w")
+        self.prog_uni, self.btn_uni_cancel = self._make_progress_row(uni, "uni")
 
         # hedef dosya etiketi
         self.update_target_path()
@@ -181,6 +187,7 @@ class InfoTab(BaseTab):
             data = self.app.repo.load(self.entity_name) or {}
 
         # reset
+        self._cancel_url_job("profile"); self._cancel_url_job("uni")
         self.state = {k: dict(v) for k, v in self._default_state.items()}
         self._passthrough.clear()
         self.entry_prof_url.delete(0, "end")
@@ -241,7 +248,25 @@ class InfoTab(BaseTab):
         self.update_target_path()
 
     def export(self) -> Dict[str, Any]:
+        """Senkron export: plan_export + görsel kopyaları (kopyalanamazsa hata fırlatır)."""
+        out, copies = self.plan_export()
+        for src, dst in copies:
+            shutil.copy2(src, dst)
+        self.data = dict(out)
+        return out
+
+    def plan_save(self) -> SaveJob:
+        """Save All hattı için: form Tk thread'inde okunur, kopya/yazım worker'da yapılır."""
+        out, copies = self.plan_export()
+
+        def saved():
+            self.data = dict(out)
+            self.update_target_path()
+        return SaveJob(self.entity_name, snapshot(out), copies=copies, on_saved=saved)
+
+    def plan_export(self) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
         """
+        (JSON çıktısı, [(kaynak, hedef), ...]). Diske dokunmaz; kopyalar çağırana bırakılır.
         Kaydetmeden önce:
           - eğer profile/uni path zaten public/images içindeyse kopyalama YAPMA,
             sadece göreli 'images/...' yaz.
@@ -249,6 +274,7 @@ class InfoTab(BaseTab):
               profile -> images/info_profile/profile_photo.<ext>
               uni     -> images/universities/<University_Name>.<ext>
         """
+        copies: List[Tuple[str, str]] = []
         out: Dict[str, Any] = {
             "profile_photo": dict(self.state["profile_photo"]),
             "university_logo": dict(self.state["university_logo"]),
@@ -285,12 +311,9 @@ class InfoTab(BaseTab):
             else:
                 # Dışarıdan dosya → sabit isimle kopyala ve ÜZERİNE YAZ
                 dst, rel = self._dest_with_fixed_name("info_profile", "profile_photo", ph_path)
-                try:
-                    shutil.copy2(ph_path, dst)
-                    out["photo"] = rel
-                    out["profile_photo"] = {"path": rel, "url": None}
-                except Exception as e:
-                    messagebox.showerror("Copy Error", f"Profil foto kopyalanamadı:\n{e}")
+                copies.append((ph_path, str(dst)))
+                out["photo"] = rel
+                out["profile_photo"] = {"path": rel, "url": None}
 
         # ---- Üniversite Logosu ----
         uni = out.get("university_logo") or {}
@@ -311,14 +334,10 @@ class InfoTab(BaseTab):
                 uni_name = str(out.get("university") or "").strip() or "University"
                 fixed = _slug(uni_name)
                 dst, rel = self._dest_with_fixed_name("universities", fixed, uni_path)
-                try:
-                    shutil.copy2(uni_path, dst)
-                    out["university_logo"] = {"path": rel, "url": None}
-                except Exception as e:
-                    messagebox.showerror("Copy Error", f"Üniversite logosu kopyalanamadı:\n{e}")
+                copies.append((uni_path, str(dst)))
+                out["university_logo"] = {"path": rel, "url": None}
 
-        self.data = dict(out)
-        return out
+        return out, copies
 
     # export alias'ları
     def get_data(self) -> Dict[str, Any]: return self.export()
@@ -344,31 +363,28 @@ class InfoTab(BaseTab):
             filetypes=[("Görüntü", "*.png;*.jpg;*.jpeg;*.webp;*.bmp;*.gif;*.svg;*.ico")]
         )
         if not p: return
-        try:
-            img = _load_image_from_path(p)
+
+        def done(img):
             self._set_profile_image(img)
             self.state["profile_photo"]["path"] = p
             self.state["profile_photo"]["url"] = None
             self.entry_prof_url.delete(0, "end")
-        except Exception as e:
-            messagebox.showerror("Hata", f"Görsel açılamadı:\n{e}")
+        self._load_path_image("profile", p, self.PROFILE_BOX, done, interactive=True)
 
     def _load_profile_from_url(self):
         url = self.entry_prof_url.get().strip()
         if not url:
             messagebox.showwarning("Uyarı", "Lütfen bir URL girin."); return
-        try:
-            img = _load_image_from_url(url)
+
+        def done(img):
             self._set_profile_image(img)
             self.state["profile_photo"]["url"] = url
             self.state["profile_photo"]["path"] = None
-        except URLError as e:
-            messagebox.showerror("Hata", f"URL'e erişilemedi:\n{e}")
-        except Exception as e:
-            messagebox.showerror("Hata", f"Görsel açılamadı:\n{e}")
+        self._fetch_url_image("profile", url, self.PROFILE_BOX, done, interactive=True)
 
     def _set_profile_image(self, img):
-        img = _fit_image(img, *self.PROFILE_BOX)
+        if img.width > self.PROFILE_BOX[0] or img.height > self.PROFILE_BOX[1]:
+            img = _fit_image(img, *self.PROFILE_BOX)
         self._img_prof_tk = ImageTk.PhotoImage(img)
         _render_on_canvas(self.canvas_prof, self._img_prof_tk)
 
@@ -380,11 +396,11 @@ class InfoTab(BaseTab):
                 # public göreli ise absolute path'e çevirip oku
                 if not os.path.isabs(path) and path.startswith("images/"):
                     path = str(self._public_dir() / path)
-                img = _load_image_from_path(path)
-                self._set_profile_image(img)
+                self._load_path_image("profile", path, self.PROFILE_BOX, self._set_profile_image,
+                                      on_fail=lambda: self.canvas_prof.delete("all"))
             elif ph.get("url"):
-                img = _load_image_from_url(ph["url"])
-                self._set_profile_image(img)
+                self._fetch_url_image("profile", ph["url"], self.PROFILE_BOX, self._set_profile_image,
+                                      on_fail=lambda: self.canvas_prof.delete("all"))
             else:
                 self.canvas_prof.delete("all")
         except Exception:
@@ -396,31 +412,28 @@ class InfoTab(BaseTab):
             filetypes=[("Görüntü", "*.png;*.jpg;*.jpeg;*.webp;*.bmp;*.gif;*.svg;*.ico")]
         )
         if not p: return
-        try:
-            img = _load_image_from_path(p)
+
+        def done(img):
             self._set_uni_image(img)
             self.state["university_logo"]["path"] = p
             self.state["university_logo"]["url"] = None
             self.entry_uni_url.delete(0, "end")
-        except Exception as e:
-            messagebox.showerror("Hata", f"Görsel açılamadı:\n{e}")
+        self._load_path_image("uni", p, self.UNI_LOGO_BOX, done, interactive=True)
 
     def _load_uni_from_url(self):
         url = self.entry_uni_url.get().strip()
         if not url:
             messagebox.showwarning("Uyarı", "Lütfen bir URL girin."); return
-        try:
-            img = _load_image_from_url(url)
+
+        def done(img):
             self._set_uni_image(img)
             self.state["university_logo"]["url"] = url
             self.state["university_logo"]["path"] = None
-        except URLError as e:
-            messagebox.showerror("Hata", f"URL'e erişilemedi:\n{e}")
-        except Exception as e:
-            messagebox.showerror("Hata", f"Görsel açılamadı:\n{e}")
+        self._fetch_url_image("uni", url, self.UNI_LOGO_BOX, done, interactive=True)
 
     def _set_uni_image(self, img):
-        img = _fit_image(img, *self.UNI_LOGO_BOX)
+        if img.width > self.UNI_LOGO_BOX[0] or img.height > self.UNI_LOGO_BOX[1]:
+            img = _fit_image(img, *self.UNI_LOGO_BOX)
         self._img_uni_tk = ImageTk.PhotoImage(img)
         _render_on_canvas(self.canvas_uni, self._img_uni_tk)
 
@@ -431,12 +444,90 @@ class InfoTab(BaseTab):
                 path = uni["path"]
                 if not os.path.isabs(path) and path.startswith("images/"):
                     path = str(self._public_dir() / path)
-                img = _load_image_from_path(path)
-                self._set_uni_image(img)
+                self._load_path_image("uni", path, self.UNI_LOGO_BOX, self._set_uni_image,
+                                      on_fail=lambda: self.canvas_uni.delete("all"))
             elif uni.get("url"):
-                img = _load_image_from_url(uni["url"])
-                self._set_uni_image(img)
+                self._fetch_url_image("uni", uni["url"], self.UNI_LOGO_BOX, self._set_uni_image,
+                                      on_fail=lambda: self.canvas_uni.delete("all"))
             else:
                 self.canvas_uni.delete("all")
         except Exception:
             self.canvas_uni.delete("all")
+
+    # ---------- URL indirme (arka planda) ----------
+    def _make_progress_row(self, parent, which: str):
+        row = ttk.Frame(parent)
+        row.grid(row=3, column=1, sticky="ew", pady=(4, 0))
+        row.columnconfigure(0, weight=1)
+        bar = ttk.Progressbar(row, mode="determinate", maximum=100)
+        btn = ttk.Button(row, text="İptal", command=lambda: self._cancel_url_job(which))
+        bar.grid(row=0, column=0, sticky="ew", padx=(0, 6))
+        btn.grid(row=0, column=1)
+        row.grid_remove()     # indirme yokken gizli
+        return bar, btn
+
+    def _progress_widgets(self, which: str):
+        return (self.prog_prof, self.btn_prof_cancel) if which == "profile" else (self.prog_uni, self.btn_uni_cancel)
+
+    def _cancel_url_job(self, which: str):
+        job = self._url_jobs.pop(which, None)
+        if not job:
+            return
+        job.cancel()
+        bar, _btn = self._progress_widgets(which)
+        bar.stop()
+        bar.master.grid_remove()
+
+    def _fetch_url_image(self, which: str, url: str, box, on_image, interactive: bool = False, on_fail=None):
+        """URL'i arka planda indirir (HTTP önbellekli, koşullu istek); ilerleme çubuğu + iptal."""
+        def work(ctx):
+            return _load_image_from_url(url, box, progress=ctx.progress, cancel=ctx.cancel_event)
+        self._run_image_job(which, work, on_image, interactive, on_fail, show_progress=True)
+
+    def _load_path_image(self, which: str, path: str, box, on_image, interactive: bool = False, on_fail=None):
+        """Yerel dosya önizlemesi (PREVIEWS önbelleği) arka planda decode edilir."""
+        self._run_image_job(which, lambda _ctx: PREVIEWS.get(path, box), on_image, interactive, on_fail)
+
+    def _run_image_job(self, which: str, work, on_image, interactive: bool, on_fail, show_progress: bool = False):
+        """
+        Ortak task runtime üzerinden çalıştırır; aynı kutu için önceki iş iptal edilir.
+        on_image(img) Tk thread'inde, sadece iş hâlâ güncelse çağrılır.
+        """
+        self._cancel_url_job(which)
+        bar, _btn = self._progress_widgets(which)
+        if show_progress:
+            bar.configure(mode="indeterminate", value=0)
+            bar.master.grid()
+            bar.start(15)
+
+        def finish() -> bool:
+            if self._url_jobs.get(which) is not handle:
+                return False
+            del self._url_jobs[which]
+            bar.stop()
+            bar.master.grid_remove()
+            return True
+
+        def done(img):
+            if finish():
+                on_image(img)
+
+        def progress(done_bytes, total, _msg=""):
+            if total and self._url_jobs.get(which) is handle:
+                bar.stop()
+                bar.configure(mode="determinate", value=100 * done_bytes / total)
+
+        def failed(e):
+            if not finish():
+                return
+            if on_fail:
+                on_fail()
+            if interactive:
+                if isinstance(e, URLError):
+                    messagebox.showerror("Hata", f"URL'e erişilemedi:\n{e}")
+                else:
+                    messagebox.showerror("Hata", f"Görsel açılamadı:\n{e}")
+
+        handle = self.app.tasks.run_thread(work, on_done=done, on_error=failed, on_progress=progress,
+                                           on_cancel=finish, title="Image")
+        self._url_jobs[which] = handle
@@ -1,12 +1,34 @@
 from __future__ import annotations
+import copy
+import os
+import time
 import tkinter as tk
-from tkinter import ttk
-from typing import Any, Dict, List
+from tkinter import ttk, simpledialog, messagebox
+from typing import Any, Dict, List, Optional, Tuple
 from .base_tab import BaseTab
+from services.search_index import SearchIndex
+from services.group_index import GroupIndex, NO_GROUP
+from services.image_convert import convert_local
+from services.near_dupes import DUPE_FIELDS, DupeIndex
+from services.undo import UndoHistory
+from services.vendor_assets import prune_vendored
+from settings import LIST_VIEW_MODES, VIRTUAL_LIST_THRESHOLD
+from widgets.virtual_list import VirtualList
+
+SYNC_INDEX_LIMIT = 2000     # bundan büyük listelerde arama indeksi arka planda kurulur
+FILL_BUDGET = 0.008         # satır ekleme: bir turda en fazla ~yarım kare (sn)
 
 class ListEntityTab(BaseTab):
     entity_name = ""
     columns: List[str] = []
+    # "tree": her kayıt bir Treeview satırı; "virtual": sadece görünen satırlar (VirtualList);
+    # "auto": VIRTUAL_LIST_THRESHOLD üstünde virtual. settings.LIST_VIEW_MODES sekme bazında ezer.
+    list_mode = "auto"
+    # Gruplu görünüm için alanlar: [(alan, etiket), ...]; boşsa "Group" seçimi gösterilmez
+    group_fields: List[Tuple[str, str]] = []
+    # Toplu işlemler: "Set <etiket>…" ile tek değer yazılan alanlar ve "Add <etiket> tag…" liste alanları
+    bulk_fields: List[Tuple[str, str]] = []
+    bulk_tag_fields: List[Tuple[str, str]] = []
 
     def build_form(self, parent) -> tk.Widget:  # override
         raise NotImplementedError
@@ -20,6 +42,50 @@ class ListEntityTab(BaseTab):
     def summary_row(self, rec: Dict[str, Any]) -> List[Any]:  # override
         raise NotImplementedError
 
+    def sort_key(self, col: str, rec: Dict[str, Any], shown: Any) -> Tuple[int, float, str]:
+        """
+        Sütun sıralama anahtarı (override edilebilir). Tüm kayıtlar için karşılaştırılabilir olmalı:
+        (0, sayı, "") tarih/sayı, (1, 0, metin) metin, (2, 0, "") boş.
+        Tarih sütunlarında <col>_unix kullanılır; tarih metni her karşılaştırmada parse edilmez.
+        """
+        unix = rec.get(f"{col}_unix")
+        if isinstance(unix, (int, float)) and not isinstance(unix, bool):
+            return (0, float(unix), "")
+        if isinstance(shown, (int, float)) and not isinstance(shown, bool):
+            return (0, float(shown), "")
+        text = str(shown or "").strip()
+        return (1, 0.0, text.casefold()) if text else (2, 0.0, "")
+
+    def group_values(self, field: str, rec: Dict[str, Any]) -> List[str]:
+        """Kaydın bu alandaki grup(lar)ı (override edilebilir). Liste alanlarında her öğe bir grup."""
+        v = rec.get(field)
+        if isinstance(v, (list, tuple)):
+            return [str(x) for x in v]
+        return [str(v)] if v not in (None, "") else []
+
+    def group_sort_key(self, field: str, value: str) -> Any:
+        return (value == NO_GROUP, value.casefold())
+
+    def bulk_set(self, rec: Dict[str, Any], field: str, value: str) -> None:
+        """
+        Toplu "Set" için kaydın kopyasına değeri yaz (override: türetilmiş alanlar vb.).
+        Geçersiz değerde ValueError: hiçbir kayıt değişmez, mesaj kullanıcıya gösterilir.
+        """
+        rec[field] = value
+
+    def bulk_add_tag(self, rec: Dict[str, Any], field: str, tag: str) -> None:
+        """Toplu "Add tag": liste alanına yoksa ekle (büyük/küçük harf duyarsız)."""
+        tags = list(rec.get(field) or [])
+        if tag.casefold() not in {str(t).casefold() for t in tags}:
+            rec[field] = tags + [tag]
+
+    def media_pickers(self) -> List[Any]:
+        """
+        Formdaki görsel seçiciler (override). Add/Update'ten önce bunların yerel dosyaları
+        (pending_conversions) süreç havuzunda dönüştürülür; record_from_form sonra hızlıdır.
+        """
+        return []
+
     # ---- App standard API ----
     def export(self) -> List[Dict[str, Any]]:
         return list(self.data)
@@ -55,24 +121,43 @@ class ListEntityTab(BaseTab):
         # Sol panel: liste
         left = ttk.Frame(paned)
         left.grid_columnconfigure(0, weight=1)
-        left.grid_rowconfigure(0, weight=1)
-
-        self.tree = ttk.Treeview(
-            left,
-            columns=self.columns,
-            show="headings",
-            height=18,
-            style="AlwaysSelected.Treeview",
-            selectmode="browse",
-        )
-        for col in self.columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=160, stretch=True)
+        left.grid_rowconfigure(1, weight=1)
 
-        ysb = ttk.Scrollbar(left, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=ysb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        ysb.grid(row=0, column=1, sticky="ns")
+        # Arama / filtre çubuğu (yazdıkça süzer; Esc temizler)
+        searchbar = ttk.Frame(left)
+        searchbar.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 6))
+        searchbar.grid_columnconfigure(1, weight=1)
+        ttk.Label(searchbar, text="Search:").grid(row=0, column=0, padx=(0, 6))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(searchbar, textvariable=self.search_var)
+        self.search_entry.grid(row=0, column=1, sticky="ew")
+        self.lbl_search_count = ttk.Label(searchbar, text="", style="Path.TLabel")
+        self.lbl_search_count.grid(row=0, column=2, padx=(6, 0))
+        self.search_entry.bind("<Escape>", lambda e: self.search_var.set(""))
+        self.search_var.trace_add("write", lambda *_: self._refresh_table())
+        self.virtual_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(searchbar, text="Virtual", variable=self.virtual_var,
+                        command=lambda: self._set_view(self.virtual_var.get())).grid(row=0, column=3, padx=(8, 0))
+        # Gruplu görünüm: grup düğümleri (sayılarla) önce; satırlar grup açılınca eklenir
+        self._group_field: str | None = None
+        self._groups: GroupIndex | None = None
+        self._open_groups: set = set()
+        self._group_iids: Dict[str, str] = {}       # grup değeri -> düğüm iid
+        self._last_hits = None                      # son arama sonucu (id kümesi) / None
+        if self.group_fields:
+            ttk.Label(searchbar, text="Group:").grid(row=0, column=4, padx=(8, 4))
+            labels = ["None"] + [lbl for _f, lbl in self.group_fields]
+            self.group_var = tk.StringVar(value="None")
+            cb = ttk.Combobox(searchbar, textvariable=self.group_var, values=labels,
+                              state="readonly", width=12)
+            cb.grid(row=0, column=5)
+            cb.bind("<<ComboboxSelected>>", lambda e: self._set_grouping(self.group_var.get()))
+
+        self._list_host = left
+        self.tree = None
+        self._ysb = None
+        self._virtual = None
+        self._build_view(self._mode() == "virtual")
 
         # Sağ panel: scrollable form alanı
         right = ttk.Frame(paned)
@@ -111,17 +196,42 @@ class ListEntityTab(BaseTab):
         btnbar = ttk.Frame(root)
         btnbar.grid(row=1, column=0, sticky="e", pady=(8, 0))
         ttk.Button(btnbar, text="New", command=self._on_new).pack(side="left")
-        ttk.Button(btnbar, text="Add / Update", command=self._on_add_update).pack(side="left", padx=8)
+        self.btn_add_update = ttk.Button(btnbar, text="Add / Update", command=self._on_add_update)
+        self.btn_add_update.pack(side="left", padx=8)
         ttk.Button(btnbar, text="Delete", command=self._on_delete).pack(side="left")
         ttk.Separator(btnbar, orient="vertical").pack(side="left", padx=8, fill="y")
         ttk.Button(btnbar, text="Up", command=self._move_up).pack(side="left")
         ttk.Button(btnbar, text="Down", command=self._move_down).pack(side="left", padx=(6, 0))
-
-        # Olaylar
-        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.btn_apply_sort = ttk.Button(btnbar, text="Apply Sort", command=self._apply_sort)
+        self.btn_apply_sort.pack(side="left", padx=(8, 0))
+        self.btn_apply_sort.state(["disabled"])
+        ttk.Separator(btnbar, orient="vertical").pack(side="left", padx=8, fill="y")
+        bulk = ttk.Menubutton(btnbar, text="Bulk ▾")
+        bulk.pack(side="left")
+        self._build_bulk_menu(bulk)
 
         # Veri
         self.data: List[Dict[str, Any]] = []
+        # Arama indeksi: doc id = id(kayıt); Add/Update/Delete'te artımlı güncellenir
+        self._search = SearchIndex()
+        self._index_ready = True
+        self._index_ops: List[Any] = []     # arka planda kurulurken gelen değişiklikler
+        self._index_gen = 0
+        # Sütun sıralaması (sadece görünüm): id(kayıt) -> sütun anahtarları; mutasyonda artımlı
+        self._sort: Optional[Tuple[str, bool]] = None     # (sütun, azalan)
+        self._sort_keys: Dict[int, Tuple[Any, ...]] = {}
+        self._sorted_rows: Optional[List[int]] = None     # geçerli sıralamada data indeksleri
+        self._fill_jobs: List[List[Any]] = []      # [parent, iid öneki, satırlar, konum]
+        # Kopya uyarısı için bloklu benzerlik indeksi: load'da (büyük listede arka planda) kurulur,
+        # sonra artımlı; kurulurken gelen değişiklikler _dupe_ops'ta bekler, kontrol atlanır
+        self._dupes: DupeIndex | None = None
+        self._dupe_ops: Optional[List[Any]] = None
+        self._dupe_gen = 0
+        self._converting = False            # Add/Update öncesi görsel dönüştürme sürüyor
+        # Geri al / yinele: son kaydedilen satırlara göre fark (splice) olarak tutulur
+        self._history = UndoHistory()
+        self._saved_rows: List[Dict[str, Any]] = []
+        self._fill_after = None
         self.update_target_path()
         self.load()
 
@@ -130,6 +240,165 @@ class ListEntityTab(BaseTab):
         self.bind_all("<Alt-Up>", lambda e: self._move_up())
         self.bind_all("<Alt-Down>", lambda e: self._move_down())
 
+    # ---- Liste görünümü (Treeview / VirtualList) ----
+    def _mode(self) -> str:
+        return LIST_VIEW_MODES.get(self.entity_name, self.list_mode)
+
+    def _build_view(self, virtual: bool):
+        if self._virtual is virtual:
+            return
+        sel = self.tree.selection() if self.tree is not None else ()
+        for w in (self.tree, self._ysb):
+            if w is not None:
+                w.destroy()
+        self._ysb = None
+        if virtual:
+            self.tree = VirtualList(self._list_host, columns=self.columns, style="AlwaysSelected.Treeview",
+                                    selectmode="extended")
+            self.tree.grid(row=1, column=0, columnspan=2, sticky="nsew")
+        else:
+            self.tree = ttk.Treeview(
+                self._list_host,
+                columns=self.columns,
+                show="headings",
+                height=18,
+                style="AlwaysSelected.Treeview",
+                selectmode="extended",
+            )
+            self._ysb = ttk.Scrollbar(self._list_host, orient="vertical", command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self._ysb.set)
+            self.tree.grid(row=1, column=0, sticky="nsew")
+            self._ysb.grid(row=1, column=1, sticky="ns")
+        for col in self.columns:
+            self.tree.heading(col, text=col, command=lambda c=col: self._on_heading(c))
+            self.tree.column(col, width=160, stretch=True)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        if not virtual:
+            self.tree.bind("<<TreeviewOpen>>", self._on_group_open)
+            self.tree.bind("<<TreeviewClose>>", self._on_group_close)
+            self._apply_group_columns()
+        self._virtual = virtual
+        self.virtual_var.set(virtual)
+        self._fill_after = None
+        if sel:
+            self._pending_select = sel[0]
+
+    def _set_view(self, virtual: bool):
+        """Görünümü değiştir (sekmedeki "Virtual" kutusu)."""
+        if virtual and self._group_field:
+            self._group_field, self._groups = None, None     # gruplu görünüm Treeview ister
+            self.group_var.set("None")
+        self._build_view(virtual)
+        self._update_heading_marks()
+        self._refresh_table()
+        sel = getattr(self, "_pending_select", None)
+        self._pending_select = None
+        if sel is not None:
+            try:
+                self.tree.selection_set(sel)
+                self.tree.see(sel)
+            except Exception:
+                pass
+
+    # ---- Gruplu görünüm ----
+    def _set_grouping(self, label: str):
+        field = next((f for f, lbl in self.group_fields if lbl == label), None)
+        if field == self._group_field:
+            return
+        self._group_field = field
+        self._open_groups.clear()
+        if field is None:
+            self._groups = None
+        else:
+            self._groups = GroupIndex(lambda rec, f=field: self.group_values(f, rec))
+            self._groups.rebuild((id(rec), rec) for rec in self.data)
+            if self._virtual:
+                self._build_view(False)
+                self._update_heading_marks()
+        self._apply_group_columns()
+        self._refresh_table()
+
+    def _apply_group_columns(self):
+        if self._virtual or self.tree is None:
+            return
+        if self._group_field:
+            label = next(lbl for f, lbl in self.group_fields if f == self._group_field)
+            self.tree.configure(show="tree headings")
+            self.tree.heading("#0", text=label)
+            self.tree.column("#0", width=180, stretch=False)
+        else:
+            self.tree.configure(show="headings")
+
+    def _render_groups(self, rows: List[int]):
+        """Sadece grup düğümleri + açık grupların satırları; kapalı gruplara yer tutucu çocuk."""
+        self._group_iids = {}
+        members = self._groups.members
+        hits = self._last_hits
+        for n, value in enumerate(sorted(members, key=lambda v: self.group_sort_key(self._group_field, v))):
+            ids = members[value]
+            count = len(ids) if hits is None else len(ids & hits)
+            if hits is not None and not count:
+                continue
+            gid = f"g{n}"
+            self._group_iids[value] = gid
+            self.tree.insert("", "end", iid=gid, text=f"{value} ({count})", open=False)
+            if value in self._open_groups:
+                self._fill_group(gid, value, rows)
+            else:
+                self.tree.insert(gid, "end", iid=f"{gid}:stub")
+
+    def _fill_group(self, gid: str, value: str, rows: List[int] | None = None):
+        if self.tree.exists(f"{gid}:stub"):
+            self.tree.delete(f"{gid}:stub")
+        rows = self._visible_indices() if rows is None else rows
+        ids, data = self._groups.members.get(value, set()), self.data
+        self.tree.item(gid, open=True)
+        self._queue_fill(gid, f"{gid}:", [i for i in rows if id(data[i]) in ids])
+
+    def _on_group_open(self, _e=None):
+        gid = self.tree.focus()
+        value = next((v for v, g in self._group_iids.items() if g == gid), None)
+        if value is None:
+            return
+        self._open_groups.add(value)
+        if self.tree.exists(f"{gid}:stub"):
+            self._fill_group(gid, value)
+
+    def _on_group_close(self, _e=None):
+        gid = self.tree.focus()
+        for v, g in self._group_iids.items():
+            if g == gid:
+                self._open_groups.discard(v)
+
+    def _index_of(self, iid: str) -> int | None:
+        """Satır iid'i -> self.data indeksi ("12" düz, "g3:12" gruplu; grup düğümü -> None)."""
+        tail = iid.rsplit(":", 1)[-1]
+        return int(tail) if tail.isdigit() else None
+
+    def _iid_for(self, i: int) -> str | None:
+        """Kaydın satır iid'i; gruplu görünümde gerekirse içinde bulunduğu grup açılır."""
+        if not self._group_field:
+            return str(i)
+        values = self._groups.groups_of(id(self.data[i]))
+        gid = next((self._group_iids[v] for v in values if v in self._open_groups and v in self._group_iids), None)
+        if gid is None:
+            v = next((v for v in values if v in self._group_iids), None)
+            if v is None:
+                return None
+            gid = self._group_iids[v]
+            self._open_groups.add(v)
+            self._fill_group(gid, v)
+        self._ensure_filled()
+        return f"{gid}:{i}"
+
+    def _selected_indices(self) -> List[int]:
+        out = []
+        for iid in self.tree.selection():
+            i = self._index_of(iid)
+            if i is not None and 0 <= i < len(self.data):
+                out.append(i)
+        return out
+
     def _make_scrollable_form(self, parent) -> ttk.Frame:
         canvas = tk.Canvas(parent, highlightthickness=0)
         vsb = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
@@ -171,24 +440,335 @@ class ListEntityTab(BaseTab):
         if not isinstance(items, list):
             items = []
         self.data = items
+        self._history.clear()
+        self._saved_rows = list(items)
         self._reindex_order()
+        self._rebuild_search_index()
+        self._sort_keys = {}            # tembel: ilk sıralamada doldurulur
+        if self._groups is not None:
+            self._groups.rebuild((id(rec), rec) for rec in self.data)
+        self._rebuild_dupe_index()
+        self._sorted_rows = None
+        if self._mode() == "auto":
+            # gruplu görünüm Treeview'de kalır (kapalı gruplar zaten az satır demek)
+            self._build_view(len(items) > VIRTUAL_LIST_THRESHOLD and self._group_field is None)
+            self._update_heading_marks()
         self._refresh_table()
-        try:
-            self.set_form({})
-        except Exception:
-            pass
+        self._on_new()          # eski indeksler artık başka kayıtları gösterir
         self.update_target_path()
 
-    def _save_only(self):
+    def _save_only(self, coalesce=None):
+        """Her mutasyonun ortak çıkışı: önceki kayda göre farkı geçmişe ekle, sonra yaz."""
+        self._history.record(self._saved_rows, self.data, coalesce)
+        self._write()
+
+    def _write(self):
+        self._saved_rows = list(self.data)      # sığ: kayıtlar paylaşılır
         self._reindex_order()
-        self.app.repo.save(self.entity_name, self.data)
+        # arka planda, art arda gelen kayıtlar birleştirilerek yazılır (bkz. services/write_behind.py)
+        self.app.writer.schedule(self.entity_name, self.data)
         self.update_target_path()
 
+    # ---- Arama indeksi ----
+    def _rebuild_search_index(self):
+        self._index_gen += 1
+        gen = self._index_gen
+        items = [(id(rec), rec) for rec in self.data]
+        self._index_ops = []
+        if len(items) <= SYNC_INDEX_LIMIT:
+            self._search.rebuild(items)
+            self._index_ready = True
+            return
+
+        # büyük liste: kayıtlar yerinde değiştirilmez (güncelleme yeni dict koyar) -> thread'de okunabilir
+        self._index_ready = False
+
+        def build(_ctx):
+            idx = SearchIndex()
+            idx.rebuild(items)
+            return idx
+
+        def done(idx):
+            if gen != self._index_gen:
+                return
+            for op in self._index_ops:
+                op(idx)
+            self._index_ops = []
+            self._search, self._index_ready = idx, True
+            if self.search_var.get().strip():
+                self._refresh_table()
+
+        def failed(exc):
+            if gen != self._index_gen:
+                return
+            # thread'deki kurulum düştü: güncel listeden eşzamanlı kur (bekleyen işlemler zaten içinde)
+            self._index_ops = []
+            try:
+                self._search.rebuild([(id(rec), rec) for rec in self.data])
+            except Exception as e:
+                messagebox.showerror("Search index", f"{type(e).__name__}: {e}", parent=self)
+                self._search = SearchIndex()
+            else:
+                messagebox.showwarning(
+                    "Search index",
+                    f"Background indexing failed ({type(exc).__name__}: {exc}); rebuilt synchronously.",
+                    parent=self)
+            self._index_ready = True
+            self._refresh_table()
+
+        self.app.tasks.run_thread(build, on_done=done, on_error=failed, title="Search index")
+
+    def _index_op(self, fn):
+        if self._index_ready:
+            fn(self._search)
+        else:
+            self._index_ops.append(fn)
+
+    def _rebuild_dupe_index(self):
+        self._dupe_gen += 1
+        gen = self._dupe_gen
+        self._dupes, self._dupe_ops = None, None
+        fields = DUPE_FIELDS.get(self.entity_name)
+        if fields is None:
+            return
+        items = [(id(rec), rec) for rec in self.data]
+        if len(items) <= SYNC_INDEX_LIMIT:
+            self._dupes = DupeIndex(fields)
+            self._dupes.rebuild(items)
+            return
+        self._dupe_ops = []
+
+        def build(_ctx):
+            idx = DupeIndex(fields)
+            idx.rebuild(items)
+            return idx
+
+        def done(idx):
+            if gen != self._dupe_gen:
+                return
+            for op in self._dupe_ops or ():
+                op(idx)
+            self._dupes, self._dupe_ops = idx, None
+
+        def failed(_exc):
+            if gen == self._dupe_gen:
+                self._dupe_ops = None       # kopya uyarısı bu yükleme için kapalı kalır
+
+        self.app.tasks.run_thread(build, on_done=done, on_error=failed, title="Duplicate index")
+
+    def _dupe_op(self, fn):
+        if self._dupes is not None:
+            fn(self._dupes)
+        elif self._dupe_ops is not None:
+            self._dupe_ops.append(fn)
+
+    # ---- Mutasyon kancaları: arama indeksi + sıralama anahtarları ----
+    def _record_added(self, rec):
+        self._index_op(lambda ix, n=id(rec), r=rec: ix.add(n, r))
+        if self._groups is not None:
+            self._groups.add(id(rec), rec)
+        self._dupe_op(lambda ix, n=id(rec), r=rec: ix.add(n, r))
+        self._sort_keys.pop(id(rec), None)      # id yeniden kullanılmış olabilir
+        self._sorted_rows = None
+
+    def _record_replaced(self, old, rec):
+        self._index_op(lambda ix, o=id(old), n=id(rec), r=rec: ix.update(o, n, r))
+        if self._groups is not None:
+            self._groups.update(id(old), id(rec), rec)
+        self._dupe_op(lambda ix, o=id(old), n=id(rec), r=rec: ix.update(o, n, r))
+        self._sort_keys.pop(id(old), None)
+        self._sort_keys.pop(id(rec), None)
+        self._sorted_rows = None
+
+    def _record_removed(self, rec):
+        self._index_op(lambda ix, o=id(rec): ix.remove(o))
+        if self._groups is not None:
+            self._groups.remove(id(rec))
+        self._dupe_op(lambda ix, o=id(rec): ix.remove(o))
+        self._sort_keys.pop(id(rec), None)
+        self._sorted_rows = None
+
+    # ---- Sütun sıralama (görünüm) ----
+    def _keys_for(self, rec) -> Tuple[Any, ...]:
+        try:
+            shown = self.summary_row(rec)
+        except Exception:
+            shown = [""] * len(self.columns)
+        return tuple(self.sort_key(c, rec, v) for c, v in zip(self.columns, shown))
+
+    def _on_heading(self, col: str):
+        """Artan -> azalan -> kayıtlı sıra."""
+        if self._sort is None or self._sort[0] != col:
+            self._sort = (col, False)
+        elif not self._sort[1]:
+            self._sort = (col, True)
+        else:
+            self._sort = None
+        self._sorted_rows = None
+        self._update_heading_marks()
+        self._refresh_table()
+
+    def _update_heading_marks(self):
+        for c in self.columns:
+            mark = ""
+            if self._sort and self._sort[0] == c:
+                mark = " ▼" if self._sort[1] else " ▲"
+            self.tree.heading(c, text=c + mark)
+        self.btn_apply_sort.state(["!disabled"] if self._sort else ["disabled"])
+
+    def _ordered_rows(self) -> List[int]:
+        if self._sort is None:
+            return list(range(len(self.data)))
+        if self._sorted_rows is None:
+            col, desc = self._sort
+            ci = self.columns.index(col)
+            keys, data = self._sort_keys, self.data
+            col_keys = []
+            for rec in data:
+                k = keys.get(id(rec))
+                if k is None:
+                    keys[id(rec)] = k = self._keys_for(rec)
+                col_keys.append(k[ci])
+            filled = [i for i, k in enumerate(col_keys) if k[0] != 2]
+            empty = [i for i, k in enumerate(col_keys) if k[0] == 2]
+            # eşitlerde kayıtlı sıra korunur (stable); boşlar her iki yönde sonda
+            filled.sort(key=col_keys.__getitem__, reverse=desc)
+            self._sorted_rows = filled + empty
+        return list(self._sorted_rows)
+
+    def _clear_sort(self):
+        if self._sort is not None:
+            self._sort = None
+            self._sorted_rows = None
+            self._update_heading_marks()
+
+    def _apply_sort(self):
+        """Görünen sıralamayı kalıcı yap: order_index yeniden yazılır ve kaydedilir."""
+        if self._sort is None:
+            return
+        sel = self._selected_indices()
+        selected = self.data[sel[0]] if sel else None
+        self.data = [self.data[i] for i in self._ordered_rows()]
+        self._clear_sort()
+        self._save_only()
+        self._refresh_table()
+        if selected is not None:
+            self._select_record(selected)
+
+    def _select_record(self, rec):
+        for i, r in enumerate(self.data):
+            if r is rec:
+                self._select_index(i)
+                return
+
+    def reveal_record(self, rec) -> bool:
+        """Kaydı seç ve forma yükle (Ctrl+P); arama filtresi gizliyorsa temizlenir."""
+        if not any(r is rec for r in self.data):
+            return False
+        if self._last_hits is not None and id(rec) not in self._last_hits:
+            self.search_var.set("")
+        self._select_record(rec)
+        self.tree.focus_set()
+        return True
+
+    def _select_records(self, recs: List[Dict[str, Any]]):
+        """Birden çok kaydı seç (arama filtresinin gizledikleri atlanır)."""
+        if len(recs) == 1:
+            self._select_record(recs[0])
+            return
+        want = {id(r) for r in recs}
+        self._ensure_filled()
+        iids = [iid for iid in (self._iid_for(i) for i, r in enumerate(self.data) if id(r) in want)
+                if iid and self.tree.exists(iid)]
+        if not iids:
+            return
+        try:
+            self.tree.selection_set(iids)
+            self.tree.focus(iids[0])
+            self.tree.see(iids[0])
+        except Exception:
+            pass
+
+    def _select_index(self, i: int):
+        self._ensure_filled()
+        iid = self._iid_for(i)
+        if iid is None:
+            return
+        try:
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+            self.tree.see(iid)
+        except Exception:
+            pass
+
+    def _visible_indices(self) -> List[int]:
+        query = self.search_var.get()
+        self._last_hits = None
+        if not query.strip():
+            self.lbl_search_count.config(text="")
+            return self._ordered_rows()
+        if not self._index_ready:
+            self.lbl_search_count.config(text="indexing…")
+            return self._ordered_rows()
+        hits = self._search.search(query)
+        if hits is None:
+            return self._ordered_rows()
+        self._last_hits = hits
+        data = self.data
+        rows = [i for i in self._ordered_rows() if id(data[i]) in hits]
+        self.lbl_search_count.config(text=f"{len(rows)} / {len(self.data)}")
+        return rows
+
+    # ---- Tablo ----
+    def _row_values(self, i: int):
+        return self.summary_row(self.data[i])
+
     def _refresh_table(self):
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
-        for i, rec in enumerate(self.data):
-            self.tree.insert("", "end", iid=str(i), values=self.summary_row(rec))
+        if self._fill_after is not None:
+            self.after_cancel(self._fill_after)
+            self._fill_after = None
+        self._fill_jobs = []
+        # iid = self.data içindeki sıra; filtre sadece hangi satırların görüneceğini belirler
+        rows = self._visible_indices()
+        if self._virtual:
+            self.tree.set_rows(rows, self._row_values)
+            return
+        self.tree.delete(*self.tree.get_children())
+        if self._group_field:
+            self._render_groups(rows)
+        else:
+            self._queue_fill("", "", rows)
+
+    def _queue_fill(self, parent: str, prefix: str, rows: List[int]):
+        self._fill_jobs.append([parent, prefix, rows, 0])
+        if self._fill_after is None:
+            self._fill_step()
+
+    def _fill_step(self, budget: float | None = FILL_BUDGET):
+        """Satırları kare bütçesiyle ekler; kalanlar sonraki turda (büyük listede UI donmaz)."""
+        self._fill_after = None
+        deadline = time.perf_counter() + budget if budget is not None else None
+        data, tree = self.data, self.tree
+        while self._fill_jobs:
+            job = self._fill_jobs[0]
+            parent, prefix, rows, pos = job
+            while pos < len(rows):
+                i = rows[pos]
+                tree.insert(parent, "end", iid=f"{prefix}{i}", values=self.summary_row(data[i]))
+                pos += 1
+                if deadline is not None and pos % 64 == 0 and time.perf_counter() > deadline:
+                    job[3] = pos
+                    self._fill_after = self.after(1, self._fill_step)
+                    return
+            self._fill_jobs.pop(0)
+
+    def _ensure_filled(self):
+        """Seçim/odak öncesi: bekleyen satırları hemen ekle."""
+        if self._fill_after is not None:
+            self.after_cancel(self._fill_after)
+            self._fill_after = None
+        if self._fill_jobs:
+            self._fill_step(budget=None)
 
     def _reindex_order(self):
         for i, rec in enumerate(self.data):
@@ -205,52 +785,241 @@ class ListEntityTab(BaseTab):
             self.tree.selection_remove(sel)
 
     def _on_add_update(self):
+        if self._converting:
+            return
+        jobs = [(p, key, args) for p in self.media_pickers() for key, args in p.pending_conversions()]
+        if jobs:
+            self._convert_media(jobs)
+            return
         try:
             rec = self.record_from_form()
         except Exception:
             return
-        sel = self.tree.selection()
+        sel = self._selected_indices()
         if sel:
-            idx = int(sel[0])
+            idx = sel[0]
             if 0 <= idx < len(self.data):
+                # formda olmayan meta alanları koru (ör. vendor kaynak URL'leri)
+                old = self.data[idx]
+                if isinstance(old, dict) and "vendored" in old and "vendored" not in rec:
+                    rec["vendored"] = dict(old["vendored"])
+                    prune_vendored(rec)     # kaldırılan / yer değiştiren görsellerin kaynağı kalmasın
                 self.data[idx] = rec
+                self._record_replaced(old, rec)
         else:
+            if not self._confirm_not_duplicate(rec):
+                return
             self.data.append(rec)
+            self._record_added(rec)
         self._save_only()
         self._refresh_table()
 
+    def _convert_media(self, jobs):
+        """Görsel kodlamaları (animasyonlu WebP saniyeler sürebilir) Tk thread'i dışında; bitince Add/Update."""
+        self._converting = True
+        self.btn_add_update.state(["disabled"])
+        sel = self._selected_indices()
+        results: Dict[Any, list] = {}
+        errors: List[str] = []
+        left = [len(jobs)]
+
+        def finish():
+            left[0] -= 1
+            if left[0]:
+                return
+            self._converting = False
+            self.btn_add_update.state(["!disabled"])
+            for picker, res in results.items():
+                picker.apply_conversions(res)
+            if errors:
+                messagebox.showerror("Image Save", "Could not save:\n\n" + "\n".join(errors), parent=self)
+                return
+            # bu arada başka kayıt seçildiyse kaydetme; kullanıcı tekrar basar
+            if self._selected_indices() == sel and not any(p.pending_conversions() for p in self.media_pickers()):
+                self._on_add_update()
+
+        def converted(picker, key, res):
+            results.setdefault(picker, []).append((key, res))
+            finish()
+
+        def failed(src, exc):
+            errors.append(f"{os.path.basename(src)}: {exc}")
+            finish()
+
+        for picker, key, args in jobs:
+            self.app.tasks.run_process(
+                convert_local, *args,
+                on_done=lambda res, p=picker, k=key: converted(p, k, res),
+                on_error=lambda e, src=args[0]: failed(src, e),
+                on_cancel=lambda src=args[0]: failed(src, "cancelled"),
+                title="Convert image")
+
+    def _confirm_not_duplicate(self, rec) -> bool:
+        """Yeni kayıt mevcut bir kayda çok benziyorsa sor (services/near_dupes.py)."""
+        if self._dupes is None:
+            return True         # bu entity'de yok ya da henüz arka planda kuruluyor
+        hits = self._dupes.similar(rec)
+        if not hits:
+            return True
+        lines = []
+        for other, score in hits[:3]:
+            row = self.summary_row(other)
+            lines.append(f"• {' · '.join(str(v) for v in row if v)}  ({score:.0%})")
+        ok = messagebox.askyesno(
+            "Possible duplicate",
+            "This record looks like an existing one:\n\n" + "\n".join(lines) + "\n\nAdd it anyway?",
+            parent=self)
+        if not ok and hits:
+            self._select_record(hits[0][0])
+        return ok
+
     def _on_delete(self):
-        sels = sorted([int(s) for s in self.tree.selection()], reverse=True)
+        sels = sorted(set(self._selected_indices()), reverse=True)
         if not sels:
             return
         for idx in sels:
             if 0 <= idx < len(self.data):
+                self._record_removed(self.data[idx])
                 del self.data[idx]
         self._save_only()
         self._refresh_table()
         self._on_new()
 
+    # ---- Toplu işlemler: tek mutasyon, tek kayıt, tek tablo yenilemesi ----
+    def _build_bulk_menu(self, button: ttk.Menubutton):
+        m = tk.Menu(button, tearoff=False)
+        m.add_command(label="Move to top", command=lambda: self._bulk_move("top"))
+        m.add_command(label="Move to bottom", command=lambda: self._bulk_move("bottom"))
+        m.add_command(label="Move to position…", command=lambda: self._bulk_move("ask"))
+        m.add_command(label="Duplicate", command=self._bulk_duplicate)
+        if self.bulk_fields or self.bulk_tag_fields:
+            m.add_separator()
+        for field, label in self.bulk_fields:
+            m.add_command(label=f"Set {label}…", command=lambda f=field, l=label: self._bulk_set_field(f, l))
+        for field, label in self.bulk_tag_fields:
+            m.add_command(label=f"Add {label} tag…", command=lambda f=field, l=label: self._bulk_add_tag(f, l))
+        m.add_separator()
+        m.add_command(label="Delete selected", command=self._on_delete)
+        button["menu"] = m
+
+    def _selected_records(self) -> List[Dict[str, Any]]:
+        """Seçili kayıtlar, kayıtlı sırada (gruplu görünümde aynı kayıt iki kez seçilebilir)."""
+        return [self.data[i] for i in sorted(set(self._selected_indices()))]
+
+    def _commit_bulk(self, select: List[Dict[str, Any]]):
+        self._save_only()
+        self._refresh_table()
+        self._select_records(select)
+
+    def _bulk_move(self, where: str):
+        recs = self._selected_records()
+        if not recs:
+            return
+        picked = {id(r) for r in recs}
+        rest = [r for r in self.data if id(r) not in picked]
+        if where == "top":
+            pos = 0
+        elif where == "bottom":
+            pos = len(rest)
+        else:
+            pos = simpledialog.askinteger("Move to position", f"Position (1–{len(rest) + 1}):",
+                                          minvalue=1, maxvalue=len(rest) + 1, parent=self)
+            if pos is None:
+                return
+            pos -= 1
+        self._clear_sort()          # kayıtlı sıra değişiyor (bkz. Up/Down)
+        self.data[:] = rest[:pos] + recs + rest[pos:]
+        self._sorted_rows = None
+        self._commit_bulk(recs)
+
+    def _bulk_duplicate(self):
+        recs = self._selected_records()
+        if not recs:
+            return
+        picked = {id(r) for r in recs}
+        out, copies = [], []
+        for rec in self.data:
+            out.append(rec)
+            if id(rec) in picked:
+                dup = copy.deepcopy(rec)
+                out.append(dup)
+                copies.append(dup)
+        self.data[:] = out
+        for dup in copies:
+            self._record_added(dup)
+        self._commit_bulk(copies)
+
+    def _replace_selected(self, change) -> None:
+        """Seçili her kaydın kopyasına change(kopya) uygula; değişenler tek seferde kaydedilir."""
+        recs = self._selected_records()
+        if not recs:
+            return
+        changes = {}
+        for old in recs:
+            new = dict(old)
+            change(new)
+            if new != old:
+                changes[id(old)] = new
+        self.replace_records(changes, select=[changes.get(id(r), r) for r in recs])
+
+    def replace_records(self, changes: Dict[int, Optional[Dict[str, Any]]],
+                        select: List[Dict[str, Any]] | None = None) -> int:
+        """
+        id(kayıt) -> yeni kayıt (None: sil); toplu işlemler ve etiket yeniden adlandırma için.
+        Tek kayıt (write-behind) + tek tablo yenilemesi; değişen kayıt sayısını döner.
+        """
+        if not changes:
+            return 0
+        out, n = [], 0
+        for rec in self.data:
+            if id(rec) in changes:
+                new = changes[id(rec)]
+                n += 1
+                if new is None:
+                    self._record_removed(rec)
+                    continue
+                self._record_replaced(rec, new)
+                rec = new
+            out.append(rec)
+        self.data[:] = out
+        self._commit_bulk(select or [])
+        return n
+
+    def _bulk_set_field(self, field: str, label: str):
+        if not self._selected_records():
+            return
+        value = simpledialog.askstring(f"Set {label}", f"{label} for the selected records:", parent=self)
+        if value is None:
+            return
+        try:
+            self._replace_selected(lambda rec: self.bulk_set(rec, field, value.strip()))
+        except ValueError as e:
+            messagebox.showerror(f"Set {label}", str(e), parent=self)
+
+    def _bulk_add_tag(self, field: str, label: str):
+        if not self._selected_records():
+            return
+        tag = simpledialog.askstring(f"Add {label} tag", f"{label} tag to add:", parent=self)
+        tag = (tag or "").strip()
+        if not tag:
+            return
+        self._replace_selected(lambda rec: self.bulk_add_tag(rec, field, tag))
+
     # ---- Reorder (anında kaydet) ----
     def _move_selected(self, direction: int):
-        sel = self.tree.selection()
+        sel = self._selected_indices()
         if not sel:
             return
-        try:
-            idx = int(sel[0])
-        except Exception:
-            return
+        idx = sel[0]
         new_idx = idx + direction
         if new_idx < 0 or new_idx >= len(self.data):
             return
+        # Up/Down kayıtlı sırayı değiştirir; sıralı görünümde anlamsız -> kayıtlı sıraya dön
+        self._clear_sort()
         self.data[new_idx], self.data[idx] = self.data[idx], self.data[new_idx]
-        self._save_only()
+        self._save_only(coalesce=("move", id(self.data[new_idx])))     # art arda Up/Down tek adım
         self._refresh_table()
-        try:
-            self.tree.selection_set(str(new_idx))
-            self.tree.focus(str(new_idx))
-            self.tree.see(str(new_idx))
-        except Exception:
-            pass
+        self._select_index(new_idx)
 
     def _move_up(self):
         self._move_selected(-1)
@@ -258,11 +1027,41 @@ class ListEntityTab(BaseTab):
     def _move_down(self):
         self._move_selected(1)
 
+    # ---- Geri al / yinele (Ctrl+Z / Ctrl+Y; bkz. services/undo.py) ----
+    def undo(self) -> bool:
+        return self._step_history(redo=False)
+
+    def redo(self) -> bool:
+        return self._step_history(redo=True)
+
+    def _step_history(self, redo: bool) -> bool:
+        step = self._history.redo(self.data) if redo else self._history.undo(self.data)
+        if step is None:
+            return False
+        gone, back = (step.removed, step.inserted) if redo else (step.inserted, step.removed)
+        gone_ids, back_ids = {id(r) for r in gone}, {id(r) for r in back}
+        for rec in gone:
+            if id(rec) not in back_ids:
+                self._record_removed(rec)
+        added = [rec for rec in back if id(rec) not in gone_ids]
+        for rec in added:
+            self._record_added(rec)
+        self._sorted_rows = None
+        self._write()           # write-behind: hızlı Ctrl+Z'ler tek yazımda birleşir
+        self._refresh_table()
+        if added:
+            self._select_records(added)
+        elif self.data:
+            self._select_index(min(step.parts[-1].start, len(self.data) - 1))
+        else:
+            self._on_new()
+        return True
+
     def _on_select(self, _event=None):
-        sel = self.tree.selection()
+        sel = self._selected_indices()
         if not sel:
-            return
-        idx = int(sel[0])
+            return      # grup düğümü
+        idx = sel[0]
         if 0 <= idx < len(self.data):
             try:
                 self.set_form(self.data[idx])
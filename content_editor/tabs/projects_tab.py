@@ -12,6 +12,8 @@ from .list_tab import ListEntityTab
 class ProjectsTab(ListEntityTab):
     entity_name = "projects"
     columns = ["title", "date", "origin", "areas", "topics", "stack"]
+    group_fields = [("origin", "Origin"), ("areas", "Area")]
+    bulk_tag_fields = [("stack", "Stack"), ("areas", "Area"), ("topics", "Topic")]
 
     def build_form(self, parent):
         f = ttk.Frame(parent)
@@ -37,6 +39,9 @@ class ProjectsTab(ListEntityTab):
         self.stack  = CommaListEntry(f, "Stack (technologies, comma separated)\nex: Python, TensorFlow, Docker")
         self.areas  = CommaListEntry(f, "Areas (broader fields, comma separated)\nex: Embedded Systems, Game Programming")
         self.topics = CommaListEntry(f, "Topics (methods/subfields, comma separated)\nex: CNN, GAN, NLP")
+        self.stack.set_completer(self.app.tag_completer("stack"))
+        self.areas.set_completer(self.app.tag_completer("areas"))
+        self.topics.set_completer(self.app.tag_completer("topics"))
 
         # --- Linkler / highlights
         self.link_gh   = LabeledEntry(f, "GitHub URL", width=60)
@@ -66,6 +71,9 @@ class ProjectsTab(ListEntityTab):
         f.columnconfigure(0, weight=1)
         return f
 
+    def media_pickers(self):
+        return [self.gallery]
+
     def record_from_form(self) -> Dict[str, Any]:
         # Tarih
         date_str = self.date_picker.get()
@@ -152,3 +160,11 @@ class ProjectsTab(ListEntityTab):
         stack_short  = ", ".join((rec.get("stack")  or [])[:2])
 
         return [title, date_show, origin_label or "", areas_short, topics_short, stack_short]
+
+    def group_values(self, field: str, rec: Dict[str, Any]) -> List[str]:
+        if field == "origin":
+            label = rec.get("origin_label")
+            if not label:
+                label = {"personal": "Personal", "tutorial": "Tutorial/Course"}.get(rec.get("origin"), "")
+            return [label]
+        return super().group_values(field, rec)
@@ -28,6 +28,9 @@ class SocialsTab(ListEntityTab):
         f.columnconfigure(0, weight=1)
         return f
 
+    def media_pickers(self):
+        return [self.icon]
+
     def record_from_form(self) -> Dict[str, Any]:
         return {
             "platform": self.platform.get(),
@@ -3,6 +3,7 @@ import os, shutil
 from tkinter import ttk, filedialog, messagebox
 from typing import Any, Dict, List
 from widgets.fields import LabeledEntry
+from services.svg_optimize import minify_file
 from .list_tab import ListEntityTab
 
 class StackTab(ListEntityTab):
@@ -17,6 +18,8 @@ class StackTab(ListEntityTab):
     """
     entity_name = "stack"
     columns = ["name", "category", "link"]
+    group_fields = [("category", "Category")]
+    bulk_fields = [("category", "Category")]
 
     # ---- UI ----
     def build_form(self, parent):
@@ -63,8 +66,18 @@ class StackTab(ListEntityTab):
             name_slug = self._slug(self.name.get() or "logo")
             base, ext = os.path.splitext(fp)
             ext = (ext or ".png").lower()
+            # Aynı adla bir .svg varsa raster yerine vektörü önermek
+            if ext != ".svg" and os.path.isfile(base + ".svg") and messagebox.askyesno(
+                    "Use SVG?",
+                    f"{os.path.basename(base)}.svg is next to the picked file.\n"
+                    "Use the vector version instead?", parent=self):
+                fp, ext = base + ".svg", ".svg"
             dst = os.path.join(logos_dir, f"{name_slug}{ext}")
-            shutil.copyfile(fp, dst)
+            if ext == ".svg":
+                minify_file(fp, dst)       # vektör kalır; metadata/editör verisi atılır
+            else:
+                shutil.copyfile(fp, dst)
+            # eski uzantılı kopya silinmez: kayıt/geri al hâlâ ona işaret edebilir, Clean Assets toplar
 
             rel = os.path.join("content", "stack_logos", os.path.basename(dst)).replace("\\", "/")
             self.logo_path_field.set(rel)
@@ -0,0 +1,49 @@
+# Testler content_editor/ kökünden çalışır (uygulama gibi: "from services.x import ...")
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def http_server():
+    """
+    Yerel stand-in HTTP sunucusu: start({"/yol": fn}) taban URL'i döner.
+    fn(handler) -> (durum, başlıklar, gövde); tanımsız yollar 404.
+    """
+    servers = []
+
+    def start(routes):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                fn = routes.get(self.path.split("?")[0])
+                status, headers, body = fn(self) if fn else (404, {}, b"not found")
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_HEAD = _serve
+
+            def log_message(self, *_a):
+                pass
+
+        srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return f"http://127.0.0.1:{srv.server_port}"
+
+    yield start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
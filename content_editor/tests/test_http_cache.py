@@ -0,0 +1,36 @@
+from urllib.error import HTTPError
+
+import pytest
+
+from services.http_cache import HttpCache
+
+
+def _etag_routes(seen):
+    def logo(h):
+        inm = h.headers.get("If-None-Match")
+        seen.append(inm)
+        if inm == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"', "Content-Type": "image/png"}, b"PNGDATA"
+    return {"/logo.png": logo}
+
+
+def test_revalidates_with_etag_and_serves_body_on_304(http_server, tmp_path):
+    seen = []
+    url = http_server(_etag_routes(seen)) + "/logo.png"
+    cache = HttpCache(tmp_path)
+
+    assert cache.fetch(url) == b"PNGDATA"
+    assert cache.cached_meta(url)["etag"] == '"v1"'
+    assert cache.fetch(url) == b"PNGDATA"
+    assert seen == [None, '"v1"']
+
+
+def test_404_is_raised_and_not_cached(http_server, tmp_path):
+    url = http_server({}) + "/missing.png"
+    cache = HttpCache(tmp_path)
+    with pytest.raises(HTTPError) as ei:
+        cache.fetch(url)
+    assert ei.value.code == 404
+    assert cache.cached_meta(url) is None
+
@@ -0,0 +1,21 @@
+from services.link_checker import LinkChecker, ResultCache
+
+
+def test_redirects_against_local_server(http_server, tmp_path):
+    base = http_server({
+        "/ok": lambda h: (200, {}, b"ok"),
+        "/moved": lambda h: (301, {"Location": "/ok"}, b""),
+        "/loop": lambda h: (302, {"Location": "/loop"}, b""),
+        "/noloc": lambda h: (302, {}, b""),
+    })
+    checker = LinkChecker(cache=ResultCache(tmp_path / "links.json"), host_delay=0)
+    res = checker.check([base + p for p in ("/ok", "/moved", "/loop", "/noloc", "/missing")])
+
+    assert res[base + "/ok"].ok and res[base + "/ok"].status == 200
+    moved = res[base + "/moved"]
+    assert moved.ok and moved.final_url == base + "/ok"
+    loop = res[base + "/loop"]
+    assert not loop.ok and loop.status == 302 and loop.error == "too many redirects"
+    noloc = res[base + "/noloc"]
+    assert not noloc.ok and noloc.error == "redirect without Location"
+    assert not res[base + "/missing"].ok and res[base + "/missing"].status == 404
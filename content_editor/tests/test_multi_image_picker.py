@@ -0,0 +1,67 @@
+from PIL import Image
+
+from widgets.multi_image_picker import MultiImagePicker, match_cover
+
+
+def _gif(path):
+    frames = [Image.new("RGB", (16, 16), c) for c in ("red", "green", "blue")]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=80, loop=0)
+    return str(path)
+
+
+def _picker(public):
+    # Tk penceresi olmadan: sadece get/set'in kullandığı durum
+    p = MultiImagePicker.__new__(MultiImagePicker)
+    p.items, p.cover_idx = [], None
+    p.public_dir_cb, p.tab_key, p.name_cb = (lambda: str(public)), "projects", (lambda: "demo")
+    p._refresh = lambda: None
+    return p
+
+
+def test_match_cover_maps_poster_to_animation():
+    images = ["images/p/a_1.png", "images/p/a_2.webp"]
+    assert match_cover(images, "images/p/a_1.png") == (0, None)
+    assert match_cover(images, "images/p/a_2_poster.png") == (1, "images/p/a_2_poster.png")
+    assert match_cover(images, "images/p/other_poster.png") == (None, None)
+    assert match_cover(images, None) == (None, None)
+
+
+def test_animated_cover_survives_get_set_get(tmp_path):
+    public = tmp_path / "public"
+    p = _picker(public)
+    p.items = [{"kind": "local", "value": _gif(tmp_path / "anim.gif")}]
+    p.cover_idx = 0
+    first = p.get()
+    assert first["cover"].endswith("_poster.png")
+    assert first["cover"] not in first["images"]
+    assert (public / first["cover"]).is_file()
+
+    p.set(first["images"], first["cover"])
+    assert p.cover_idx == 0
+    assert p.get() == first
+
+
+def test_conversions_run_in_a_process_pool_then_get_is_pure(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+    from services.image_convert import convert_local
+
+    public = tmp_path / "public"
+    still = tmp_path / "still.jpg"
+    Image.new("RGB", (8, 8), "navy").save(still)
+    p = _picker(public)
+    p.items = [{"kind": "local", "value": str(still)},
+               {"kind": "local", "value": _gif(tmp_path / "anim.gif")}]
+    p.cover_idx = 1
+
+    jobs = p.pending_conversions()
+    assert not public.exists()              # plan diske dokunmaz
+    with ProcessPoolExecutor(max_workers=2) as ex:   # ListEntityTab._convert_media gibi
+        results = [(it, ex.submit(convert_local, *args).result()) for it, args in jobs]
+    p.apply_conversions(results)
+
+    assert p.pending_conversions() == []
+    out = p.get()
+    assert out["images"][0] == "images/projects/demo_1.png"
+    assert out["images"][1].startswith("images/projects/demo_2.")
+    assert out["cover"] == "images/projects/demo_2_poster.png"
+    assert all((public / rel).is_file() for rel in out["images"] + [out["cover"]])
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+from services.perceptual_hash import MultiIndex, PerceptualIndex, hamming, shared_index
+from services.stat_cache import StatCache
+
+
+@pytest.mark.parametrize("radius", [0, 14, 20, 40])
+def test_multi_index_matches_brute_force(radius):
+    rng = random.Random(radius)
+    hashes = [rng.getrandbits(1024) for _ in range(300)]
+    for i in range(0, 300, 3):          # yakın komşular: 0..45 bit farklı
+        h = hashes[i]
+        for b in rng.sample(range(1024), rng.randint(0, 45)):
+            h ^= 1 << b
+        hashes[i + 1] = h
+    index = MultiIndex()
+    for i, h in enumerate(hashes):
+        index.add(h, str(i))
+
+    for i in range(0, 300, 5):
+        want = sorted((hamming(hashes[i], h), str(j)) for j, h in enumerate(hashes)
+                      if hamming(hashes[i], h) <= radius)
+        assert index.query(hashes[i], radius) == want
+
+
+def test_multi_index_remove_and_replace():
+    index = MultiIndex()
+    index.add(0, "a")
+    index.add(1, "b")
+    index.add(0b111 << 900, "a")        # aynı anahtar: eski hash'in yerine
+    assert index.query(0, 1) == [(1, "b")]
+    index.remove("b")
+    assert index.query(0, 1) == [] and len(index) == 1
+
+
+def _image(path, shape):
+    im = Image.new("RGB", (64, 64), "white")
+    d = ImageDraw.Draw(im)
+    if shape == "box":
+        d.rectangle((8, 8, 40, 56), fill="black")
+    else:
+        d.ellipse((20, 4, 60, 44), fill="navy")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    im.save(path)
+
+
+def test_build_is_incremental(tmp_path, monkeypatch):
+    public = tmp_path / "public"
+    _image(public / "images" / "a.png", "box")
+    _image(public / "images" / "b.png", "circle")
+    index = PerceptualIndex(public, cache=StatCache(tmp_path / "phash.json")).build()
+    assert set(index.hashes) == {"images/a.png", "images/b.png"}
+
+    hashed = []
+    import services.perceptual_hash as ph
+    real = ph.hash_image
+    monkeypatch.setattr(ph, "hash_image", lambda p: hashed.append(p) or real(p))
+    (public / "images" / "b.png").unlink()
+    _image(public / "images" / "c.png", "box")
+    index.build()
+
+    assert [p.replace("\\", "/").rsplit("/", 2)[-1] for p in hashed] == ["c.png"]
+    assert set(index.hashes) == {"images/a.png", "images/c.png"}
+    assert [rel for _d, rel in index.matches_for_file(str(public / "images" / "a.png"))] == [
+        "images/a.png", "images/c.png"]
+
+
+def test_shared_index_is_one_per_public_dir(tmp_path):
+    assert shared_index(tmp_path) is shared_index(tmp_path / ".")
+    assert shared_index(tmp_path) is not shared_index(tmp_path / "other")
@@ -0,0 +1,38 @@
+from PIL import Image
+
+from services import recompress
+
+
+def _noisy(size=64):
+    im = Image.new("RGB", (size, size))
+    im.putdata([((x * 7) % 256, (y * 13) % 256, (x * y) % 256) for y in range(size) for x in range(size)])
+    return im
+
+
+def test_jpeg_pixels_never_change(tmp_path):
+    src = tmp_path / "photo.jpg"
+    _noisy().save(src, format="JPEG", quality=90)
+    raw = src.read_bytes()
+    with Image.open(src) as im:
+        pixels = im.tobytes()
+
+    r = recompress.recompress_file(str(src), "images/photo.jpg")
+
+    assert r["error"] is None
+    if recompress.JPEGTRAN is None:
+        assert r["kind"] == recompress.NO_JPEGTRAN and src.read_bytes() == raw
+    with Image.open(src) as im:
+        assert im.tobytes() == pixels
+
+
+def test_png_recompression_is_lossless(tmp_path):
+    src = tmp_path / "logo.png"
+    _noisy().convert("RGBA").save(src, format="PNG", compress_level=0)
+    with Image.open(src) as im:
+        pixels = im.convert("RGBA").tobytes()
+
+    r = recompress.recompress_file(str(src), "images/logo.png")
+
+    assert r["kind"] == "recompressed" and r["after"] < r["before"]
+    with Image.open(src) as im:
+        assert im.convert("RGBA").tobytes() == pixels
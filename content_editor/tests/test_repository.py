@@ -0,0 +1,35 @@
+import threading
+
+from services.repository import Repository
+
+
+def test_concurrent_saves_of_one_entity_never_collide(tmp_path):
+    repo = Repository(tmp_path)
+    payloads = [[{"name": f"writer {w}", "n": i} for i in range(200)] for w in range(2)]
+    errors = []
+
+    def writer(data):
+        try:
+            for _ in range(50):
+                repo.save("certificates", data)
+        except Exception as e:      # eski sabit .json.tmp ile: FileNotFoundError
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(p,)) for p in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert repo.load("certificates") in payloads        # karışık içerik yok
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_discarded_stage_leaves_target_untouched(tmp_path):
+    repo = Repository(tmp_path)
+    repo.save("projects", [{"title": "old"}])
+    tmp = repo.stage("projects", [{"title": "new"}])
+    repo.discard_staged(tmp)
+    assert repo.load("projects") == [{"title": "old"}]
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,52 @@
+import json
+import os
+
+from PIL import Image
+
+from services.repository import Repository
+from services.sprites import build_sprites
+from services.stat_cache import StatCache
+
+
+def _setup(tmp_path):
+    content = tmp_path / "public" / "content"
+    logos = content / "stack_logos"
+    logos.mkdir(parents=True)
+    Image.new("RGBA", (32, 32), "red").save(logos / "a.png")
+    (logos / "b.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8">'
+                                 '<rect width="8" height="8"/></svg>', encoding="utf-8")
+    (content / "stack.json").write_text(json.dumps([
+        {"name": "A", "logo_path": "content/stack_logos/a.png"},
+        {"name": "B", "logo_path": "content/stack_logos/b.svg"},
+    ]), encoding="utf-8")
+    return Repository(content), tmp_path / "public"
+
+
+def test_checkout_mtimes_do_not_invalidate_sprites(tmp_path):
+    repo, public = _setup(tmp_path)
+    assert build_sprites(repo, cache=StatCache(tmp_path / "c1.json")).changed
+
+    for p in (public / "content" / "stack_logos").iterdir():
+        os.utime(p, ns=(1, 1))              # clone / checkout: içerik aynı, mtime farklı
+    # yeni makinede önbellek de yok
+    assert not build_sprites(repo, cache=StatCache(tmp_path / "c2.json")).changed
+
+
+def test_atlas_and_symbol_names_follow_content(tmp_path):
+    repo, public = _setup(tmp_path)
+    cache = StatCache(tmp_path / "c.json")
+    build_sprites(repo, cache=cache)
+    first = json.loads((public / "content" / "sprites" / "sprites.json").read_text(encoding="utf-8"))
+    atlas = first["atlases"][0]["file"]
+    symbol = first["symbols"]["content/stack_logos/b.svg"]["file"]
+    assert atlas.startswith("content/sprites/logos-0-") and symbol.startswith("content/sprites/logos-")
+
+    Image.new("RGBA", (32, 32), "blue").save(public / "content" / "stack_logos" / "a.png")
+    assert build_sprites(repo, cache=cache).changed
+    second = json.loads((public / "content" / "sprites" / "sprites.json").read_text(encoding="utf-8"))
+
+    assert second["atlases"][0]["file"] != atlas            # yeni URL: eski önbellek kullanılmaz
+    assert second["symbols"]["content/stack_logos/b.svg"]["file"] == symbol
+    assert not (public / atlas).exists()
+    assert sorted(p.name for p in (public / "content" / "sprites").iterdir()) == sorted(
+        [os.path.basename(second["atlases"][0]["file"]), os.path.basename(symbol), "sprites.json"])
@@ -0,0 +1,32 @@
+import re
+
+from services.svg_optimize import minify_svg, round_path
+
+
+def _path_d(svg: bytes) -> str:
+    return re.search(rb' d="([^"]*)"', svg).group(1).decode()
+
+
+def test_compact_arc_flags_keep_the_endpoint():
+    assert round_path("M10 10a5 5 0 0110 10l1e-7 5", 3) == "M10 10a5 5 0 0 1 10 10l0 5"
+    assert round_path("M0 0A1 1 0 1 0 .5.5", 3) == "M0 0A1 1 0 1 0 .5.5"
+    # yinelenen yay parametreleri de bayrak konumunu korur
+    assert round_path("M0 0a1 1 0 001 1 1 1 0 10 2 2", 3) == "M0 0a1 1 0 0 0 1 1 1 1 0 1 0 2 2"
+
+
+def test_path_rounding_and_compact_separators():
+    assert round_path("M1.23456.5L-2-3.25004z", 3) == "M1.235.5L-2-3.25z"
+    assert round_path("M0,0 q1,2 3,4", 3) == "M0 0q1 2 3 4"
+
+
+def test_unparseable_path_is_left_alone():
+    assert round_path("M0 0 L foo", 3) == "M0 0 L foo"
+
+
+def test_minify_keeps_simple_icons_style_arcs():
+    d = "M12 0C5.373 0 0 5.373 0 12a12 12 0 0012 12 12 12 0 0012-12A12 12 0 0012 0z"
+    svg = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">'
+           '<!-- comment padding so the output is smaller -->'
+           f'<path d="{d}"/></svg>').encode()
+    assert _path_d(minify_svg(svg)) == (
+        "M12 0C5.373 0 0 5.373 0 12a12 12 0 0 0 12 12 12 12 0 0 0 12-12A12 12 0 0 0 12 0z")
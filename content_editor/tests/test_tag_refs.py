@@ -0,0 +1,67 @@
+from services.tag_refs import TagRefIndex, apply_changes, rewrite_list, tag_key
+
+
+def _index(**entities):
+    refs = TagRefIndex()
+    for name, recs in entities.items():
+        refs.set_entity(name, recs)
+    return refs
+
+
+def test_rewrite_list_renames_and_dedupes():
+    assert rewrite_list(["Tensorflow", "Python"], tag_key("tensorflow"), "TensorFlow") == ["TensorFlow", "Python"]
+    # birleştirme: hedef zaten listede -> ilk konum kalır, tekrar yok
+    assert rewrite_list(["PyTorch", "Torch", "Python"], tag_key("Torch"), "PyTorch") == ["PyTorch", "Python"]
+    assert rewrite_list(["Torch", "Python", "PyTorch"], tag_key("Torch"), "PyTorch") == ["PyTorch", "Python"]
+    # dize olmayan öğelere dokunulmaz
+    assert rewrite_list(["Torch", 3], tag_key("Torch"), "PyTorch") == ["PyTorch", 3]
+
+
+def test_spelling_only_rename_updates_every_spelling_and_the_definition():
+    stack = [{"name": "Tensorflow"}]
+    projects = [{"title": "a", "stack": ["tensorflow"]}, {"title": "b", "stack": ["TensorFlow"]},
+                {"title": "c", "stack": ["Python"]}]
+    refs = _index(stack=stack, projects=projects)
+
+    changes = refs.plan_rename("tensorflow", "TensorFlow")
+
+    assert set(changes["projects"]) == {id(projects[0])}        # zaten doğru yazılanlar değişmez
+    assert changes["projects"][id(projects[0])]["stack"] == ["TensorFlow"]
+    assert changes["stack"] == {id(stack[0]): {"name": "TensorFlow"}}
+    assert projects[0]["stack"] == ["tensorflow"]               # plan yerinde değiştirmez
+
+
+def test_merge_into_existing_tag_drops_the_extra_definition():
+    stack = [{"name": "Torch"}, {"name": "PyTorch"}]
+    certs = [{"name": "x", "stack": ["Torch", "PyTorch"]}, {"name": "y", "stack": ["torch"]}]
+    refs = _index(stack=stack, certificates=certs)
+
+    changes = refs.plan_rename("Torch", "PyTorch")
+
+    assert changes["stack"] == {id(stack[0]): None}
+    new_certs = apply_changes(certs, changes["certificates"])
+    assert [c["stack"] for c in new_certs] == [["PyTorch"], ["PyTorch"]]
+    assert apply_changes(stack, changes["stack"]) == [{"name": "PyTorch"}]
+
+
+def test_experience_stack_and_tech_are_both_rewritten():
+    exp = [{"title": "job", "stack": ["Js", "React"], "tech": ["Js", "React"]},
+           {"title": "old", "tech": ["js"]}]
+    refs = _index(experience=exp)
+
+    changes = refs.plan_rename("js", "JavaScript")["experience"]
+
+    assert changes[id(exp[0])]["stack"] == ["JavaScript", "React"]
+    assert changes[id(exp[0])]["tech"] == ["JavaScript", "React"]
+    assert changes[id(exp[1])] == {"title": "old", "tech": ["JavaScript"]}
+    assert "stack" not in changes[id(exp[1])]
+    assert "stack" not in refs.plan_rename("js", "JavaScript")      # tanım yoksa stack.json'a dokunma
+
+
+def test_plan_uses_current_records_after_set_entity():
+    projects = [{"title": "a", "stack": ["Js"]}]
+    refs = _index(projects=projects)
+    edited = dict(projects[0], title="a2")          # sekme kaydı yenisiyle değiştirdi
+    projects[0] = edited
+    refs.set_entity("projects", projects)           # App.rename_tag önce bunu yapar
+    assert list(refs.plan_rename("Js", "JavaScript")["projects"]) == [id(edited)]
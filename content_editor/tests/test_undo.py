@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+import services.undo as undo
+from services.undo import UndoHistory, diff_splices
+
+
+def _recs(n):
+    return [{"i": i} for i in range(n)]
+
+
+def _same(a, b):
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def _edits(rng, data):
+    """Sekmelerin yaptığı türden düzenlemeler (kayıtlar yerinde değişmez, yenisi konur)."""
+    data = list(data)
+    kind = rng.choice(["replace", "add", "delete_far", "move", "bulk_set", "sort"])
+    if kind == "replace":
+        i = rng.randrange(len(data))
+        data[i] = dict(data[i], edited=True)
+    elif kind == "add":
+        data.insert(rng.randrange(len(data) + 1), {"new": rng.random()})
+    elif kind == "delete_far":
+        for i in sorted(rng.sample(range(len(data)), 2), reverse=True):
+            del data[i]
+    elif kind == "move":
+        rec = data.pop(rng.randrange(len(data)))
+        data.insert(rng.randrange(len(data) + 1), rec)
+    elif kind == "bulk_set":
+        for i in rng.sample(range(len(data)), 3):
+            data[i] = dict(data[i], cat="x")
+    else:
+        data.sort(key=lambda r: rng.random())
+    return data
+
+
+def test_random_edits_undo_and_redo_exactly():
+    rng = random.Random(7)
+    hist = UndoHistory()
+    states = [_recs(50)]
+    data = list(states[0])
+    for _ in range(200):
+        after = _edits(rng, data)
+        before = list(data)
+        data[:] = after
+        if hist.record(before, data):       # yerine geri taşıma: adım yok
+            states.append(list(data))
+    for state in reversed(states[:-1]):
+        hist.undo(data)
+        assert _same(data, state)
+    for state in states[1:]:
+        hist.redo(data)
+        assert _same(data, state)
+
+
+def test_far_apart_bulk_delete_keeps_only_the_removed_records():
+    before = _recs(10_000)
+    after = before[:10] + before[11:9_990] + before[9_991:]
+    parts = diff_splices(before, after)
+    assert [(p.start, len(p.removed), len(p.inserted)) for p in parts] == [(10, 1, 0), (9_989, 1, 0)]
+
+
+def test_far_apart_bulk_set_and_move_are_small_steps():
+    before = _recs(10_000)
+    after = list(before)
+    after[5], after[9_000] = dict(before[5], c=1), dict(before[9_000], c=1)
+    assert sum(len(p.removed) + len(p.inserted) for p in diff_splices(before, after)) == 4
+
+    moved = list(before)
+    rec = moved.pop(20)
+    moved.insert(9_500, rec)
+    parts = diff_splices(before, moved)
+    assert sum(len(p.removed) + len(p.inserted) for p in parts) == 2
+    data = list(before)
+    for p in parts:
+        p.apply(data)
+    assert _same(data, moved)
+
+
+def test_full_reorder_falls_back_to_one_splice():
+    before = _recs(100)
+    after = before[::-1]
+    assert len(diff_splices(before, after)) == 1
+
+
+def test_coalescing_by_key_and_time(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(undo.time, "monotonic", lambda: now[0])
+    hist = UndoHistory()
+    data = _recs(10)
+
+    def edit(i, key):
+        before = list(data)
+        data[i] = dict(data[i], v=now[0])
+        hist.record(before, data, coalesce=key)
+
+    edit(1, "move")
+    now[0] += 0.5
+    edit(8, "move")                 # aynı anahtar, süre içinde: aynı adım
+    assert len(hist) == 1
+    now[0] += undo.COALESCE_S + 0.1
+    edit(2, "move")                 # süre doldu: yeni adım
+    edit(3, None)                   # anahtarsız: her zaman yeni adım
+    assert len(hist) == 3
+
+    hist.undo(data)
+    hist.undo(data)
+    step = hist.undo(data)
+    assert len(step.parts) == 2 and "v" not in data[1] and "v" not in data[8]
+
+    hist.redo(data)
+    edit(5, "move")                 # yinelenen adım sonraki düzenlemeyle birleşmez
+    assert len(hist) == 2
+
+
+def test_no_change_records_nothing():
+    hist = UndoHistory()
+    data = _recs(3)
+    assert not hist.record(list(data), data)
+    assert not hist.can_undo()
+
+
+@pytest.mark.parametrize("before,after", [
+    ([], [1]), ([1], []), ([1, 2, 3], [1, 2, 3, 4]), ([0, 1, 2], [2, 1, 0]),
+])
+def test_diff_splices_edge_cases(before, after):
+    before = [{"k": k} for k in before]
+    by_key = {r["k"]: r for r in before}
+    after = [by_key.get(k) or {"k": k} for k in after]
+    data = list(before)
+    parts = diff_splices(before, after)
+    for p in parts:
+        p.apply(data)
+    assert _same(data, after)
+    for p in reversed(parts):
+        p.revert(data)
+    assert _same(data, before)
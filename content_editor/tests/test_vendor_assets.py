@@ -0,0 +1,82 @@
+import functools
+import json
+
+import cli
+from services.http_cache import HttpCache
+
+
+def test_vendor_reports_404_as_failed_and_exits_1(http_server, tmp_path, monkeypatch, capsys):
+    base = http_server({"/ok.png": lambda h: (200, {"Content-Type": "image/png"}, b"\x89PNG ok")})
+    content = tmp_path / "public" / "content"
+    content.mkdir(parents=True)
+    (content / "stack.json").write_text(json.dumps([
+        {"name": "Good", "logo_url": base + "/ok.png"},
+        {"name": "Gone", "logo_url": base + "/missing.png"},
+    ]), encoding="utf-8")
+    # kullanıcının önbelleğine dokunma
+    monkeypatch.setattr(cli, "Downloader", functools.partial(cli.Downloader, http=HttpCache(tmp_path / "http")))
+
+    rc = cli.main(["--content-root", str(content), "vendor", "--retries", "0"])
+
+    out = capsys.readouterr().out
+    assert rc == 1
+    assert f"FAILED  stack[1].logo_url: {base}/missing.png" in out
+    assert "404" in out
+    stack = json.loads((content / "stack.json").read_text(encoding="utf-8"))
+    assert "logo_path" not in stack[1]
+    assert (tmp_path / "public" / stack[0]["logo_path"]).read_bytes() == b"\x89PNG ok"
+
+
+def _project_repo(tmp_path, images):
+    from services.repository import Repository
+    content = tmp_path / "public" / "content"
+    content.mkdir(parents=True)
+    (content / "projects.json").write_text(json.dumps([{"title": "P", "images": images}]), encoding="utf-8")
+    return Repository(content)
+
+
+def test_refresh_after_reorder_writes_each_url_to_its_own_file(http_server, tmp_path):
+    from services.vendor_assets import Downloader, prune_vendored, vendor_assets
+    bodies = {"/a.png": b"A1", "/b.png": b"B1"}
+    base = http_server({p: (lambda h, p=p: (200, {"Content-Type": "image/png"}, bodies[p])) for p in bodies})
+    repo = _project_repo(tmp_path, [base + "/a.png", base + "/b.png"])
+    dl = Downloader(http=HttpCache(tmp_path / "http"), retries=0)
+    public = tmp_path / "public"
+
+    vendor_assets(repo, downloader=dl)
+    rec = repo.load("projects")[0]
+    rel_a, rel_b = rec["images"]
+    assert rec["vendored"] == {rel_a: base + "/a.png", rel_b: base + "/b.png"}
+
+    # sekmede yeniden sıralama + kaydetme (ListEntityTab._on_add_update gibi)
+    rec["images"] = [rel_b, rel_a]
+    prune_vendored(rec)
+    repo.save("projects", [rec])
+
+    bodies.update({"/a.png": b"A2", "/b.png": b"B2"})
+    report = vendor_assets(repo, refresh=True, downloader=dl)
+
+    assert not report.failed
+    assert (public / rel_a).read_bytes() == b"A2"
+    assert (public / rel_b).read_bytes() == b"B2"
+
+
+def test_legacy_position_keys_never_overwrite_a_moved_file(http_server, tmp_path):
+    from services.vendor_assets import Downloader, vendor_assets, vendored_rel
+    bodies = {"/a.png": b"A1", "/b.png": b"B1"}
+    base = http_server({p: (lambda h, p=p: (200, {"Content-Type": "image/png"}, bodies[p])) for p in bodies})
+    rel_a, rel_b = vendored_rel(base + "/a.png"), vendored_rel(base + "/b.png")
+    repo = _project_repo(tmp_path, [])
+    repo.save("projects", [{"title": "P", "images": [rel_b, rel_a],
+                            "vendored": {"images[0]": base + "/a.png", "images[1]": base + "/b.png"}}])
+    public = tmp_path / "public"
+    for rel, body in ((rel_a, b"A1"), (rel_b, b"B1")):
+        (public / rel).parent.mkdir(parents=True, exist_ok=True)
+        (public / rel).write_bytes(body)
+
+    bodies.update({"/a.png": b"A2", "/b.png": b"B2"})
+    vendor_assets(repo, refresh=True, downloader=Downloader(http=HttpCache(tmp_path / "http"), retries=0))
+
+    # konumlar karıştı: eski anahtarlar dosya adındaki URL özetiyle eşleşmiyor -> dokunulmaz
+    assert (public / rel_a).read_bytes() == b"A1"
+    assert (public / rel_b).read_bytes() == b"B1"
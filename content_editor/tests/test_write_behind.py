@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from services.write_behind import WriteBehind
+
+
+class _Root:
+    def __init__(self):
+        self.timers, self._n = {}, 0
+
+    def after(self, _ms, fn):
+        self._n += 1
+        self.timers[self._n] = fn
+        return self._n
+
+    def after_cancel(self, tid):
+        self.timers.pop(tid, None)
+
+    def fire(self):
+        timers, self.timers = self.timers, {}
+        for fn in timers.values():
+            fn()
+
+
+class _Handle:
+    def __init__(self, fut):
+        self._future = fut
+
+
+class _Runtime:
+    """Geri çağrıları Tk kuyruğu gibi bekletir: deliver() ile sonradan çalışır."""
+
+    def __init__(self):
+        self.root = _Root()
+        self.pool = ThreadPoolExecutor(max_workers=2)
+        self.queued = []
+
+    def run_thread(self, fn, on_done=None, on_error=None, title=""):
+        fut = self.pool.submit(fn, None)
+        self.queued.append((fut, on_done, on_error))
+        return _Handle(fut)
+
+    def deliver(self):
+        queued, self.queued = self.queued, []
+        for fut, on_done, on_error in queued:
+            exc = fut.exception()
+            if exc is None:
+                on_done(fut.result())
+            else:
+                on_error(exc)
+
+
+class _Repo:
+    def __init__(self, fail_first: int):
+        self.fail_first, self.saved = fail_first, []
+
+    def save(self, name, data):
+        if self.fail_first:
+            self.fail_first -= 1
+            raise OSError("disk full")
+        self.saved.append((name, data))
+
+
+def test_late_error_after_flush_does_not_requeue_stale_snapshot():
+    rt, repo = _Runtime(), _Repo(fail_first=1)
+    errors = []
+    w = WriteBehind(rt, repo, on_error=lambda n, e: errors.append(n))
+    w.schedule("projects", [{"v": 1}])
+    rt.root.fire()                          # yazım başlar ve başarısız olur
+    w.schedule("projects", [{"v": 2}])      # daha yeni içerik
+    w.flush()                               # yeniyi yazar
+    rt.deliver()                            # eski yazımın hatası geç gelir
+    w.flush()                               # (pencere kapanırken)
+    assert repo.saved == [("projects", [{"v": 2}])]
+    assert not w.pending()
+
+
+def test_flush_retries_failed_write_without_newer_data():
+    rt, repo = _Runtime(), _Repo(fail_first=1)
+    w = WriteBehind(rt, repo)
+    w.schedule("projects", [{"v": 1}])
+    rt.root.fire()
+    w.flush()
+    rt.deliver()
+    assert repo.saved == [("projects", [{"v": 1}])]
+    assert not w.pending()
+
+
+def test_edit_during_save_all_is_written_after_the_pipeline():
+    rt, repo = _Runtime(), _Repo(fail_first=0)
+    w = WriteBehind(rt, repo)
+    w.schedule("projects", [{"v": 1}])
+    rt.root.fire()                          # eski yazım sürüyor
+    w.hold(["projects"])                    # Save All [{"v": 2}] snapshot'ını aldı
+    w.schedule("projects", [{"v": 3}])      # hat sürerken düzenleme
+    rt.root.fire()
+    rt.deliver()
+    assert repo.saved == [("projects", [{"v": 1}])]      # bekletildi
+    repo.saved.append(("projects", [{"v": 2}]))          # hattın commit'i
+    w.release(["projects"])
+    rt.deliver()
+    assert repo.saved[-1] == ("projects", [{"v": 3}])
+    assert not w.pending()
+
+
+def test_failed_write_before_save_all_is_not_requeued_over_it():
+    rt, repo = _Runtime(), _Repo(fail_first=1)
+    w = WriteBehind(rt, repo, on_error=lambda *_: None)
+    w.schedule("projects", [{"v": 1}])
+    rt.root.fire()                          # başarısız olacak yazım
+    w.hold(["projects"])
+    rt.deliver()                            # hata geri çağrısı hat sürerken gelir
+    w.release(["projects"])
+    assert not w.pending()
+    assert repo.saved == []
@@ -93,7 +93,11 @@ class CommaListEntry(ttk.Frame):
     get_list(): benzersiz, kırpılmış öğe listesi
     set_list(list[str]): alanı doldurur
     get_text()/set_text(): ham metin erişimi
+    set_completer(fn): imleçteki öğe için açılır öneri listesi (fn(önek, mevcut_öğeler) -> list[str]);
+        Up/Down gezer, Tab/Enter seçer, Esc kapatır
     """
+    NAV_KEYS = ("Up", "Down", "Return", "Tab", "Escape", "Left", "Right", "Home", "End")
+
     def __init__(self, master, text: str = "Stack (comma separated)", width: int = 60):
         super().__init__(master)
         ttk.Label(self, text=text).grid(row=0, column=0, sticky="w", padx=(0,8))
@@ -101,6 +105,100 @@ class CommaListEntry(ttk.Frame):
         e = ttk.Entry(self, textvariable=self.var, width=width)
         e.grid(row=0, column=1, sticky="ew")
         self.columnconfigure(1, weight=1)
+        self.entry = e
+        self._completer = None
+        self._popup: tk.Toplevel | None = None
+        self._lb: tk.Listbox | None = None
+        self._suggestions: list[str] = []
+
+    # ---- otomatik tamamlama ----
+    def set_completer(self, fn):
+        self._completer = fn
+        e = self.entry
+        e.bind("<KeyRelease>", self._on_key_release, add="+")
+        e.bind("<Down>", lambda ev: self._move(1))
+        e.bind("<Up>", lambda ev: self._move(-1))
+        e.bind("<Tab>", self._accept)
+        e.bind("<Return>", self._accept)
+        e.bind("<Escape>", lambda ev: self._hide())
+        e.bind("<FocusOut>", lambda ev: self.after(150, self._hide), add="+")
+
+    def _token_span(self) -> tuple[int, int]:
+        """İmleçteki öğenin [başlangıç, bitiş) aralığı (virgüller arası)."""
+        text = self.var.get()
+        cur = self.entry.index("insert")
+        start = text.rfind(",", 0, cur) + 1
+        end = text.find(",", cur)
+        return start, (len(text) if end < 0 else end)
+
+    def _on_key_release(self, ev):
+        if ev.keysym in self.NAV_KEYS or self._completer is None:
+            return
+        start, _end = self._token_span()
+        prefix = self.var.get()[start:self.entry.index("insert")].strip()
+        sugg = self._completer(prefix, self.get_list()) if prefix else []
+        if sugg:
+            self._show(sugg)
+        else:
+            self._hide()
+
+    def _show(self, sugg: list[str]):
+        self._suggestions = sugg
+        if self._popup is None:
+            self._popup = tk.Toplevel(self)
+            self._popup.overrideredirect(True)
+            self._lb = tk.Listbox(self._popup, activestyle="none", exportselection=False)
+            self._lb.pack(fill="both", expand=True)
+            self._lb.bind("<ButtonRelease-1>", self._accept)
+        lb = self._lb
+        lb.delete(0, "end")
+        for s in sugg:
+            lb.insert("end", s)
+        lb.configure(height=len(sugg))
+        lb.selection_set(0)
+        e = self.entry
+        self._popup.geometry(f"{e.winfo_width()}x{lb.winfo_reqheight()}"
+                             f"+{e.winfo_rootx()}+{e.winfo_rooty() + e.winfo_height()}")
+        self._popup.deiconify()
+        self._popup.lift()
+
+    def _hide(self):
+        if self._popup is not None:
+            self._popup.destroy()
+            self._popup = self._lb = None
+        self._suggestions = []
+
+    def _move(self, d: int):
+        if self._lb is None:
+            return None
+        cur = self._lb.curselection()
+        i = max(0, min(len(self._suggestions) - 1, (cur[0] if cur else -1) + d))
+        self._lb.selection_clear(0, "end")
+        self._lb.selection_set(i)
+        return "break"
+
+    def _accept(self, _ev=None):
+        if self._lb is None:
+            return None     # öneri yok: Tab/Enter normal davranır
+        cur = self._lb.curselection()
+        if not cur:
+            self._hide()
+            return None
+        choice = self._suggestions[cur[0]]
+        text = self.var.get()
+        start, end = self._token_span()
+        before, after = text[:start], text[end:]
+        lead = " " if before else ""
+        if after:
+            new, pos = before + lead + choice + after, len(before) + len(lead) + len(choice)
+        else:
+            new = before + lead + choice + ", "
+            pos = len(new)
+        self.var.set(new)
+        self.entry.icursor(pos)
+        self._hide()
+        self.entry.focus_set()
+        return "break"
 
     def get_text(self) -> str:
         return self.var.get()
@@ -1,8 +1,10 @@
 # widgets/icon_picker.py
 from __future__ import annotations
-import os, re, shutil, tkinter as tk
+import os, re, tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
+
+from services.image_convert import PIL_OK, convert_local
 
 # Drag & Drop (opsiyonel)
 try:
@@ -11,13 +13,6 @@ try:
 except Exception:
     DND_OK = False
 
-# PNG dönüştürme (önerilir)
-try:
-    from PIL import Image
-    PIL_OK = True
-except Exception:
-    PIL_OK = False
-
 
 def _sanitize(name: str) -> str:
     name = (name or "").strip().replace(" ", "_")
@@ -26,7 +21,7 @@ def _sanitize(name: str) -> str:
 
 class IconPicker(ttk.LabelFrame):
     """
-    Local (copy + PNG overwrite) veya SVG URL picker.
+    Local (copy + PNG overwrite; SVG dosyalar küçültülüp SVG kalır) veya SVG URL picker.
     - public_dir_cb(): .../frontend/public
     - tab_key: 'socials_tab' | 'info_tab' | ...
     - name_cb(): dosya adı kaynağı ('LinkedIn' -> LinkedIn.png)
@@ -50,7 +45,7 @@ class IconPicker(ttk.LabelFrame):
         self._saved_value = tk.StringVar()  # JSON'a yazılacak değer (relative PNG path veya SVG URL)
 
         # Mode switch
-        ttk.Radiobutton(self, text="Local (copy & PNG)", variable=self.mode, value="local",
+        ttk.Radiobutton(self, text="Local (copy → PNG / SVG)", variable=self.mode, value="local",
                         command=self._toggle).grid(row=0, column=0, sticky="w", padx=6, pady=(6, 2))
         ttk.Radiobutton(self, text="SVG URL", variable=self.mode, value="svg",
                         command=self._toggle).grid(row=0, column=1, sticky="w", padx=6, pady=(6, 2))
@@ -101,14 +96,50 @@ class IconPicker(ttk.LabelFrame):
             url = self.svg_entry.get().strip()
             self._saved_value.set(url)
             return url or None
-        # local
+        # local: seçilen dosya henüz dönüştürülmediyse burada (senkron); sekmeler önceden arka planda yapar
+        for key, args in self.pending_conversions():
+            try:
+                res = convert_local(*args)
+            except Exception as e:
+                messagebox.showerror("Image Save", f"Could not save image: {e}")
+                return None
+            self.apply_conversions([(key, res)])
+        # Yeni dosya seçilmediyse mevcudu koru (duplikasyon yok)
+        return self._saved_value.get() or None
+
+    def pending_conversions(self) -> List[Tuple[str, tuple]]:
+        """Seçilen yerel dosya: [(yol, convert_local argümanları)]; diske dokunmaz."""
         path = self._local_path.get().strip()
-        if not path:
-            # Yeni dosya seçilmediyse mevcudu koru (duplikasyon yok)
-            return self._saved_value.get() or None
-        saved = self._save_local_png(path)
-        self._saved_value.set(saved or "")
-        return saved
+        if self.mode.get() != "local" or not path:
+            return []
+        if not os.path.isfile(path):
+            messagebox.showwarning("Image", "File not found.")
+            self._local_path.set("")
+            return []
+        base = _sanitize(self.name_cb() or "icon")
+        # ---- ÖNEMLİ: her seferinde SABİT isme yaz (overwrite) ----
+        stem = os.path.join(self._public_dir(), "images", self.tab_key, base)
+        return [(path, (path, stem, None, True))]
+
+    def apply_conversions(self, results: List[Tuple[str, Tuple[str, Optional[str]]]]):
+        for src, (dst, _poster) in results:
+            if src != self._local_path.get().strip():
+                continue        # bu arada başka dosya/kayıt seçildi
+            # format değiştiyse (PNG / SVG / WebP) aynı adlı eski kopyayı kaldır
+            stem = os.path.splitext(dst)[0]
+            for ext in (".png", ".svg", ".webp", ".gif"):
+                stale = stem + ext
+                if stale != dst and os.path.isfile(stale):
+                    os.remove(stale)
+            self._saved_value.set(f"images/{self.tab_key}/{os.path.basename(dst)}")
+            self._local_path.set("")
+            self.local_hint.configure(text="Drop an image here or browse…")
+            if not PIL_OK and not dst.lower().endswith(".svg"):
+                messagebox.showinfo(
+                    "Pillow not installed",
+                    "Pillow yüklü olmadığı için gerçek PNG dönüştürme yapılmadı.\n"
+                    "Öneri: pip install pillow",
+                )
 
     # ---- internals ----
     def _toggle(self):
@@ -128,7 +159,7 @@ class IconPicker(ttk.LabelFrame):
     def _browse(self):
         p = filedialog.askopenfilename(
             title="Choose image",
-            filetypes=[("Images", "*.png;*.jpg;*.jpeg;*.webp;*.gif;*.bmp;*.ico"), ("All", "*.*")],
+            filetypes=[("Images", "*.svg;*.png;*.gif;*.webp;*.jpg;*.jpeg;*.bmp;*.ico"), ("All", "*.*")],
         )
         if p:
             self._local_path.set(p)
@@ -136,38 +167,3 @@ class IconPicker(ttk.LabelFrame):
 
     def _public_dir(self) -> str:
         return self.public_dir_cb()
-
-    def _images_dir(self) -> str:
-        d = os.path.join(self._public_dir(), "images", self.tab_key)
-        os.makedirs(d, exist_ok=True)
-        return d
-
-    def _save_local_png(self, src_path: str) -> Optional[str]:
-        if not os.path.isfile(src_path):
-            messagebox.showwarning("Image", "File not found.")
-            return None
-
-        base = _sanitize(self.name_cb() or "icon")
-        # ---- ÖNEMLİ: her seferinde SABİT isme yaz (overwrite) ----
-        dst = os.path.join(self._images_dir(), f"{base}.png")
-
-        try:
-            if PIL_OK:
-                im = Image.open(src_path)
-                try:
-                    im = im.convert("RGBA")
-                except Exception:
-                    pass
-                im.save(dst, format="PNG")
-            else:
-                shutil.copyfile(src_path, dst)
-                messagebox.showinfo(
-                    "Pillow not installed",
-                    "Pillow yüklü olmadığı için gerçek PNG dönüştürme yapılmadı.\n"
-                    "Öneri: pip install pillow",
-                )
-        except Exception as e:
-            messagebox.showerror("Image Save", f"Could not save image: {e}")
-            return None
-
-        return f"images/{self.tab_key}/{os.path.basename(dst)}"
\ No newline at end of file
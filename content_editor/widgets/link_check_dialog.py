@@ -0,0 +1,107 @@
+# widgets/link_check_dialog.py
+"""
+"Check Links…" paneli: içerikteki bağlantıları arka planda kontrol eder, sonucu
+entity / kayıt / alan bazında tabloda gösterir. Çift tıklama bağlantıyı tarayıcıda açar.
+"""
+from __future__ import annotations
+import tkinter as tk
+import webbrowser
+from tkinter import ttk
+from typing import List, Tuple
+
+from services.link_checker import LinkChecker, LinkRef, LinkResult, check_repo_links
+from services.task_runtime import get_runtime
+
+
+class LinkCheckDialog(tk.Toplevel):
+    COLUMNS = (("entity", 100), ("record", 220), ("field", 120), ("status", 70), ("url", 420))
+
+    def __init__(self, master, repo):
+        super().__init__(master)
+        self.title("Check Links")
+        self.geometry("980x480")
+        self.transient(master)
+        self.repo = repo
+        self._job = None
+
+        bar = ttk.Frame(self, padding=(10, 8))
+        bar.pack(fill="x")
+        self.btn_check = ttk.Button(bar, text="Check", command=lambda: self.start(False))
+        self.btn_check.pack(side="left")
+        ttk.Button(bar, text="Recheck All", command=lambda: self.start(True)).pack(side="left", padx=6)
+        self.only_broken = tk.BooleanVar(value=True)
+        ttk.Checkbutton(bar, text="Only broken", variable=self.only_broken,
+                        command=self._render).pack(side="left", padx=6)
+        self.pb = ttk.Progressbar(bar, mode="determinate", length=200)
+        self.pb.pack(side="left", padx=6)
+        self.lbl = ttk.Label(bar, text="")
+        self.lbl.pack(side="left", padx=6)
+
+        body = ttk.Frame(self, padding=(10, 0, 10, 10))
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, columns=[c for c, _w in self.COLUMNS], show="headings")
+        for c, w in self.COLUMNS:
+            self.tree.heading(c, text=c.capitalize())
+            self.tree.column(c, width=w, anchor="w")
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        vsb.pack(side="left", fill="y")
+        self.tree.tag_configure("bad", foreground="#dc2626")
+        self.tree.bind("<Double-1>", self._open_selected)
+
+        self._rows: List[Tuple[LinkRef, LinkResult]] = []
+        self.start(False)
+
+    def start(self, force: bool):
+        if self._job is not None:
+            return
+        self.btn_check.state(["disabled"])
+        self.lbl.config(text="Checking…")
+        self.pb.config(value=0, maximum=1)
+
+        def work(ctx):
+            return check_repo_links(self.repo, force=force, checker=LinkChecker(),
+                                    progress=lambda done, total: ctx.progress(done, total))
+
+        self._job = get_runtime(self).run_thread(
+            work, on_done=self._finished, on_error=self._failed, on_progress=self._progress,
+            title="Check Links")
+
+    def _progress(self, done, total, _msg=""):
+        self.pb.config(value=done, maximum=max(1, total))
+        self.lbl.config(text=f"{done}/{total}")
+
+    def _finished(self, rows):
+        self._job = None
+        self.btn_check.state(["!disabled"])
+        self._rows = rows
+        broken = sum(1 for _r, res in rows if not res.ok)
+        self.lbl.config(text=f"{len(rows)} links, {broken} broken")
+        self._render()
+
+    def _failed(self, err):
+        self._job = None
+        self.btn_check.state(["!disabled"])
+        self.lbl.config(text=f"Error: {err}")
+
+    def _render(self):
+        self.tree.delete(*self.tree.get_children())
+        for i, (ref, res) in enumerate(self._rows):
+            if self.only_broken.get() and res.ok:
+                continue
+            rec = ref.label or (f"#{ref.index}" if ref.index is not None else "")
+            status = str(res.status) if res.status is not None else "ERR"
+            self.tree.insert("", "end", iid=str(i), tags=(() if res.ok else ("bad",)),
+                             values=(ref.entity, rec, ref.field, status, ref.url))
+
+    def _open_selected(self, _e=None):
+        sel = self.tree.selection()
+        if sel:
+            webbrowser.open(self._rows[int(sel[0])][0].url)
+
+    def destroy(self):
+        if self._job is not None:
+            # sonuç artık gösterilmeyecek; on_done çağrılmaz
+            self._job.cancel()
+        super().destroy()
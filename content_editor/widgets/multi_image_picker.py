@@ -1,6 +1,6 @@
 # widgets/multi_image_picker.py
 from __future__ import annotations
-import os, re, shutil, tkinter as tk
+import os, re, tkinter as tk
 from tkinter import ttk, filedialog, simpledialog, messagebox
 from typing import Callable, List, Dict, Optional, Tuple
 
@@ -10,11 +10,10 @@ try:
 except Exception:
     DND_OK = False
 
-try:
-    from PIL import Image
-    PIL_OK = True
-except Exception:
-    PIL_OK = False
+from services.image_convert import convert_local
+from services.perceptual_hash import shared_index
+from services.task_runtime import get_runtime
+from widgets.thumbnail_strip import ThumbnailStrip
 
 
 def _sanitize(name: str) -> str:
@@ -27,10 +26,33 @@ def _is_url(s: str) -> bool:
     return s.startswith("http://") or s.startswith("https://")
 
 
+POSTER_SUFFIX = "_poster.png"
+
+
+def match_cover(images: List[str], cover: Optional[str]) -> Tuple[Optional[int], Optional[str]]:
+    """
+    (kapak indeksi, poster). Hareketli kapak için kaydedilen poster ("<x>_poster.png") images'ta
+    yoktur; üretildiği animasyona ("<x>.webp" / "<x>.gif") eşlenir ve poster ayrıca döner.
+    """
+    if not cover:
+        return None, None
+    for i, val in enumerate(images):
+        if val == cover:
+            return i, None
+    norm = cover.replace("\\", "/")
+    if norm.endswith(POSTER_SUFFIX):
+        stem = norm[:-len(POSTER_SUFFIX)]
+        for i, val in enumerate(images):
+            if os.path.splitext(val.replace("\\", "/"))[0] == stem:
+                return i, cover
+    return None, None
+
+
 class MultiImagePicker(ttk.LabelFrame):
     """
     Çoklu görsel yöneticisi.
-    - Add Files… / sürükle-bırak: yerel dosyaları listeye ekler (kaydetme anında PNG'e dönüştürüp kopyalar)
+    - Add Files… / sürükle-bırak: yerel dosyaları listeye ekler (Add/Update'te PNG / animasyonlu
+      WebP'ye dönüştürülüp public/ altına yazılır; bkz. pending_conversions)
     - Add URL… : URL'i listeye ekler
     - Set as Cover: listedeki seçili öğeyi kapak/logo yapar
     - Remove, Up, Down: düzenleme
@@ -63,16 +85,21 @@ class MultiImagePicker(ttk.LabelFrame):
         ttk.Button(btns, text="Up", command=lambda: self._move(-1)).pack(side="left", padx=6)
         ttk.Button(btns, text="Down", command=lambda: self._move(1)).pack(side="left")
 
+        # küçük resim şeridi (tık: seç, çift tık: kapak yap)
+        self.strip = ThumbnailStrip(self, on_click=self._on_thumb_click, on_double_click=self._on_thumb_dclick)
+        self.strip.grid(row=1, column=0, columnspan=2, sticky="ew", padx=6, pady=(0, 4))
+
         # list + scrollbar
-        self.listbox = tk.Listbox(self, height=6)
+        self.listbox = tk.Listbox(self, height=4, exportselection=False)
         sb = ttk.Scrollbar(self, orient="vertical", command=self.listbox.yview)
         self.listbox.configure(yscrollcommand=sb.set)
-        self.listbox.grid(row=1, column=0, sticky="nsew", padx=(6,0), pady=(0,6))
-        sb.grid(row=1, column=1, sticky="ns", pady=(0,6))
+        self.listbox.grid(row=2, column=0, sticky="nsew", padx=(6,0), pady=(0,6))
+        sb.grid(row=2, column=1, sticky="ns", pady=(0,6))
+        self.listbox.bind("<<ListboxSelect>>", self._on_list_select)
 
         # drop area (optional)
         self.drop = tk.Label(self, text="Drop images here", relief="ridge", bd=1, height=3, anchor="center")
-        self.drop.grid(row=2, column=0, columnspan=2, sticky="ew", padx=6, pady=(0,6))
+        self.drop.grid(row=3, column=0, columnspan=2, sticky="ew", padx=6, pady=(0,6))
         if DND_OK:
             self.drop.drop_target_register(DND_FILES)  # type: ignore
             self.drop.dnd_bind("<<Drop>>", self._on_drop)  # type: ignore
@@ -81,10 +108,10 @@ class MultiImagePicker(ttk.LabelFrame):
 
         # cover indicator
         self.cover_lbl = ttk.Label(self, text="Cover: —")
-        self.cover_lbl.grid(row=3, column=0, columnspan=2, sticky="w", padx=6, pady=(0,8))
+        self.cover_lbl.grid(row=4, column=0, columnspan=2, sticky="w", padx=6, pady=(0,8))
 
         self.columnconfigure(0, weight=1)
-        self.rowconfigure(1, weight=1)
+        self.rowconfigure(2, weight=1)
 
     # ---------- Public API ----------
     def set(self, images: Optional[List[str]], cover: Optional[str]):
@@ -93,62 +120,76 @@ class MultiImagePicker(ttk.LabelFrame):
         images = images or []
         for val in images:
             self.items.append({"kind": "existing", "value": val})
-        if cover:
-            # kapak olarak tam eşleşen ilk index
-            for i, it in enumerate(self.items):
-                if it["value"] == cover:
-                    self.cover_idx = i
-                    break
+        self.cover_idx, poster = match_cover(images, cover)
+        if poster:
+            # hareketli kapak: öğe kapak kaldıkça aynı poster yazılır
+            self.items[self.cover_idx]["poster"] = poster
         self._refresh()
 
-    def get(self) -> Dict[str, Optional[List[str]]]:
+    def pending_conversions(self) -> List[Tuple[Dict[str, str], tuple]]:
         """
-        Yerelleri PNG'e dönüştürüp kopyalar, images listesi ve kapak döner.
+        Henüz public/ altına yazılmamış yerel öğeler: [(öğe, convert_local argümanları), ...].
+        Diske dokunmaz; argümanlar picklable (sekme süreç havuzunda dönüştürür).
         """
-        images_out: List[str] = []
-        public_dir = self.public_dir_cb()
-        images_dir = os.path.join(public_dir, "images", self.tab_key)
-        os.makedirs(images_dir, exist_ok=True)
+        images_dir = os.path.join(self.public_dir_cb(), "images", self.tab_key)
         base = _sanitize(self.name_cb())
+        out = []
+        n = 0
+        for idx, it in enumerate(self.items):
+            if it["kind"] != "local":
+                continue
+            # locals için sıra bazlı sabit isimler (overwrite)
+            n += 1
+            stem = os.path.join(images_dir, f"{base}_{n}")
+            poster = stem + POSTER_SUFFIX if idx == self.cover_idx else None
+            out.append((it, (it["value"], stem, poster)))
+        return out
 
-        # locals için sıra bazlı sabit isimler üret (overwrite)
-        local_counter = 0
-        local_name_map: Dict[int, str] = {}
+    def apply_conversions(self, results: List[Tuple[Dict[str, str], Tuple[str, Optional[str]]]]):
+        """Dönüştürülen yerel öğeler public/ altındaki dosyayı gösteren "existing" öğe olur."""
+        public_dir = self.public_dir_cb()
 
-        for idx, it in enumerate(self.items):
-            kind, val = it["kind"], it["value"]
-            if kind == "existing":
-                images_out.append(val.replace("\\", "/"))
-            elif kind == "url":
-                images_out.append(val)
-            else:  # local
-                local_counter += 1
-                filename = f"{base}_{local_counter}.png"
-                dst = os.path.join(images_dir, filename)
-                # convert/copy
-                try:
-                    if PIL_OK:
-                        im = Image.open(val)
-                        try:
-                            im = im.convert("RGBA")
-                        except Exception:
-                            pass
-                        im.save(dst, format="PNG")
-                    else:
-                        shutil.copyfile(val, dst)
-                except Exception as e:
-                    messagebox.showerror("Image Save", f"Could not save {os.path.basename(val)}:\n{e}")
-                    continue
-                rel = f"images/{self.tab_key}/{filename}".replace("\\", "/")
-                images_out.append(rel)
-                local_name_map[idx] = rel
+        def rel(path: str) -> str:
+            return os.path.relpath(path, public_dir).replace("\\", "/")
+
+        for it, (path, poster) in results:
+            if not any(it is x for x in self.items):
+                continue        # bu arada başka kayıt yüklendi
+            it["kind"], it["value"] = "existing", rel(path)
+            if poster:
+                # hareketli kapak: öğe kapak kaldıkça aynı poster yazılır
+                it["poster"] = rel(poster)
+        self._refresh()
+
+    def get(self) -> Dict[str, Optional[List[str]]]:
+        """
+        images listesi ve kapak. Dönüştürülmemiş yerel öğe kaldıysa burada (senkron) dönüştürülür;
+        sekmeler bunu Add/Update'te arka planda önceden yapar (pending_conversions).
+        """
+        done = []
+        for it, args in self.pending_conversions():
+            try:
+                done.append((it, convert_local(*args)))
+            except Exception as e:
+                messagebox.showerror("Image Save", f"Could not save {os.path.basename(args[0])}:\n{e}")
+        if done:
+            self.apply_conversions(done)
+
+        images_out: List[str] = []
+        for it in self.items:
+            if it["kind"] == "local":
+                continue        # kaydedilemedi
+            val = it["value"]
+            images_out.append(val if _is_url(val) else val.replace("\\", "/"))
 
         # cover resolve
         cover_out: Optional[str] = None
         if self.cover_idx is not None and 0 <= self.cover_idx < len(self.items):
             it = self.items[self.cover_idx]
             if it["kind"] == "local":
-                cover_out = local_name_map.get(self.cover_idx)
+                cover_out = None
+            elif it.get("poster"):
+                cover_out = it["poster"].replace("\\", "/")
             else:
                 v = it["value"]
                 cover_out = v if _is_url(v) else v.replace("\\", "/")
@@ -173,6 +214,38 @@ class MultiImagePicker(ttk.LabelFrame):
             except Exception:
                 txt = "—"
             self.cover_lbl.configure(text=f"Cover: {txt[3:]}")
+        sel = self.listbox.curselection()
+        self.strip.set_items(
+            [(self._thumb_path(it), os.path.basename(it["value"]) if it["kind"] != "url" else it["value"])
+             for it in self.items],
+            cover=self.cover_idx,
+            selected=sel[0] if sel else None,
+        )
+
+    def _thumb_path(self, it: Dict[str, str]) -> Optional[str]:
+        """Küçük resim için diskteki mutlak yol (URL'ler için None)."""
+        kind, val = it["kind"], it["value"]
+        if kind == "url" or _is_url(val):
+            return None
+        if kind == "existing" and not os.path.isabs(val):
+            try:
+                return os.path.join(self.public_dir_cb(), val)
+            except Exception:
+                return None
+        return val
+
+    def _on_thumb_click(self, i: int):
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(i)
+        self.listbox.see(i)
+
+    def _on_thumb_dclick(self, i: int):
+        self._on_thumb_click(i)
+        self._set_cover()
+
+    def _on_list_select(self, _e=None):
+        sel = self.listbox.curselection()
+        self.strip.select(sel[0] if sel else None)
 
     def _browse(self):
         paths = filedialog.askopenfilenames(
@@ -185,6 +258,7 @@ class MultiImagePicker(ttk.LabelFrame):
             if self.cover_idx is None:
                 self.cover_idx = 0
             self._refresh()
+            self._warn_duplicates(list(paths))
 
     def _add_url_dialog(self):
         url = simpledialog.askstring("Add URL", "Image URL:")
@@ -202,12 +276,41 @@ class MultiImagePicker(ttk.LabelFrame):
         data = event.data.strip()
         if data.startswith("{") and data.endswith("}"):
             data = data[1:-1]
+        added = []
         for token in data.split():
             if os.path.isfile(token):
                 self.items.append({"kind": "local", "value": token})
+                added.append(token)
         if self.items and self.cover_idx is None:
             self.cover_idx = 0
         self._refresh()
+        self._warn_duplicates(added)
+
+    def _warn_duplicates(self, paths: List[str]):
+        """Yeni eklenen dosya public/images altında zaten (ya da çok benzeri) varsa uyar."""
+        if not paths:
+            return
+        public_dir = self.public_dir_cb()
+
+        def work(_ctx):
+            # paylaşılan indeks: yalnız yeni/değişen dosyalar hash'lenir (ilk kurulum arka planda)
+            index = shared_index(public_dir).build()
+            lines = []
+            for p in paths:
+                hits = index.matches_for_file(p)
+                if hits:
+                    same = ", ".join(rel for _d, rel in hits[:3])
+                    lines.append(f"{os.path.basename(p)}  ≈  {same}")
+            return lines
+
+        def show(lines):
+            if lines:
+                messagebox.showwarning(
+                    "Possible duplicate",
+                    "These images look like existing ones:\n\n" + "\n".join(lines),
+                )
+
+        get_runtime(self).run_thread(work, on_done=show, on_error=lambda _e: None, title="Duplicates")
 
     def _remove(self):
         sel = list(self.listbox.curselection())
@@ -238,10 +341,13 @@ class MultiImagePicker(ttk.LabelFrame):
         self._refresh()
         self.listbox.selection_clear(0, "end")
         self.listbox.selection_set(j)
+        self._on_list_select()
 
     def _set_cover(self):
         sel = list(self.listbox.curselection())
         if len(sel) != 1:
             return
         self.cover_idx = sel[0]
-        self._refresh()
\ No newline at end of file
+        self._refresh()
+        self.listbox.selection_set(sel[0])
+        self._on_list_select()
\ No newline at end of file
@@ -0,0 +1,76 @@
+# widgets/quick_switcher.py
+"""
+Ctrl+P hızlı geçiş paleti: yazdıkça tüm entity'lerde bulanık arama (services/quick_index.py).
+Enter / çift tıklama seçilen kaydın sekmesine geçer ve kaydı seçer; Esc kapatır.
+İndeks getter ile alınır: palet, arka plan kurulumu bitince refresh() ile yeni indekse geçer.
+"""
+from __future__ import annotations
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional
+
+from services.quick_index import QuickHit, QuickIndex
+
+
+class QuickSwitcher(tk.Toplevel):
+    def __init__(self, master, index: Callable[[], QuickIndex], on_pick: Callable[[str, Dict], None],
+                 entity_titles: Dict[str, str] | None = None,
+                 status: Optional[Callable[[], str]] = None):
+        super().__init__(master)
+        self.title("Go to record")
+        self.transient(master)
+        self.geometry(f"640x380+{master.winfo_rootx() + 120}+{master.winfo_rooty() + 80}")
+        self.index = index
+        self.status = status or (lambda: "")
+        self.on_pick = on_pick
+        self.entity_titles = entity_titles or {}
+        self._hits: List[QuickHit] = []
+
+        self.var = tk.StringVar()
+        self.entry = ttk.Entry(self, textvariable=self.var)
+        self.entry.pack(fill="x", padx=10, pady=(10, 6))
+        self.lbl = ttk.Label(self, text=self.status(), style="Path.TLabel")
+        self.lbl.pack(fill="x", padx=10)
+        self.listbox = tk.Listbox(self, activestyle="none", exportselection=False)
+        self.listbox.pack(fill="both", expand=True, padx=10, pady=(4, 10))
+
+        self.var.trace_add("write", lambda *_: self._update())
+        self.entry.bind("<Down>", lambda e: self._step(1))
+        self.entry.bind("<Up>", lambda e: self._step(-1))
+        self.entry.bind("<Return>", lambda e: self._pick())
+        self.listbox.bind("<Double-1>", lambda e: self._pick())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.entry.focus_set()
+
+    def refresh(self):
+        """İndeks değişti (kurulum bitti): durum satırını ve sonuçları yenile."""
+        self.lbl.configure(text=self.status())
+        self._update()
+
+    def _update(self):
+        self._hits = self.index().search(self.var.get())
+        lb = self.listbox
+        lb.delete(0, "end")
+        for h in self._hits:
+            where = self.entity_titles.get(h.entity, h.entity)
+            lb.insert("end", f"{h.label}   ·  {h.detail}   [{where}]" if h.detail else f"{h.label}   [{where}]")
+        if self._hits:
+            lb.selection_set(0)
+
+    def _step(self, d: int):
+        if not self._hits:
+            return "break"
+        cur = self.listbox.curselection()
+        i = max(0, min(len(self._hits) - 1, (cur[0] if cur else -1) + d))
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(i)
+        self.listbox.see(i)
+        return "break"
+
+    def _pick(self):
+        cur = self.listbox.curselection()
+        if not cur or cur[0] >= len(self._hits):
+            return
+        hit = self._hits[cur[0]]
+        self.destroy()
+        self.on_pick(hit.entity, hit.rec)
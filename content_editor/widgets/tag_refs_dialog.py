@@ -0,0 +1,84 @@
+# widgets/tag_refs_dialog.py
+"""
+"Tags…" paneli: stack adlarının entity'ler arası kullanımı (services/tag_refs.py).
+stack.json'da olmayan referanslar kırmızı; seçili etiket "Rename / Merge…" ile tüm kayıtlarda
+tek seferde yeniden adlandırılır (dosya başına tek kayıt).
+"""
+from __future__ import annotations
+import tkinter as tk
+from tkinter import ttk, simpledialog, messagebox
+from typing import List
+
+from services.tag_refs import TagInfo, tag_key
+
+
+class TagRefsDialog(tk.Toplevel):
+    COLUMNS = (("tag", 220), ("uses", 60), ("stack.json", 80), ("spellings", 260), ("used in", 260))
+
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.title("Tags")
+        self.geometry("920x460")
+        self.transient(master)
+        self.app = app
+        self._rows: List[TagInfo] = []
+
+        bar = ttk.Frame(self, padding=(10, 8))
+        bar.pack(fill="x")
+        self.btn_rename = ttk.Button(bar, text="Rename / Merge…", command=self._rename)
+        self.btn_rename.pack(side="left")
+        ttk.Button(bar, text="Refresh", command=self._render).pack(side="left", padx=6)
+        self.only_unknown = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Only unknown", variable=self.only_unknown,
+                        command=self._render).pack(side="left", padx=6)
+        self.lbl = ttk.Label(bar, text="")
+        self.lbl.pack(side="left", padx=6)
+
+        body = ttk.Frame(self, padding=(10, 0, 10, 10))
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, columns=[c for c, _w in self.COLUMNS], show="headings",
+                                 selectmode="browse")
+        for c, w in self.COLUMNS:
+            self.tree.heading(c, text=c.capitalize() if c != "stack.json" else c)
+            self.tree.column(c, width=w, anchor="w")
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        vsb.pack(side="left", fill="y")
+        self.tree.tag_configure("bad", foreground="#dc2626")
+        self.tree.bind("<Double-1>", lambda e: self._rename())
+        self._render()
+
+    def _render(self):
+        if self.app.index_busy():
+            self.lbl.config(text="indexing…")
+            self.after(300, self._render)
+            return
+        refs = self.app.refs
+        rows = refs.unknown() if self.only_unknown.get() else refs.tags()
+        self._rows = rows
+        self.tree.delete(*self.tree.get_children())
+        for i, t in enumerate(rows):
+            where = sorted({ent for ent, _r, _f in refs.refs_of(t.key)})
+            spell = ", ".join(f"{s} ×{n}" for s, n in sorted(t.spellings.items(), key=lambda x: -x[1]))
+            self.tree.insert("", "end", iid=str(i), tags=() if t.defined else ("bad",),
+                             values=(t.name, t.uses, "yes" if t.defined else "missing", spell, ", ".join(where)))
+        missing = sum(1 for t in rows if not t.defined)
+        self.lbl.config(text=f"{len(rows)} tags, {missing} not in stack.json")
+
+    def _rename(self):
+        sel = self.tree.selection()
+        if not sel or self.app.index_busy():
+            return
+        t = self._rows[int(sel[0])]
+        new = simpledialog.askstring("Rename / Merge", f"New name for '{t.name}':", initialvalue=t.name, parent=self)
+        if not new or not new.strip() or new.strip() == t.name and len(t.spellings) <= 1:
+            return
+        new = new.strip()
+        existing = self.app.refs.defined.get(tag_key(new)) or self.app.refs.refs.get(tag_key(new))
+        if tag_key(new) != t.key and existing:
+            if not messagebox.askyesno("Merge", f"'{new}' already exists. Merge '{t.name}' into it?", parent=self):
+                return
+        done = self.app.rename_tag(t.name, new)
+        self._render()
+        self.lbl.config(text="Updated " + ", ".join(f"{e}: {n}" for e, n in done.items()) if done else "Nothing to change")
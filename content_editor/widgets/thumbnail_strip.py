@@ -0,0 +1,261 @@
+# widgets/thumbnail_strip.py
+"""
+Yatay küçük resim şeridi (MultiImagePicker için).
+
+- Görseller ortak task runtime'ın thread'lerinde decode edilir (Image.draft + thumbnail); Tk
+  nesneleri (ImageTk.PhotoImage) yalnızca ana thread'de, runtime sonucu teslim ederken üretilir.
+- Sadece görünen hücreler (+ küçük tampon) için görsel istenir; kaydırınca ekrandan çıkanların
+  referansı bırakılır.
+- PhotoImage'lar piksel bütçeli, tüm şeritlerce paylaşılan bir LRU'da tutulur -> bellek sınırlı.
+"""
+from __future__ import annotations
+import os
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageTk
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+from services.task_runtime import get_runtime
+
+THUMB = 96          # hücre içi en uzun kenar (px)
+PAD = 6
+BUFFER_CELLS = 3    # görünür alanın iki yanında önden yüklenen hücre sayısı
+
+ThumbKey = Tuple[str, int, int]   # (abs_path, mtime_ns, size)
+
+
+class PhotoLRU:
+    """PhotoImage LRU'su; toplam piksel (w*h) bütçesini aşınca en eskiyi atar."""
+
+    def __init__(self, max_pixels: int):
+        self.max_pixels = max_pixels
+        self.pixels = 0
+        self._items: "OrderedDict[ThumbKey, object]" = OrderedDict()
+
+    def get(self, key: ThumbKey):
+        img = self._items.get(key)
+        if img is not None:
+            self._items.move_to_end(key)
+        return img
+
+    def put(self, key: ThumbKey, img) -> None:
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.pixels -= old.width() * old.height()
+        self._items[key] = img
+        self.pixels += img.width() * img.height()
+        while self.pixels > self.max_pixels and len(self._items) > 1:
+            _k, ev = self._items.popitem(last=False)
+            self.pixels -= ev.width() * ev.height()
+
+    def __len__(self):
+        return len(self._items)
+
+
+# Tüm şeritler için ortak: ~200 adet 96x96 küçük resim (~7 MB RGBA)
+_LRU = PhotoLRU(max_pixels=200 * THUMB * THUMB)
+
+
+def _decode_thumb(_ctx, path: str, size: int):
+    """Worker thread: PIL.Image (RGBA, en fazla size x size). Tk'ye dokunmaz."""
+    im = Image.open(path)
+    im.draft("RGB", (size * 2, size * 2))   # JPEG: düşük çözünürlükte decode
+    im = im.convert("RGBA")
+    im.thumbnail((size, size), Image.LANCZOS)
+    return im
+
+
+def thumb_key(path: str, size: int = THUMB) -> Optional[ThumbKey]:
+    try:
+        return (path, os.stat(path).st_mtime_ns, size)
+    except OSError:
+        return None
+
+
+class ThumbnailStrip(ttk.Frame):
+    """
+    set_items([(abs_path|None, label), ...]) ile doldurulur.
+    on_click(index), on_double_click(index) geri çağrıları; select(index) ile vurgu.
+    """
+
+    def __init__(self, master, on_click: Callable[[int], None] | None = None,
+                 on_double_click: Callable[[int], None] | None = None):
+        super().__init__(master)
+        self.on_click = on_click
+        self.on_double_click = on_double_click
+
+        self.cell = THUMB + 2 * PAD
+        self.canvas = tk.Canvas(self, height=self.cell + 18, highlightthickness=0,
+                                xscrollincrement=self.cell)
+        self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self._xview)
+        self.canvas.configure(xscrollcommand=self.hsb.set)
+        self.canvas.grid(row=0, column=0, sticky="ew")
+        self.hsb.grid(row=1, column=0, sticky="ew")
+        self.columnconfigure(0, weight=1)
+
+        self._items: List[Tuple[Optional[str], str]] = []
+        self._cover: Optional[int] = None
+        self._selected: Optional[int] = None
+        self._shown: Dict[int, object] = {}            # index -> PhotoImage (ekrandakiler)
+        self._pending: Dict[ThumbKey, List[int]] = {}  # decode edilen key -> bekleyen hücreler
+
+        self.canvas.bind("<Configure>", lambda _e: self._update_visible())
+        self.canvas.bind("<Button-1>", self._click)
+        self.canvas.bind("<Double-Button-1>", self._dclick)
+        self.canvas.bind("<MouseWheel>", self._wheel)
+        self.canvas.bind("<Button-4>", self._wheel)
+        self.canvas.bind("<Button-5>", self._wheel)
+
+    # ---------- public ----------
+    def set_items(self, items: List[Tuple[Optional[str], str]], cover: Optional[int] = None,
+                  selected: Optional[int] = None):
+        self._items = list(items)
+        self._cover = cover
+        self._selected = selected
+        self._shown.clear()
+        # uçuştaki decode'lar iptal edilmez; sonuçları LRU'ya girer, hücreler yeniden eşlenir
+        for key in self._pending:
+            self._pending[key] = []
+        self._draw_cells()
+        self._update_visible()
+
+    def select(self, index: Optional[int]):
+        self._selected = index
+        self._draw_frames()
+        if index is not None:
+            self._see(index)
+
+    # ---------- çizim ----------
+    def _cell_x(self, i: int) -> int:
+        return i * self.cell
+
+    def _draw_cells(self):
+        c = self.canvas
+        c.delete("all")
+        for i, (path, label) in enumerate(self._items):
+            x = self._cell_x(i)
+            c.create_rectangle(x + 2, 2, x + self.cell - 2, self.cell - 2,
+                               outline="#d0d0d0", fill="#f3f3f3", tags=("frame", f"frame{i}"))
+            if path is None:
+                c.create_text(x + self.cell // 2, self.cell // 2, text="URL", fill="#64748b")
+            c.create_text(x + self.cell // 2, self.cell + 8, text=self._short(label),
+                          fill="#0f172a", font=("Segoe UI", 8))
+        c.configure(scrollregion=(0, 0, max(1, len(self._items) * self.cell), self.cell + 18))
+        self._draw_frames()
+
+    def _draw_frames(self):
+        for i in range(len(self._items)):
+            color = "#d0d0d0"
+            width = 1
+            if i == self._cover:
+                color, width = "#f59e0b", 2
+            if i == self._selected:
+                color, width = "#2563eb", 3
+            self.canvas.itemconfigure(f"frame{i}", outline=color, width=width)
+
+    @staticmethod
+    def _short(label: str, n: int = 16) -> str:
+        return label if len(label) <= n else label[: n - 1] + "…"
+
+    # ---------- görünür pencere ----------
+    def _visible_range(self) -> Tuple[int, int]:
+        if not self._items:
+            return 0, -1
+        total = len(self._items) * self.cell
+        x0, x1 = self.canvas.xview()
+        first = int(x0 * total) // self.cell - BUFFER_CELLS
+        last = int(x1 * total) // self.cell + BUFFER_CELLS
+        return max(0, first), min(len(self._items) - 1, last)
+
+    def _update_visible(self):
+        if not PIL_OK:
+            return
+        first, last = self._visible_range()
+        # ekrandan çıkanların referansını bırak (LRU'da kalabilirler)
+        for i in [i for i in self._shown if i < first or i > last]:
+            self.canvas.delete(f"img{i}")
+            del self._shown[i]
+        for i in range(first, last + 1):
+            if i in self._shown:
+                continue
+            path = self._items[i][0]
+            if not path:
+                continue
+            key = thumb_key(path)
+            if key is None:
+                continue
+            img = _LRU.get(key)
+            if img is not None:
+                self._place(i, img)
+            elif key in self._pending:
+                if i not in self._pending[key]:
+                    self._pending[key].append(i)
+            else:
+                self._pending[key] = [i]
+                get_runtime(self).run_thread(
+                    _decode_thumb, path, THUMB, title="Thumbnail",
+                    on_done=lambda im, k=key: self._deliver(k, im),
+                    on_error=lambda _e, k=key: self._pending.pop(k, None))
+
+    def _deliver(self, key: ThumbKey, pil_img):
+        """Ana thread: worker sonucunu PhotoImage'a çevir ve yerleştir."""
+        cells = self._pending.pop(key, None)
+        if cells is None:       # destroy sonrası
+            return
+        img = ImageTk.PhotoImage(pil_img)
+        _LRU.put(key, img)
+        first, last = self._visible_range()
+        for i in cells:
+            if first <= i <= last and i < len(self._items):
+                self._place(i, img)
+
+    def _place(self, i: int, img):
+        self._shown[i] = img
+        x = self._cell_x(i)
+        self.canvas.delete(f"img{i}")
+        self.canvas.create_image(x + self.cell // 2, self.cell // 2, image=img, tags=(f"img{i}",))
+
+    # ---------- kaydırma / olaylar ----------
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self._update_visible()
+
+    def _wheel(self, e):
+        back = getattr(e, "num", None) == 4 or getattr(e, "delta", 0) > 0
+        self.canvas.xview_scroll(-1 if back else 1, "units")
+        self._update_visible()
+        return "break"
+
+    def _see(self, i: int):
+        total = max(1, len(self._items) * self.cell)
+        x0, x1 = self.canvas.xview()
+        left, right = self._cell_x(i), self._cell_x(i) + self.cell
+        if left < x0 * total or right > x1 * total:
+            self.canvas.xview_moveto(max(0.0, left / total))
+            self._update_visible()
+
+    def _index_at(self, x: int) -> Optional[int]:
+        i = int(self.canvas.canvasx(x)) // self.cell
+        return i if 0 <= i < len(self._items) else None
+
+    def _click(self, e):
+        i = self._index_at(e.x)
+        if i is not None:
+            self.select(i)
+            if self.on_click:
+                self.on_click(i)
+
+    def _dclick(self, e):
+        i = self._index_at(e.x)
+        if i is not None and self.on_double_click:
+            self.on_double_click(i)
+
+    def destroy(self):
+        self._pending.clear()
+        super().destroy()
@@ -0,0 +1,312 @@
+# widgets/virtual_list.py
+"""
+Sanallaştırılmış liste (çok büyük entity'ler için ttk.Treeview yerine).
+
+- İçte sabit sayıda Treeview satırı vardır (görünen satır sayısı + küçük tampon); kaydırınca
+  aynı satırların değerleri yeniden yazılır. Kayıt sayısı ne olursa olsun Tcl tarafında ~40 öğe.
+- Satır değerleri istendiğinde row_fn(index) ile (ör. summary_row) üretilir; hiçbir şey önden
+  hesaplanmaz.
+- ListEntityTab'ın kullandığı Treeview API'sinin alt kümesi: heading, column, bind("<<TreeviewSelect>>"),
+  selection / selection_set / selection_add / selection_remove / focus / see / exists.
+  iid = str(veri indeksi).
+- Seçim veri indeksleri kümesidir (havuz satırları değil): selectmode="extended" ile Ctrl-tık,
+  Shift-tık / Shift+Up/Down (ekranda olmayan satırlar dahil aralık) ve Ctrl+A çalışır; toplu işlemler
+  büyük listede de tüm seçime uygulanır. İçteki Treeview selectmode="none": tıklamaları bu sınıf
+  yorumlar, iç seçim sadece görünen seçili satırların yansımasıdır.
+- Fare tekerleği, kaydırma çubuğu ve Up/Down/PageUp/PageDown/Home/End sanal satırlar üzerinde çalışır.
+"""
+from __future__ import annotations
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, List, Optional, Sequence, Set
+
+BUFFER_ROWS = 2
+DEFAULT_ROW_HEIGHT = 26
+
+
+class VirtualList(ttk.Frame):
+    def __init__(self, master, columns: Sequence[str], style: str = "Treeview",
+                 selectmode: str = "browse", **_kw):
+        super().__init__(master)
+        self.columns = list(columns)
+        self._style = style
+        self._multi = selectmode == "extended"
+        self.tree = ttk.Treeview(self, columns=self.columns, show="headings", style=style,
+                                 selectmode="none", height=1)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self._rows: List[int] = []                 # görünen sırada veri indeksleri
+        self._row_fn: Callable[[int], Sequence[Any]] = lambda i: ()
+        self._offset = 0
+        self._pool = 0                             # materyalize Treeview satırı
+        self._detached: set = set()               # gizli havuz satırları (k)
+        self._selected: Set[int] = set()           # veri indeksleri
+        self._focus: Optional[int] = None          # imleç (klavye) satırı, veri indeksi
+        self._anchor: Optional[int] = None         # Shift aralığının başı, veri indeksi
+        self._select_cbs: List[Callable] = []
+        self._pos_cache: Optional[dict] = None     # veri indeksi -> konum (see() için, tembel)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<Button-1>", lambda e: self._on_click(e, "set"))
+        self.tree.bind("<Control-Button-1>", lambda e: self._on_click(e, "toggle"))
+        self.tree.bind("<Shift-Button-1>", lambda e: self._on_click(e, "range"))
+        self.tree.bind("<Control-a>", lambda e: self._select_all())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        for seq, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "page-"), ("<Next>", "page+"),
+                          ("<Home>", "home"), ("<End>", "end")):
+            self.tree.bind(seq, lambda e, s=step: self._on_key(s))
+            self.tree.bind(seq.replace("<", "<Shift-", 1), lambda e, s=step: self._on_key(s, extend=True))
+
+    # ---------- veri ----------
+    def set_rows(self, rows: List[int], row_fn: Callable[[int], Sequence[Any]]):
+        self._rows = rows
+        self._row_fn = row_fn
+        self._pos_cache = None
+        self._offset = min(self._offset, self._max_offset())
+        hidden = {i for i in self._selected if self._position(i) is None}
+        if hidden:
+            # Treeview gibi: görünmeyen (filtrelenmiş / yeniden yüklenmiş) satır seçili kalmaz
+            self._selected -= hidden
+            self.after_idle(self._fire_select)
+        if self._position(self._focus) is None:
+            self._focus = None
+        if self._position(self._anchor) is None:
+            self._anchor = None
+        self._render()
+
+    def refresh(self):
+        self._render()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ---------- Treeview uyumlu API ----------
+    def heading(self, col, **kw):
+        return self.tree.heading(col, **kw)
+
+    def column(self, col, **kw):
+        return self.tree.column(col, **kw)
+
+    def tag_configure(self, *a, **kw):
+        return self.tree.tag_configure(*a, **kw)
+
+    def bind(self, seq=None, func=None, add=None):
+        if seq == "<<TreeviewSelect>>":
+            self._select_cbs.append(func)
+            return None
+        return self.tree.bind(seq, func, add)
+
+    def selection(self):
+        """Seçili iid'ler görünen sırada (Treeview gibi)."""
+        return tuple(str(i) for i in sorted(self._selected, key=self._position))
+
+    @staticmethod
+    def _items(items) -> List[int]:
+        items = items[0] if len(items) == 1 and isinstance(items[0], (list, tuple)) else items
+        return [int(i) for i in items]
+
+    def _change(self, new: Set[int]):
+        if new != self._selected:
+            self._selected = new
+            self._render()
+            # gerçek Treeview gibi: olay sonraki turda
+            self.after_idle(self._fire_select)
+
+    def selection_set(self, *items):
+        new = self._items(items)
+        missing = [i for i in new if self._position(i) is None]
+        if missing:
+            raise tk.TclError(f"Item {missing[0]} not found")     # Treeview gibi (ör. filtrelenmiş satır)
+        if not self._multi:
+            new = new[:1]
+        if new:
+            self._anchor = new[0]
+        self._change(set(new))
+
+    def selection_add(self, *items):
+        self.selection_set(sorted(self._selected) + self._items(items))
+
+    def selection_remove(self, *items):
+        gone = set(self._items(items)) if items else set(self._selected)
+        self._change(self._selected - gone)
+
+    def focus(self, item=None):
+        if item is None:
+            return str(self._focus) if self._focus is not None else ""
+        if self._position(int(item)) is not None:
+            self._focus = int(item)
+        return None
+
+    def exists(self, item) -> bool:
+        try:
+            return self._position(int(item)) is not None
+        except ValueError:
+            return False
+
+    def see(self, item):
+        pos = self._position(int(item))
+        if pos is None:
+            return
+        visible = self._visible_rows()
+        if pos < self._offset:
+            self._offset = pos
+        elif pos >= self._offset + visible:
+            self._offset = pos - visible + 1
+        else:
+            return
+        self._render()
+
+    def get_children(self, item=""):
+        return tuple(str(i) for i in self._rows)
+
+    # ---------- kaydırma ----------
+    def yview(self, *args):
+        if not args:
+            total = max(1, len(self._rows))
+            return self._offset / total, min(1.0, (self._offset + self._visible_rows()) / total)
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            n = int(args[1])
+            self._offset += n * (self._visible_rows() if args[2] == "pages" else 1)
+        self._offset = max(0, min(self._offset, self._max_offset()))
+        self._render()
+
+    def _on_wheel(self, e):
+        if getattr(e, "num", None) == 4:
+            step = -3
+        elif getattr(e, "num", None) == 5:
+            step = 3
+        else:
+            step = -3 if e.delta > 0 else 3
+        self.yview("scroll", step, "units")
+        return "break"
+
+    def _on_key(self, step, extend: bool = False):
+        if not self._rows:
+            return "break"
+        pos = self._position(self._focus)
+        visible = self._visible_rows()
+        if step == "home":
+            pos = 0
+        elif step == "end":
+            pos = len(self._rows) - 1
+        elif step in ("page-", "page+"):
+            pos = (pos or 0) + (visible if step == "page+" else -visible)
+        else:
+            pos = (pos + step) if pos is not None else (self._offset if step > 0 else self._offset + visible - 1)
+        pos = max(0, min(pos, len(self._rows) - 1))
+        self._focus = idx = self._rows[pos]
+        self.see(str(idx))
+        if extend and self._multi and self._anchor is not None:
+            self._change(self._range(self._anchor, idx))
+        else:
+            self._anchor = idx
+            self._change({idx})
+        return "break"
+
+    def _on_click(self, e, how: str):
+        if self.tree.identify_region(e.x, e.y) not in ("cell", "tree"):
+            return None         # başlık / ayırıcı: Treeview'in kendi bağları
+        k = self.tree.identify_row(e.y)
+        if not k:
+            return "break"
+        pos = self._offset + int(k[1:])
+        if pos >= len(self._rows):
+            return "break"
+        idx = self._rows[pos]
+        self.tree.focus_set()
+        self._focus = idx
+        if how == "toggle" and self._multi:
+            self._anchor = idx
+            self._change(self._selected ^ {idx})
+        elif how == "range" and self._multi and self._anchor is not None:
+            self._change(self._range(self._anchor, idx))
+        else:
+            self._anchor = idx
+            self._change({idx})
+        return "break"
+
+    def _select_all(self):
+        if self._multi and self._rows:
+            self._change(set(self._rows))
+        return "break"
+
+    def _range(self, a: int, b: int) -> Set[int]:
+        """Görünen sırada a ile b arasındaki (ekranda olmayanlar dahil) veri indeksleri."""
+        pa, pb = sorted((self._position(a), self._position(b)))
+        return set(self._rows[pa:pb + 1])
+
+    # ---------- iç ----------
+    def _position(self, idx: Optional[int]) -> Optional[int]:
+        if idx is None:
+            return None
+        if self._pos_cache is None:
+            self._pos_cache = {i: p for p, i in enumerate(self._rows)}
+        return self._pos_cache.get(idx)
+
+    def _row_height(self) -> int:
+        try:
+            h = int(ttk.Style(self).lookup(self._style, "rowheight") or 0)
+        except (tk.TclError, ValueError):
+            h = 0
+        return h or DEFAULT_ROW_HEIGHT
+
+    def _visible_rows(self) -> int:
+        return max(1, self._pool - BUFFER_ROWS)
+
+    def _max_offset(self) -> int:
+        return max(0, len(self._rows) - self._visible_rows())
+
+    def _on_resize(self, e):
+        pool = max(1, e.height // self._row_height()) + BUFFER_ROWS
+        if pool != self._pool:
+            self._ensure_pool(pool)
+            self._offset = min(self._offset, self._max_offset())
+            self._render()
+
+    def _ensure_pool(self, pool: int):
+        for k in range(self._pool, pool):
+            self.tree.insert("", "end", iid=f"v{k}", values=())
+        for k in range(pool, self._pool):
+            self.tree.delete(f"v{k}")
+            self._detached.discard(k)
+        self._pool = pool
+
+    def _render(self):
+        if self._pool == 0:
+            return
+        n = max(0, min(self._pool, len(self._rows) - self._offset))
+        # kullanılmayan havuz satırlarını gizle / gerekenleri geri tak
+        for k in range(n, self._pool):
+            if k not in self._detached:
+                self.tree.detach(f"v{k}")
+                self._detached.add(k)
+        for k in sorted(k for k in self._detached if k < n):
+            self.tree.move(f"v{k}", "", k)
+            self._detached.discard(k)
+
+        want_sel = []
+        for k in range(n):
+            idx = self._rows[self._offset + k]
+            self.tree.item(f"v{k}", values=list(self._row_fn(idx)))
+            if idx in self._selected:
+                want_sel.append(f"v{k}")
+        want_sel = tuple(want_sel)
+        if tuple(self.tree.selection()) != want_sel:
+            if want_sel:
+                self.tree.selection_set(want_sel)
+            else:
+                self.tree.selection_remove(*self.tree.selection())
+
+        total = max(1, len(self._rows))
+        self.vsb.set(self._offset / total, min(1.0, (self._offset + self._visible_rows()) / total))
+
+    def _fire_select(self):
+        for cb in list(self._select_cbs):
+            cb(None)
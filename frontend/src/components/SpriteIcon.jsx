@@ -0,0 +1,55 @@
+// src/components/SpriteIcon.jsx
+// Logo/ikonu atlas'tan (background-position) ya da SVG sprite'tan (<use>) çizer;
+// haritada yoksa normal <img src> ile düşer.
+import { asset, cn } from "../lib/utils";
+import { useSprites, spriteKey } from "../lib/sprites";
+
+export default function SpriteIcon({ path, src, alt = "", size = 16, className }) {
+  const map = useSprites();
+  const key = spriteKey(path);
+  const box = { width: size, height: size };
+
+  // harita gelene kadar yer tut (ayrı istek atma)
+  if (map === undefined && key) {
+    return <span className={cn("inline-block", className)} style={box} aria-hidden="true" />;
+  }
+
+  const sym = key && map?.symbols?.[key];
+  if (sym) {
+    return (
+      <svg className={className} {...box} viewBox={sym.viewBox} role="img" aria-label={alt}>
+        <use href={`${asset(sym.file)}#${sym.id}`} />
+      </svg>
+    );
+  }
+
+  const sp = key && map?.sprites?.[key];
+  const atlas = sp && map?.atlases?.[sp.atlas];
+  if (atlas) {
+    const scale = size / Math.max(sp.w, sp.h);
+    return (
+      <span
+        className={cn("inline-flex items-center justify-center", className)}
+        style={box}
+        role="img"
+        aria-label={alt}
+      >
+        <span
+          style={{
+            width: sp.w * scale,
+            height: sp.h * scale,
+            backgroundImage: `url(${asset(atlas.file)})`,
+            backgroundRepeat: "no-repeat",
+            backgroundSize: `${atlas.width * scale}px ${atlas.height * scale}px`,
+            backgroundPosition: `${-sp.x * scale}px ${-sp.y * scale}px`,
+          }}
+        />
+      </span>
+    );
+  }
+
+  if (!src) return null;
+  return (
+    <img src={src} alt={alt} className={cn("object-contain", className)} {...box} loading="lazy" />
+  );
+}
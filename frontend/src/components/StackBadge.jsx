@@ -1,5 +1,6 @@
 // src/components/StackBadge.jsx
 import { resolveAsset } from "../lib/utils";
+import SpriteIcon from "./SpriteIcon";
 
 
 export default function StackBadge({ name, index }) {
@@ -15,7 +16,7 @@ const logo = (item?.logo_path ? resolveAsset(item.logo_path) : "") || (item?.log
 const content = (
 <span className="inline-flex items-center gap-1 rounded-full border border-white/10 bg-white/10 px-2.5 py-0.5 text-xs">
 {logo ? (
-<img src={logo} alt={label} className="h-4 w-4 object-contain" height="16" width="16" loading="lazy" />
+<SpriteIcon path={item?.logo_path} src={logo} alt={label} size={16} className="h-4 w-4" />
 ) : null}
 <span className="whitespace-nowrap">{label}</span>
 </span>
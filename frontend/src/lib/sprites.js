@@ -0,0 +1,33 @@
+// src/lib/sprites.js
+// content/sprites/sprites.json (editör üretir): stack logoları + sosyal ikonlar için
+// atlas koordinatları ve SVG <symbol> id'leri. Tek sefer yüklenir, tüm bileşenler paylaşır.
+import { useEffect, useState } from "react";
+import { asset } from "./utils";
+
+let pending = null; // Promise<map | null>
+
+export function loadSprites() {
+  if (!pending) {
+    pending = fetch(asset("content/sprites/sprites.json"), { cache: "no-cache" })
+      .then((res) => (res.ok ? res.json() : null))
+      .catch(() => null);
+  }
+  return pending;
+}
+
+// undefined: yükleniyor, null: sprite yok (tek tek <img> kullan)
+export function useSprites() {
+  const [map, setMap] = useState(undefined);
+  useEffect(() => {
+    let alive = true;
+    loadSprites().then((m) => alive && setMap(m));
+    return () => {
+      alive = false;
+    };
+  }, []);
+  return map;
+}
+
+// JSON'daki yol -> sprites.json anahtarı ("/content/x.png" -> "content/x.png")
+export const spriteKey = (p) =>
+  String(p || "").trim().replace(/\\/g, "/").replace(/^\/+/, "");
@@ -1,5 +1,6 @@
 import Section from "../components/Section";
 import Card from "../components/Card";
+import SpriteIcon from "../components/SpriteIcon";
 import { resolveAsset } from "../lib/utils";
 
 function toTitle(s) {
@@ -36,7 +37,7 @@ function normalizeSocials({ socialsProp, info }) {
         const url = s?.url || "";
         const label = s?.label || s?.platform || s?.name || guessPlatformFromUrl(url) || "Link";
         const icon = resolveAsset(s?.icon || "");
-        return url ? { url, label, icon } : null;
+        return url ? { url, label, icon, iconPath: s?.icon || "" } : null;
       })
       .filter(Boolean)
       .sort((a, b) => (a.order_index ?? 1e9) - (b.order_index ?? 1e9));
@@ -123,13 +124,7 @@ export default function ContactSection({ info, socials }) {
                     className="rounded-xl border border-white/10 px-3 py-1 text-sm hover:bg-white/10 inline-flex items-center gap-2"
                   >
                     {s.icon ? (
-                      <img
-                        src={s.icon}
-                        alt="icon"
-                        className="h-4 w-4 object-contain"
-                        height="16"
-                        width="16"
-                      />
+                      <SpriteIcon path={s.iconPath} src={s.icon} alt="icon" size={16} className="h-4 w-4" />
                     ) : null}
                     {s.label || s.url}
                   </a>
@@ -1,6 +1,7 @@
 // src/sections/StackSection.jsx
 import React from "react";
 import Section from "../components/Section";
+import SpriteIcon from "../components/SpriteIcon";
 import { resolveAsset } from "../lib/utils";
 
 const ORDER = [
@@ -30,14 +31,7 @@ function StackLogo({ item }) {
   const content = (
     <div className={wrapper} title={label}>
       {src ? (
-        <img
-          src={src}
-          alt={label}
-          className="h-9 w-9 object-contain"
-          height={36}
-          width={36}
-          loading="lazy"
-        />
+        <SpriteIcon path={item.logo_path} src={src} alt={label} size={36} className="h-9 w-9" />
       ) : (
         <div className="h-9 w-9 rounded-md bg-white/10 grid place-items-center text-xs">
           {label?.[0] || "?"}